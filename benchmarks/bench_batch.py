@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Simulateur par lots NumPy contre le moteur objet (Game)
+Compare les tours simulés par seconde et les statistiques obtenues.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from simulation.batch import BatchSimulator, get_tables
+from simulation.policies import GreedyPolicy
+from simulation.runner import run_simulations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=500, help="Parties jouées par le moteur objet")
+    parser.add_argument("--batch", type=int, default=20000, help="Parties par lot NumPy (K)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = run_simulations(args.games, GreedyPolicy(), workers=1, base_seed=args.seed)
+    elapsed = time.perf_counter() - start
+    turns = stats.stats["actions"].mean * stats.games
+    print(f"Game (objets)   {stats.games:>7} parties  {elapsed:7.2f} s  "
+          f"{turns / elapsed:12.0f} tours/s  victoires {stats.win_rate:.2%}  "
+          f"pièces {stats.stats['rooms_placed'].mean:.2f}")
+
+    get_tables()  # Construction des tables hors chronométrage
+    start = time.perf_counter()
+    batch = BatchSimulator(args.batch, seed=args.seed).run()
+    elapsed = time.perf_counter() - start
+    summary = batch.summary()
+    print(f"BatchSimulator  {summary['games']:>7} parties  {elapsed:7.2f} s  "
+          f"{summary['turns'] / elapsed:12.0f} tours/s  victoires {summary['win_rate']:.2%}  "
+          f"pièces {summary['rooms_placed']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
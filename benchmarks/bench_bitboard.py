@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Manoir à tableaux de bits (game1/bitboard.py) contre la grille de listes
+Requêtes sur un manoir de milieu de partie (politique gloutonne), puis
+parties complètes jouées avec chacun des deux manoirs.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from core.game_objects import Direction
+from game1.game import Game
+from simulation.policies import GreedyPolicy
+from simulation.runner import drive_game
+
+
+def timed(function, repeat: int) -> float:
+    """Durée moyenne d'un appel en microsecondes"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def queries(game: Game) -> list:
+    """(nom, appel) sur toutes les pièces placées"""
+    manor = game.manor
+    placed = [(row, col) for row in range(manor.height) for col in range(manor.width)
+              if manor.grid[row][col] is not None]
+    start = game.player.position
+
+    def each(query):
+        return lambda: [query(position) for position in placed]
+    return [
+        ("can_move_to x4", each(lambda p: [manor.can_move_to(p, d) for d in Direction])),
+        ("exits", each(manor.exits)),
+        ("free_neighbours", each(manor.free_neighbours)),
+        ("frontier", manor.frontier),
+        ("reachable_cells", lambda: manor.reachable_cells(start)),
+    ]
+
+
+def play(games: int, seed: int, bitboard: bool) -> float:
+    """Durée (s) de parties gloutonnes complètes"""
+    start = time.perf_counter()
+    for i in range(games):
+        drive_game(Game(headless=True, seed=seed + i, bitboard=bitboard), GreedyPolicy())
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--actions", type=int, default=60, help="Actions jouées au plus avant les requêtes")
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Partie la plus étendue parmi quelques graines
+    best = None
+    for seed in range(args.seed, args.seed + 20):
+        games = [Game(headless=True, seed=seed, bitboard=bitboard) for bitboard in (False, True)]
+        for game in games:
+            drive_game(game, GreedyPolicy(), max_actions=args.actions)
+        placed = len(games[1].manor.rooms)
+        if best is None or placed > best[0]:
+            best = (placed, games)
+    placed, (lists, bits) = best
+
+    print(f"{placed} pièces placées")
+    print(f"{'requête':<26} {'listes (µs)':>12} {'bits (µs)':>10} {'gain':>7}")
+    for (label, before), (_, after) in zip(queries(lists), queries(bits)):
+        assert before() == after()
+        before, after = timed(before, args.repeat), timed(after, args.repeat)
+        print(f"{label:<26} {before:12.1f} {after:10.1f} {before / after:6.1f}x")
+
+    before = play(args.games, args.seed, False)
+    after = play(args.games, args.seed, True)
+    print(f"{f'{args.games} parties gloutonnes':<26} {before:11.2f}s {after:9.2f}s {before / after:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
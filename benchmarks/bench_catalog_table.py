@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Table en colonnes du catalogue (rooms/table.py) sur des catalogues
+synthétiques de 10 000 et 1 000 000 pièces: filtres par masques NumPy contre
+les anciennes boucles sur les définitions (construction d'une clé de l'index
+des portes, arbres de tirage, poids de draw_rooms, pièces encore tirables).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from core.doors import FITTING
+from game1.rng import GameRandom
+from rooms.catalog import RoomCatalog, get_room_definitions
+from rooms.room_index import RoomSet
+from rooms.sampler import FenwickSampler
+
+
+def synthetic_definitions(size: int) -> list:
+    """Catalogue réel complété par des copies renommées jusqu'à size définitions"""
+    base = list(get_room_definitions())
+    models = [d for d in base if d.name not in RoomCatalog.UNDRAWABLE_ROOMS]
+    definitions = list(base)
+    i = 0
+    while len(definitions) < size:
+        model = models[i % len(models)]
+        definitions.append(model._replace(name=f"{model.name} #{i}"))
+        i += 1
+    return definitions
+
+
+def legacy_lookup(catalog: RoomCatalog, required: int, forbidden: int) -> RoomSet:
+    """Ancienne construction d'une clé de l'index: parcours de toutes les pièces"""
+    fitting = FITTING[required][forbidden]
+    members = RoomSet()
+    for room, shapes in catalog.unused_index._shapes.items():
+        if shapes & fitting:
+            members.add(room)
+    return members
+
+
+def legacy_samplers(catalog: RoomCatalog) -> dict:
+    """Ancienne construction des arbres de tirage: une case ajoutée par pièce"""
+    samplers = {}
+    for index, definition in enumerate(catalog.definitions):
+        if catalog.table.used[index]:
+            continue
+        sampler = samplers.get(definition.color)
+        if sampler is None:
+            sampler = samplers[definition.color] = FenwickSampler()
+        sampler.append(definition.get_probability_weight())
+    return samplers
+
+
+def legacy_draw_weights(catalog: RoomCatalog, position: tuple) -> list:
+    """Ancien calcul des poids de draw_rooms: compréhension de liste sur les définitions"""
+    row, col = position
+    multipliers = catalog.color_multipliers
+    return [(i, definition.get_probability_weight() * multipliers.get(definition.color, 1.0))
+            for i, definition in enumerate(catalog.definitions)
+            if not catalog.table.used[i] and definition.can_be_placed(row, col, 9, 5)]
+
+
+def legacy_unused(catalog: RoomCatalog) -> list:
+    """Ancien parcours des pièces encore tirables"""
+    return [(i, d) for i, d in enumerate(catalog.definitions)
+            if not catalog.table.used[i] and d.name not in catalog.UNDRAWABLE_ROOMS]
+
+
+def timed(function, repeat: int = 1) -> float:
+    """Durée moyenne d'un appel en millisecondes"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'pièces':>9} {'opération':<28} {'boucles (ms)':>13} {'table (ms)':>11} {'gain':>7}")
+    for size in args.sizes:
+        definitions = synthetic_definitions(size)
+        start = time.perf_counter()
+        catalog = RoomCatalog(rng=GameRandom(args.seed), definitions=definitions)
+        print(f"{size:>9} {'construction du catalogue':<28} {'':>13} {(time.perf_counter() - start) * 1e3:11.1f}")
+
+        # Une pièce sur dix déjà placée
+        for index in range(0, size, 10):
+            catalog._deactivate(index)
+            catalog.unused_index.discard(index)
+
+        builder = catalog.unused_index._builder
+        rows = [
+            ("clé de l'index (N, interdit E)", lambda: legacy_lookup(catalog, 1, 2),
+             lambda: RoomSet(builder(1, 2))),
+            ("arbres de tirage", lambda: legacy_samplers(catalog),
+             lambda: (setattr(catalog, "_samplers", None), catalog._ensure_samplers())),
+            ("poids de draw_rooms", lambda: legacy_draw_weights(catalog, (4, 2)),
+             lambda: catalog.draw_weights((4, 2))),
+            ("pièces tirables", lambda: legacy_unused(catalog),
+             lambda: list(catalog.unused_definitions())),
+        ]
+        for label, legacy, table in rows:
+            before = timed(legacy)
+            after = timed(table)
+            print(f"{size:>9} {label:<28} {before:13.1f} {after:11.1f} {before / after:6.1f}x")
+
+        # Tirages en régime établi (clé déjà construite, arbres déjà construits)
+        catalog.find_unused(4, 8)
+        sample = timed(lambda: catalog.sample_unused(4, 8), 1000)
+        draw = timed(lambda: catalog.draw_rooms(3, (4, 2)), 1000)
+        print(f"{size:>9} {'sample_unused / draw_rooms':<28} {'':>13} {sample:6.3f} / {draw:.3f}")
+
+
+if __name__ == "__main__":
+    main()
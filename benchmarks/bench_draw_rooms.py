@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark - RoomCatalog.draw_rooms: arbre de Fenwick contre l'ancienne version
+(random.choices en boucle + index/pop + renormalisation) pour des catalogues
+de 60, 1 000 et 100 000 pièces.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from core.game_objects import RoomColor
+from game1.rng import GameRandom
+from rooms.catalog import RoomCatalog
+from rooms.room import Room
+
+
+def legacy_draw_rooms(catalog: RoomCatalog, count: int, position: tuple, context: dict = None):
+    """Ancienne implémentation de draw_rooms (référence, O(n·k))"""
+    if context is None:
+        context = {}
+    row, col = position
+    eligible_rooms = [room for room in catalog.available_rooms if room.can_be_placed(row, col, 9, 5)]
+    if not eligible_rooms:
+        return []
+    weights = []
+    for room in eligible_rooms:
+        weight = room.get_probability_weight()
+        if hasattr(context, 'probability_modifiers') and room.color in context.probability_modifiers:
+            weight *= context.probability_modifiers[room.color]
+        weights.append(weight)
+    total_weight = sum(weights)
+    probabilities = [w / total_weight for w in weights]
+
+    drawn = []
+    available_for_draw = eligible_rooms.copy()
+    available_probs = probabilities.copy()
+    for _ in range(min(count, len(available_for_draw))):
+        room = catalog.rng.rooms.choices(available_for_draw, weights=available_probs)[0]
+        drawn.append(room)
+        idx = available_for_draw.index(room)
+        available_for_draw.pop(idx)
+        available_probs.pop(idx)
+        if available_probs:
+            total = sum(available_probs)
+            available_probs = [p / total for p in available_probs]
+
+    if drawn and all(room.gem_cost > 0 for room in drawn):
+        free_rooms = [r for r in eligible_rooms if r.gem_cost == 0]
+        if free_rooms:
+            drawn[-1] = catalog.rng.rooms.choice(free_rooms)
+    return drawn
+
+
+def build_catalog(size: int, seed: int) -> RoomCatalog:
+    """Catalogue réel complété par des copies synthétiques jusqu'à size pièces"""
+    catalog = RoomCatalog(rng=GameRandom(seed))
+    base = list(catalog.available_rooms)
+    i = 0
+    while len(catalog.available_rooms) < size:
+        model = base[i % len(base)]
+        catalog.add_room(Room(name=f"{model.name} #{i}", color=model.color,
+                              doors=model.doors_directions, gem_cost=model.gem_cost, rarity=model.rarity))
+        i += 1
+    return catalog
+
+
+def timed(function, repeat: int) -> float:
+    """Durée moyenne d'un appel en microsecondes"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[60, 1000, 100000])
+    parser.add_argument("--count", type=int, default=3, help="Pièces tirées par appel")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'pièces':>8} {'ancien (µs)':>12} {'Fenwick (µs)':>13} {'gain':>7} {'multiplicateur (µs)':>20}")
+    for size in args.sizes:
+        catalog = build_catalog(size, args.seed)
+        repeat = max(5, min(2000, 2_000_000 // size))
+        legacy = timed(lambda: legacy_draw_rooms(catalog, args.count, (4, 2)), repeat)
+        fenwick = timed(lambda: catalog.draw_rooms(args.count, (4, 2)), 2000)
+        # Mise à jour des poids d'une couleur (ProbabilityModifierEffect)
+        toggle = [1.0]
+
+        def switch_multiplier():
+            toggle[0] = 3.0 if toggle[0] == 1.0 else 1.0
+            catalog.set_color_multiplier(RoomColor.GREEN, toggle[0])
+
+        update = timed(switch_multiplier, 20)
+        print(f"{size:>8} {legacy:12.1f} {fenwick:13.1f} {legacy / fenwick:6.1f}x {update:20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Parties par seconde avec et sans affichage console
+Un bot aléatoire joue des parties complètes avec chaque puits d'événements.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import contextlib
+import time
+
+from game1.game import Game, GameState
+from game1.events import ConsoleSink, RecordingSink
+from simulation.policies import RandomPolicy
+from simulation.runner import drive_game
+
+
+def run(label: str, make_game, games: int, seed: int) -> float:
+    """Joue `games` parties et retourne le nombre de parties par seconde"""
+    policy = RandomPolicy()
+    start = time.perf_counter()
+    wins = 0
+    for i in range(games):
+        game = make_game(seed + i)
+        drive_game(game, policy)
+        wins += game.state == GameState.GAME_WON
+    elapsed = time.perf_counter() - start
+    rate = games / elapsed
+    print(f"{label:<28} {games:>6} parties  {elapsed:8.3f} s  {rate:10.1f} parties/s  ({wins} victoires)",
+          file=sys.__stdout__)
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=300, help="Nombre de parties par configuration")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--terminal", action="store_true",
+                        help="Écrire la sortie console sur le terminal au lieu de /dev/null")
+    args = parser.parse_args()
+
+    with open(os.devnull, "w") as devnull:
+        target = sys.stdout if args.terminal else devnull
+        with contextlib.redirect_stdout(target):
+            console = run("ConsoleSink (print)", lambda s: Game(event_sink=ConsoleSink(), seed=s), args.games, args.seed)
+        recording = run("RecordingSink", lambda s: Game(event_sink=RecordingSink(), seed=s), args.games, args.seed)
+        headless = run("NullSink (headless=True)", lambda s: Game(headless=True, seed=s), args.games, args.seed)
+
+    print(f"\nAccélération headless vs console: x{headless / console:.1f}")
+    print(f"Accélération headless vs enregistrement: x{headless / recording:.1f}")
+
+
+if __name__ == "__main__":
+    main()
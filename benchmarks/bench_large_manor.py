@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Manoirs de grande taille (Game(size=...), manoir creux)
+Un chemin de pièces est posé depuis l'entrée, puis on mesure les opérations
+qui parcouraient toute la grille: création de la partie, distance jusqu'à
+l'Antechamber (A*), sauvegarde/restauration, cases libres, hachage complet.
+Grille de listes (sparse=False) contre dictionnaire (sparse=True).
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from core.doors import DOOR_NORTH, DOOR_SOUTH
+from game1.game import Game
+
+
+def timed(function, repeat: int) -> float:
+    """Durée moyenne d'un appel en microsecondes"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def lay_path(game: Game, rooms: int) -> int:
+    """Pose au plus rooms pièces du catalogue (portes nord et sud) vers le nord depuis l'entrée"""
+    manor, catalog = game.manor, game.catalog
+    row, col = game.start
+    placed = 0
+    while placed < rooms and row > 1:
+        row -= 1
+        candidates = catalog.sample_unused(DOOR_NORTH | DOOR_SOUTH, count=1)
+        if not candidates:
+            break
+        catalog.mark_used(candidates[0])
+        manor.place_room(candidates[0], row, col)
+        placed += 1
+    return placed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[9, 100, 1000],
+                        help="Côté du manoir (5 colonnes pour 9)")
+    parser.add_argument("--rooms", type=int, default=10, help="Pièces posées avant les mesures")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    Game(headless=True, seed=args.seed)  # Définitions chargées une fois par processus
+    print(f"{'manoir':>11} {'stockage':>9} {'création (ms)':>14} {'distance (µs)':>14} "
+          f"{'snapshot+restore (µs)':>22} {'frontier (µs)':>14} {'zobrist (µs)':>13}")
+    for side in args.sizes:
+        size = (9, 5) if side == 9 else (side, side)
+        for sparse in (False, True):
+            if not sparse and size[0] * size[1] > 1_000_000:
+                continue  # Grille de listes trop coûteuse à allouer
+            start = time.perf_counter()
+            game = Game(headless=True, seed=args.seed, size=size, sparse=sparse)
+            created = (time.perf_counter() - start) * 1e3
+            lay_path(game, args.rooms)
+            manor = game.manor
+
+            def distance():
+                game.reachability._distances.clear()
+                return game.goal_distance()
+
+            def save_restore():
+                game.restore(game.snapshot())
+
+            row = [timed(distance, args.repeat), timed(save_restore, args.repeat),
+                   timed(manor.frontier, args.repeat), timed(manor.recompute_zobrist, args.repeat)]
+            label = f"{size[0]}x{size[1]}"
+            storage = "dict" if manor.sparse else "listes"
+            print(f"{label:>11} {storage:>9} {created:14.1f} {row[0]:14.1f} {row[1]:22.1f} {row[2]:14.1f} {row[3]:13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Mémoire occupée par une partie vivante (octets par Game)
+Mesure avec tracemalloc N parties gardées en mémoire dans trois états:
+  started: partie venant d'être créée
+  played:  partie jouée jusqu'au bout par la politique gloutonne
+  full:    manoir 9x5 entièrement rempli de pièces instanciées
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import gc
+import tracemalloc
+
+from game1.game import Game
+from simulation.policies import GreedyPolicy
+from simulation.runner import drive_game
+
+
+def fill_manor(game: Game) -> None:
+    """Place une pièce du catalogue dans chaque case vide"""
+    manor = game.manor
+    for row in range(manor.height):
+        for col in range(manor.width):
+            if manor.get_room(row, col) is None:
+                rooms = game.catalog.sample_unused(count=1)
+                if not rooms:
+                    return
+                game.catalog.mark_used(rooms[0])
+                manor.place_room(rooms[0], row, col)
+
+
+def build(state: str, seed: int) -> Game:
+    game = Game(headless=True, seed=seed)
+    if state == "played":
+        drive_game(game, GreedyPolicy())
+    elif state == "full":
+        fill_manor(game)
+    return game
+
+
+def measure(state: str, count: int) -> float:
+    """Octets alloués par partie vivante"""
+    build(state, -1)  # Définitions du catalogue et imports hors mesure
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    games = [build(state, seed) for seed in range(count)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del games
+    return (after - before) / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=2000, help="Parties gardées en mémoire")
+    args = parser.parse_args()
+
+    for state in ("started", "played", "full"):
+        per_game = measure(state, args.games)
+        print(f"{state:<8} {per_game:10.0f} octets/partie  "
+              f"({per_game * 10000 / 2**20:7.1f} Mo pour 10 000 parties)")
+
+
+if __name__ == "__main__":
+    main()
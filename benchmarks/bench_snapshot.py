@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark - Game.snapshot / Game.restore contre copy.deepcopy
+Parties jouées par la politique gloutonne jusqu'à différents nombres
+d'actions, puis sauvegardées et restaurées en boucle.
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import copy
+import time
+
+from game1.game import Game
+from simulation.policies import GreedyPolicy
+from simulation.runner import drive_game
+
+
+def timed(function, repeat: int) -> float:
+    """Durée moyenne d'un appel en microsecondes"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--actions", type=int, nargs="+", default=[0, 20, 60],
+                        help="Actions jouées avant la sauvegarde")
+    parser.add_argument("--repeat", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'actions':>8} {'pièces':>7} {'snapshot (µs)':>14} {'restore (µs)':>13} {'deepcopy (µs)':>14}")
+    for actions in args.actions:
+        game = Game(headless=True, seed=args.seed)
+        if actions:
+            drive_game(game, GreedyPolicy(), max_actions=actions)
+        placed = len(game.manor.rooms)
+        snapshot = game.snapshot()
+        save = timed(game.snapshot, args.repeat)
+        load = timed(lambda: game.restore(snapshot), args.repeat)
+        deep = timed(lambda: copy.deepcopy(game), max(10, args.repeat // 100))
+        print(f"{actions:>8} {placed:>7} {save:14.1f} {load:13.1f} {deep:14.1f}")
+
+
+if __name__ == "__main__":
+    main()
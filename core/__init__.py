@@ -4,19 +4,57 @@ Package core - Classes de base du jeu
 from .game_objects import (
     Direction,
     RoomColor,
+    ItemKind,
     GameObject,
     ConsumableItem,
     PermanentItem,
     Food,
     InteractiveObject
 )
+from .item_rules import (
+    ItemRule,
+    ITEM_RULES,
+    LOOT_RULES,
+    apply_item,
+    collect_item,
+    loot_item
+)
+from .doors import (
+    DOOR_NORTH,
+    DOOR_EAST,
+    DOOR_SOUTH,
+    DOOR_WEST,
+    ALL_DOORS,
+    DIRECTION_BITS,
+    ROTATION_TABLE,
+    directions_to_mask,
+    mask_to_directions,
+    rotate_mask
+)
 
 __all__ = [
     'Direction',
     'RoomColor',
+    'ItemKind',
     'GameObject',
     'ConsumableItem',
     'PermanentItem',
     'Food',
-    'InteractiveObject'
+    'InteractiveObject',
+    'ItemRule',
+    'ITEM_RULES',
+    'LOOT_RULES',
+    'apply_item',
+    'collect_item',
+    'loot_item',
+    'DOOR_NORTH',
+    'DOOR_EAST',
+    'DOOR_SOUTH',
+    'DOOR_WEST',
+    'ALL_DOORS',
+    'DIRECTION_BITS',
+    'ROTATION_TABLE',
+    'directions_to_mask',
+    'mask_to_directions',
+    'rotate_mask'
 ]
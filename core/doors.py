@@ -0,0 +1,124 @@
+"""
+Masques de portes sur 4 bits et tables de rotation précalculées
+Bits dans le sens horaire (Nord, Est, Sud, Ouest): tourner une pièce de 90°
+revient à décaler le masque d'un bit, d'où une table 16 x 4.
+"""
+from typing import Iterable, Tuple
+
+from core.game_objects import Direction
+
+DOOR_NORTH = 1
+DOOR_EAST = 2
+DOOR_SOUTH = 4
+DOOR_WEST = 8
+ALL_DOORS = 0xF
+
+# Ordre horaire utilisé par les rotations
+CLOCKWISE = (Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST)
+
+DIRECTION_BITS = {
+    Direction.NORTH: DOOR_NORTH,
+    Direction.EAST: DOOR_EAST,
+    Direction.SOUTH: DOOR_SOUTH,
+    Direction.WEST: DOOR_WEST,
+}
+
+OPPOSITE_BITS = {
+    DOOR_NORTH: DOOR_SOUTH,
+    DOOR_EAST: DOOR_WEST,
+    DOOR_SOUTH: DOOR_NORTH,
+    DOOR_WEST: DOOR_EAST,
+}
+
+# Bits dans l'ordre horaire et déplacement (ligne, colonne) vers la case voisine
+DOOR_BITS = (DOOR_NORTH, DOOR_EAST, DOOR_SOUTH, DOOR_WEST)
+DOOR_DELTAS = {
+    DOOR_NORTH: (-1, 0),
+    DOOR_EAST: (0, 1),
+    DOOR_SOUTH: (1, 0),
+    DOOR_WEST: (0, -1),
+}
+
+# ROTATION_TABLE[masque][quarts de tour horaires] -> masque tourné
+ROTATION_TABLE: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(((mask << quarter) | (mask >> (4 - quarter))) & ALL_DOORS for quarter in range(4))
+    for mask in range(16)
+)
+
+# Ensembles de masques sur 16 bits (bit m = masque m possible)
+# ROTATION_SHAPES[masque] -> masques obtenus en tournant la pièce
+ROTATION_SHAPES: Tuple[int, ...] = tuple(
+    sum(1 << rotated for rotated in set(ROTATION_TABLE[mask])) for mask in range(16)
+)
+
+# FITTING[porte requise][portes interdites] -> masques ayant la porte requise et aucune porte interdite
+FITTING: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(sum(1 << mask for mask in range(16) if mask & required == required and not mask & forbidden)
+          for forbidden in range(16))
+    for required in range(16)
+)
+
+# MASK_DIRECTIONS[masque] -> directions correspondantes (ordre horaire)
+MASK_DIRECTIONS: Tuple[Tuple[Direction, ...], ...] = tuple(
+    tuple(d for d in CLOCKWISE if mask & DIRECTION_BITS[d]) for mask in range(16)
+)
+
+# DOOR_COUNT[masque] -> nombre de portes
+DOOR_COUNT: Tuple[int, ...] = tuple(bin(mask).count("1") for mask in range(16))
+
+
+def directions_to_mask(directions: Iterable[Direction]) -> int:
+    """Convertit une liste de directions en masque 4 bits"""
+    mask = 0
+    for direction in directions:
+        mask |= DIRECTION_BITS[direction]
+    return mask
+
+
+def mask_to_directions(mask: int) -> Tuple[Direction, ...]:
+    """Convertit un masque 4 bits en directions (ordre horaire)"""
+    return MASK_DIRECTIONS[mask]
+
+
+def rotate_mask(mask: int, degrees: int) -> int:
+    """Tourne un masque dans le sens horaire (multiple de 90°)"""
+    if degrees % 90 != 0:
+        raise ValueError("degrees must be a multiple of 90")
+    return ROTATION_TABLE[mask][(degrees // 90) % 4]
+
+
+def fitting_rotation(mask: int, preferred: int, required: int, forbidden: int, rotatable: bool = True,
+                     avoid: int = 0) -> int:
+    """
+    Quarts de tour à appliquer au masque de base pour avoir la porte requise et
+    aucune porte interdite, avec le moins de portes possible dans avoid (portes
+    contre le mur d'une pièce voisine): parmi les meilleures, la rotation
+    préférée ou la suivante dans le sens horaire (rotation préférée si aucune
+    ne convient)
+    """
+    best, best_blocked = preferred, None
+    if rotatable:
+        for step in range(4):
+            quarter = (preferred + step) % 4
+            rotated = ROTATION_TABLE[mask][quarter]
+            if rotated & required == required and not rotated & forbidden:
+                blocked = DOOR_COUNT[rotated & avoid]
+                if best_blocked is None or blocked < best_blocked:
+                    best, best_blocked = quarter, blocked
+                    if not blocked:
+                        break
+    return best
+
+
+def border_mask(row: int, col: int, height: int, width: int) -> int:
+    """Portes qui donneraient hors du manoir depuis la case (row, col)"""
+    mask = 0
+    if row == 0:
+        mask |= DOOR_NORTH
+    if row == height - 1:
+        mask |= DOOR_SOUTH
+    if col == 0:
+        mask |= DOOR_WEST
+    if col == width - 1:
+        mask |= DOOR_EAST
+    return mask
@@ -14,15 +14,21 @@ class Direction(Enum):
     EAST = "east"
     WEST = "west"
 
+    # Membres uniques: hachage par identité, sans passer par Enum.__hash__ (Python) à chaque clé de dict
+    __hash__ = object.__hash__
+
     def opposite(self) -> 'Direction':
         """Retourne la direction opposée"""
-        opposites = {
-            Direction.NORTH: Direction.SOUTH,
-            Direction.SOUTH: Direction.NORTH,
-            Direction.EAST: Direction.WEST,
-            Direction.WEST: Direction.EAST
-        }
-        return opposites[self]
+        return _OPPOSITES[self]
+
+
+# Table construite une fois (Direction.opposite)
+_OPPOSITES = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST
+}
 
 
 class RoomColor(Enum):
@@ -34,13 +40,66 @@ class RoomColor(Enum):
     RED = "red"  # Pièces indésirables
     BLUE = "blue"  # Pièces communes
 
+    __hash__ = object.__hash__
+
+
+class ItemKind(Enum):
+    """Identifiant stable de chaque type d'objet (indépendant de la langue du nom)"""
+    STEPS = 0
+    GOLD = 1
+    GEMS = 2
+    KEYS = 3
+    DICE = 4
+    APPLE = 5
+    BANANA = 6
+    CAKE = 7
+    SANDWICH = 8
+    MEAL = 9
+    SHOVEL = 10
+    HAMMER = 11
+    LOCKPICK_KIT = 12
+    METAL_DETECTOR = 13
+    RABBIT_FOOT = 14
+    CHEST = 15
+    DIG_SPOT = 16
+    LOCKER = 17
+    LOCKED_CHEST = 18
+
+    __hash__ = object.__hash__
+
+
+# Attributs déclarés (__slots__) de chaque classe d'objet, le long de sa hiérarchie
+_SLOT_NAMES: dict = {}
+
+
+def _slot_names(cls: type) -> tuple:
+    """Noms des __slots__ de cls et de ses parents (calculés une fois par classe)"""
+    names = _SLOT_NAMES.get(cls)
+    if names is None:
+        names = _SLOT_NAMES[cls] = tuple(slot for klass in reversed(cls.__mro__)
+                                         for slot in klass.__dict__.get('__slots__', ())
+                                         if slot not in ('__dict__', '__weakref__'))
+    return names
+
 
 class GameObject(ABC):
     """Classe abstraite pour tous les objets du jeu"""
 
+    __slots__ = ("name",)
+    kind: Optional[ItemKind] = None  # Attribut de classe, défini par chaque objet concret
+
     def __init__(self, name: str):
         self.name = name
 
+    def clone(self) -> 'GameObject':
+        """Copie indépendante de l'objet (instanciation d'une pièce), sans passer par copy.deepcopy"""
+        twin = object.__new__(type(self))
+        for slot in _slot_names(type(self)):
+            setattr(twin, slot, getattr(self, slot))
+        if hasattr(self, '__dict__'):
+            twin.__dict__.update(self.__dict__)
+        return twin
+
     @abstractmethod
     def interact(self, player: 'Player') -> bool:
         """Interaction avec l'objet. Retourne True si l'interaction réussit"""
@@ -53,6 +112,8 @@ class GameObject(ABC):
 class ConsumableItem(GameObject):
     """Classe parent pour les objets consommables"""
 
+    __slots__ = ("quantity",)
+
     def __init__(self, name: str, quantity: int = 1):
         super().__init__(name)
         self.quantity = quantity
@@ -72,6 +133,8 @@ class ConsumableItem(GameObject):
 class PermanentItem(GameObject):
     """Classe parent pour les objets permanents"""
 
+    __slots__ = ("description", "is_active")
+
     def __init__(self, name: str, description: str = ""):
         super().__init__(name)
         self.description = description
@@ -90,6 +153,8 @@ class PermanentItem(GameObject):
 class Food(GameObject):
     """Classe parent pour la nourriture"""
 
+    __slots__ = ("steps_restored",)
+
     def __init__(self, name: str, steps_restored: int):
         super().__init__(name)
         self.steps_restored = steps_restored
@@ -97,18 +162,26 @@ class Food(GameObject):
     def interact(self, player: 'Player') -> bool:
         """Mange la nourriture et restaure des pas"""
         player.inventory.steps.quantity += self.steps_restored
-        print(f"Vous avez mangé {self.name} et récupéré {self.steps_restored} pas!")
+        player.events.emit("food_eaten", "Vous avez mangé {item.name} et récupéré {item.steps_restored} pas!", item=self)
         return True
 
 
 class InteractiveObject(GameObject):
     """Classe parent pour les objets interactifs (coffres, trous, casiers)"""
 
+    __slots__ = ("contents", "is_opened")
+
     def __init__(self, name: str, contents: List[GameObject]):
         super().__init__(name)
         self.contents = contents
         self.is_opened = False
 
+    def clone(self) -> 'InteractiveObject':
+        """Copie indépendante, contenu compris"""
+        twin = super().clone()
+        twin.contents = [item.clone() for item in self.contents]
+        return twin
+
     def interact(self, player: 'Player') -> bool:
         """Interagit avec l'objet (essaye de l'ouvrir)"""
         return self.open(player)
@@ -121,18 +194,19 @@ class InteractiveObject(GameObject):
     def open(self, player: 'Player') -> bool:
         """Ouvre l'objet et donne son contenu au joueur"""
         if self.is_opened:
-            print(f"{self.name} est déjà ouvert.")
+            player.events.emit("already_opened", "{item.name} est déjà ouvert.", item=self)
             return False
 
         if not self.can_open(player):
-            print(f"Vous ne pouvez pas ouvrir {self.name}.")
+            player.events.emit("cannot_open", "Vous ne pouvez pas ouvrir {item.name}.", item=self)
             return False
 
         self.is_opened = True
-        print(f"Vous avez ouvert {self.name}!")
+        player.events.emit("container_opened", "Vous avez ouvert {item.name}!", item=self)
 
-        for item in self.contents:
-            item.interact(player)
+        # Butin: table LOOT_RULES (sans outil, nourriture mangée); ce qui n'est pas pris reste dans le contenant
+        from core.item_rules import loot_item
+        self.contents = [item for item in self.contents if not loot_item(player, item)]
 
         return True
 
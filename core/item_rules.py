@@ -0,0 +1,131 @@
+"""
+Table des règles d'objets, indexée par ItemKind
+Ramassage (Game), achat (magasins) et simulateurs passent tous par cette
+table: un seul accès dictionnaire par objet, sans comparer les noms (français
+ou anglais). Le butin d'un contenant ouvert (InteractiveObject.open) a sa
+propre table, LOOT_RULES: aucun outil requis et toute nourriture rend ses pas.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Dict, NamedTuple, Optional, TYPE_CHECKING
+
+from core.game_objects import ItemKind, GameObject
+
+if TYPE_CHECKING:
+    from game1.player import Player
+
+# Compteurs de l'inventaire (positions dans Inventory.counts, colonnes du simulateur par lots)
+STEPS, GOLD, GEMS, KEYS, DICE = range(5)
+RESOURCE_NAMES = ("steps", "gold", "gems", "keys", "dice")
+
+# Actions possibles
+RESOURCE = "resource"    # Crédite un compteur de l'inventaire de obj.quantity
+FOOD = "food"            # Rend obj.steps_restored pas (gâteau)
+PERMANENT = "permanent"  # Ajoute un objet permanent (une seule fois)
+CONTAINER = "container"  # S'ouvre, ne se ramasse pas
+
+
+class ItemRule(NamedTuple):
+    """Ce que fait un type d'objet quand le joueur le prend"""
+    action: str
+    resource: Optional[int] = None         # Compteur de l'inventaire crédité (action RESOURCE)
+    requires: Optional[ItemKind] = None    # Objet permanent nécessaire pour le ramasser
+    message: str = "✅ {item.name} ramassé!"
+    missing_event: str = "tool_required"
+    missing_message: str = ""
+
+
+ITEM_RULES: Dict[ItemKind, ItemRule] = {
+    ItemKind.STEPS: ItemRule(RESOURCE, STEPS, message="👣 {item.quantity} pas récupérés (Total: {total})"),
+    # Tout l'or nécessite la pelle (Shovel)
+    ItemKind.GOLD: ItemRule(RESOURCE, GOLD, requires=ItemKind.SHOVEL,
+                            message="💰 Gold ramassé! +{item.quantity} pièces d'or (Total: {total})",
+                            missing_event="shovel_required",
+                            missing_message="❗ Vous devez d'abord trouver la pelle (Shovel). "
+                                            "Revenez ensuite pour récupérer l'or."),
+    ItemKind.GEMS: ItemRule(RESOURCE, GEMS, message="💎 Gem ramassée! (Total: {total})"),
+    ItemKind.KEYS: ItemRule(RESOURCE, KEYS, message="🔑 Key ramassée! (Total: {total})"),
+    ItemKind.DICE: ItemRule(RESOURCE, DICE, message="🎲 Dice ramassé! (Total: {total})"),
+    # Seul le gâteau rend des pas au ramassage; les autres aliments sont
+    # ramassés sans effet (règle neutre)
+    ItemKind.CAKE: ItemRule(FOOD, message="🍰 Cake ramassé! +{item.steps_restored} pas (Total: {total})"),
+    ItemKind.SHOVEL: ItemRule(PERMANENT, message="🛠️  Vous avez trouvé la pelle! ({item.name})"),
+    ItemKind.HAMMER: ItemRule(PERMANENT, message="🔨 Vous avez trouvé le marteau! ({item.name})"),
+    ItemKind.LOCKPICK_KIT: ItemRule(PERMANENT, message="🛠️  Vous avez trouvé: {item.name}"),
+    ItemKind.METAL_DETECTOR: ItemRule(PERMANENT, message="🛠️  Vous avez trouvé: {item.name}"),
+    ItemKind.RABBIT_FOOT: ItemRule(PERMANENT, message="🛠️  Vous avez trouvé: {item.name}"),
+    ItemKind.CHEST: ItemRule(CONTAINER),
+    ItemKind.DIG_SPOT: ItemRule(CONTAINER),
+    ItemKind.LOCKER: ItemRule(CONTAINER),
+    ItemKind.LOCKED_CHEST: ItemRule(CONTAINER),
+}
+
+# Butin d'un contenant ouvert: tout est pris sans outil (or compris), chaque aliment est mangé
+LOOT_RULES: Dict[ItemKind, ItemRule] = {
+    **{kind: rule._replace(requires=None) for kind, rule in ITEM_RULES.items()},
+    ItemKind.APPLE: ItemRule(FOOD, message="🍎 {item.name} mangée! +{item.steps_restored} pas (Total: {total})"),
+    ItemKind.BANANA: ItemRule(FOOD, message="🍌 {item.name} mangée! +{item.steps_restored} pas (Total: {total})"),
+    ItemKind.SANDWICH: ItemRule(FOOD, message="🥪 {item.name} mangé! +{item.steps_restored} pas (Total: {total})"),
+    ItemKind.MEAL: ItemRule(FOOD, message="🍽️  {item.name} mangé! +{item.steps_restored} pas (Total: {total})"),
+}
+
+_DEFAULT_RULE = ItemRule(None)
+
+
+def rule_for(obj: GameObject, rules: Dict[ItemKind, ItemRule] = ITEM_RULES) -> ItemRule:
+    """Règle d'un objet (règle neutre pour un objet sans type connu)"""
+    return rules.get(obj.kind, _DEFAULT_RULE)
+
+
+def apply_item(player: 'Player', obj: GameObject, rules: Dict[ItemKind, ItemRule] = ITEM_RULES) -> bool:
+    """
+    Donne l'objet au joueur, sans condition ni message (achats, inventaire)
+    Retourne False si l'objet n'a rien apporté (permanent déjà possédé, contenant)
+    """
+    rule = rule_for(obj, rules)
+    inventory = player.inventory
+    if rule.action == RESOURCE:
+        inventory.counts[rule.resource] += obj.quantity
+    elif rule.action == FOOD:
+        inventory.counts[STEPS] += obj.steps_restored
+    elif rule.action == PERMANENT:
+        return inventory.add_permanent_item(obj)
+    elif rule.action == CONTAINER:
+        return False
+    return True
+
+
+def collect_item(player: 'Player', obj: GameObject, rules: Dict[ItemKind, ItemRule] = ITEM_RULES) -> bool:
+    """
+    Ramassage d'un objet trouvé dans une pièce (rules: ITEM_RULES) ou un contenant (LOOT_RULES)
+    Retourne False si l'objet doit rester en place (outil requis manquant)
+    """
+    rule = rule_for(obj, rules)
+    events = player.events
+    if rule.requires is not None and not player.inventory.has_permanent_kind(rule.requires):
+        events.emit(rule.missing_event, rule.missing_message, item=obj)
+        return False
+
+    if rule.action == CONTAINER:
+        return False
+
+    if not apply_item(player, obj, rules):
+        events.emit("already_owned", "ℹ️  Vous possédez déjà l'objet permanent: {item.name}", item=obj)
+        return True
+
+    if not events.enabled:
+        return True
+    if rule.action == RESOURCE:
+        events.emit("pickup", rule.message, item=obj, total=player.inventory.counts[rule.resource])
+    elif rule.action == FOOD:
+        events.emit("pickup", rule.message, item=obj, total=player.inventory.counts[STEPS])
+    else:
+        events.emit("pickup", rule.message, item=obj)
+    return True
+
+
+def loot_item(player: 'Player', obj: GameObject) -> bool:
+    """Prise d'un objet du butin d'un contenant ouvert (table LOOT_RULES)"""
+    return collect_item(player, obj, LOOT_RULES)
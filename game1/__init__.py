@@ -4,6 +4,14 @@ Package game - Contient la logique principale du jeu
 from .inventory import Inventory
 from .player import Player
 from .manor import Manor
-from .game import Game, GameState
+from .bitboard import BitboardManor
+from .game import Game, GameState, GameSnapshot
+from .events import GameEvent, EventSink, ConsoleSink, NullSink, RecordingSink
+from .rng import GameRandom
+from .pathfinding import Route
 
-__all__ = ['Inventory', 'Player', 'Manor', 'Game', 'GameState']
+__all__ = [
+    'Inventory', 'Player', 'Manor', 'BitboardManor', 'Game', 'GameState', 'GameSnapshot',
+    'GameEvent', 'EventSink', 'ConsoleSink', 'NullSink', 'RecordingSink',
+    'GameRandom', 'Route'
+]
@@ -0,0 +1,170 @@
+"""
+Classe BitboardManor - Manoir dont l'occupation et les portes sont des entiers
+Une case = un bit (indice ligne * largeur + colonne, 45 bits pour 9 x 5).
+Chaque opération coûte en proportion de la surface (entiers de largeur x hauteur bits):
+réservé aux manoirs de moins de SPARSE_CELLS cases (ValueError au-delà).
+Tableaux de bits tenus à jour à chaque placement ou changement de case
+(refresh_cell): cases occupées, puis par direction (ordre horaire de
+core.doors: Nord, Est, Sud, Ouest) portes présentes, ouvertes et verrouillées.
+Voisins d'un ensemble de cases: un décalage (Nord >> largeur, Sud << largeur,
+Est << 1, Ouest >> 1) suivi d'un masque des bords. Les requêtes du moteur
+(can_move_to, exits, cases libres, accessibilité) deviennent quelques
+opérations sur des entiers; l'accessibilité est une propagation de toutes
+les cases à la fois jusqu'à point fixe. get_adjacent_position reste le
+calcul sur (ligne, colonne) de Manor, moins coûteux qu'un aller-retour par les bits.
+Les pièces restent indexées par Manor (rooms, grid): même interface que Manor.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Iterator, List, Optional, Tuple
+
+from core.game_objects import Direction
+from core.doors import CLOCKWISE, DOOR_BITS
+from game1.events import EventSink
+from game1.manor import Manor, SPARSE_CELLS
+
+# Direction -> indice des tableaux par direction (ordre horaire); l'opposé de k est k ^ 2
+DIRECTION_INDEX = {direction: k for k, direction in enumerate(CLOCKWISE)}
+
+
+class BitboardManor(Manor):
+    """Manoir à tableaux de bits (entiers Python), interchangeable avec Manor"""
+
+    def __init__(self, width: int = 5, height: int = 10, events: Optional[EventSink] = None,
+                 sparse: Optional[bool] = None):
+        if width * height >= SPARSE_CELLS:
+            # Décalages et masques sur toute la surface: plus lents que Manor sur un grand manoir
+            raise ValueError(f"BitboardManor: {width} x {height} cases, limite {SPARSE_CELLS} (utiliser Manor)")
+        super().__init__(width, height, events, sparse)
+        self.full = (1 << (width * height)) - 1
+        west_column = sum(1 << (row * width) for row in range(height))
+        self._not_west = self.full & ~west_column                   # Arrivées d'un décalage vers l'Est
+        self._not_east = self.full & ~(west_column << (width - 1))  # Arrivées d'un décalage vers l'Ouest
+        self.occupied = 0
+        self.doors = [0, 0, 0, 0]   # Portes présentes (masque de la pièce)
+        self.opened = [0, 0, 0, 0]  # Portes ouvertes
+        self.locked = [0, 0, 0, 0]  # Portes verrouillées pas encore ouvertes
+
+    def _shift(self, k: int, board: int) -> int:
+        """Cases voisines dans la direction k de chaque case du tableau"""
+        if k == 0:
+            return board >> self.width
+        if k == 1:
+            return (board << 1) & self._not_west
+        if k == 2:
+            return (board << self.width) & self.full
+        return (board >> 1) & self._not_east
+
+    def _bit(self, position: Tuple[int, int]) -> int:
+        """Bit de la case (0 hors de la grille)"""
+        row, col = position
+        if 0 <= row < self.height and 0 <= col < self.width:
+            return 1 << (row * self.width + col)
+        return 0
+
+    def _position(self, bit: int) -> Tuple[int, int]:
+        return divmod(bit.bit_length() - 1, self.width)
+
+    def cells(self, board: int) -> Iterator[Tuple[int, int]]:
+        """Positions des bits d'un tableau (ordre ligne par ligne)"""
+        while board:
+            low = board & -board
+            yield self._position(low)
+            board ^= low
+
+    def refresh_cell(self, row: int, col: int) -> None:
+        super().refresh_cell(row, col)
+        bit = 1 << (row * self.width + col)
+        clear = ~bit
+        self.occupied &= clear
+        doors, opened, locked = self.doors, self.opened, self.locked
+        for k in range(4):
+            doors[k] &= clear
+            opened[k] &= clear
+            locked[k] &= clear
+        room = self.rooms.get((row, col))
+        if room is None:
+            return
+        self.occupied |= bit
+        for k, door_bit in enumerate(DOOR_BITS):
+            if not room.door_mask & door_bit:
+                continue
+            doors[k] |= bit
+            door = room.get_door(CLOCKWISE[k])
+            if door is None:
+                continue
+            if door.is_opened:
+                opened[k] |= bit
+            elif door.lock_level:
+                locked[k] |= bit
+
+    def getstate(self) -> tuple:
+        """État de Manor suivi des tableaux de bits (restauration sans parcourir la grille)"""
+        return super().getstate() + ((self.occupied, tuple(self.doors), tuple(self.opened), tuple(self.locked)),)
+
+    def setstate(self, state: tuple) -> None:
+        super().setstate(state[:3])
+        occupied, doors, opened, locked = state[3]
+        self.occupied = occupied
+        self.doors[:] = doors
+        self.opened[:] = opened
+        self.locked[:] = locked
+
+    def can_move_to(self, from_pos: Tuple[int, int], direction: Direction) -> bool:
+        k = DIRECTION_INDEX[direction]
+        return bool(self._shift(k, self.doors[k] & self._bit(from_pos)) & self.occupied)
+
+    def exits(self, position: Tuple[int, int]) -> List[Tuple[Direction, Tuple[int, int], bool]]:
+        bit = self._bit(position) & self.occupied
+        if not bit:
+            return []
+        exits = []
+        for direction in Direction:
+            k = DIRECTION_INDEX[direction]
+            target = self._shift(k, self.doors[k] & bit)
+            if not target:
+                continue
+            if not target & self.occupied:
+                exits.append((direction, self._position(target), True))
+            elif target & self.doors[k ^ 2]:
+                exits.append((direction, self._position(target), False))
+        return exits
+
+    def free_neighbours(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        bit = self._bit(position) & self.occupied
+        free = 0
+        for k in range(4):
+            free |= self._shift(k, self.doors[k] & bit)
+        return list(self.cells(free & ~self.occupied))
+
+    def frontier_mask(self) -> int:
+        """Tableau des cases vides derrière une porte d'une pièce placée"""
+        free = 0
+        for k in range(4):
+            free |= self._shift(k, self.doors[k])
+        return free & ~self.occupied
+
+    def frontier(self) -> List[Tuple[int, int]]:
+        return list(self.cells(self.frontier_mask()))
+
+    def reachable_mask(self, position: Tuple[int, int], unlocked_only: bool = False) -> int:
+        """Tableau des pièces accessibles (propagation sur toutes les cases atteintes à la fois)"""
+        reach = self._bit(position) & self.occupied
+        if unlocked_only:
+            passable = [doors & ~locked for doors, locked in zip(self.doors, self.locked)]
+        else:
+            passable = self.doors
+        facing = self.doors
+        while reach:
+            grown = reach
+            for k in range(4):
+                grown |= self._shift(k, reach & passable[k]) & facing[k ^ 2]
+            if grown == reach:
+                break
+            reach = grown
+        return reach
+
+    def reachable_cells(self, position: Tuple[int, int], unlocked_only: bool = False) -> List[Tuple[int, int]]:
+        return list(self.cells(self.reachable_mask(position, unlocked_only)))
@@ -0,0 +1,70 @@
+"""
+Puits d'événements - Acheminement des messages du jeu
+Permet de jouer en mode console (print), en mode silencieux (simulation)
+ou d'enregistrer les événements sous forme structurée.
+"""
+from typing import Any, Dict, List, NamedTuple
+
+
+class GameEvent(NamedTuple):
+    """Événement structuré émis par le moteur de jeu"""
+    kind: str              # Identifiant stable (ex: "room_placed", "move")
+    message: str           # Gabarit du message (syntaxe str.format)
+    data: Dict[str, Any]   # Valeurs utilisées par le gabarit
+
+    def render(self) -> str:
+        """Construit le texte lisible de l'événement"""
+        return self.message.format(**self.data) if self.data else self.message
+
+
+class EventSink:
+    """
+    Destination des messages du jeu.
+    Le texte n'est formaté que par les puits qui en ont besoin: en mode
+    silencieux, aucune chaîne n'est construite ni écrite sur stdout.
+    """
+
+    # False si le puits ignore tous les messages (permet d'éviter des calculs d'affichage)
+    enabled = True
+
+    def emit(self, kind: str, message: str, **data) -> None:
+        """Reçoit un événement (message = gabarit str.format, data = valeurs)"""
+        raise NotImplementedError
+
+
+class ConsoleSink(EventSink):
+    """Affiche chaque message sur la console (comportement historique)"""
+
+    def emit(self, kind: str, message: str, **data) -> None:
+        print(message.format(**data) if data else message)
+
+
+class NullSink(EventSink):
+    """Ignore tous les messages - mode headless pour les simulations"""
+
+    enabled = False
+
+    def emit(self, kind: str, message: str, **data) -> None:
+        pass
+
+
+class RecordingSink(EventSink):
+    """Enregistre les événements structurés sans rien afficher"""
+
+    def __init__(self):
+        self.events: List[GameEvent] = []
+
+    def emit(self, kind: str, message: str, **data) -> None:
+        self.events.append(GameEvent(kind, message, data))
+
+    def kinds(self) -> List[str]:
+        """Retourne la liste des types d'événements reçus"""
+        return [event.kind for event in self.events]
+
+    def messages(self) -> List[str]:
+        """Retourne les messages lisibles (formatés à la demande)"""
+        return [event.render() for event in self.events]
+
+    def clear(self) -> None:
+        """Vide l'historique des événements"""
+        self.events.clear()
@@ -6,13 +6,21 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from enum import Enum
-from typing import List, Optional
-import random
+from typing import FrozenSet, List, NamedTuple, Optional, Tuple
 
 from game1.player import Player
 from game1.manor import Manor
-from core.game_objects import Direction
+from game1.bitboard import BitboardManor
+from game1.events import EventSink, ConsoleSink, NullSink
+from game1.rng import GameRandom
+from core.game_objects import Direction, RoomColor
+from core.doors import DIRECTION_BITS, MASK_DIRECTIONS, border_mask
+from core.item_rules import STEPS, collect_item
+from game1.zobrist import zobrist_key, inventory_key
+from game1.reachability import ReachabilityMap, StepBound
+from game1.pathfinding import PathFinder, Route
 from rooms.catalog import RoomCatalog
+from rooms.draw_odds import DrawOdds, OfferOdds
 
 
 
@@ -27,13 +35,58 @@ class GameState(Enum):
     GAME_WON = "game_won"              # Victoire
 
 
+class GameSnapshot(NamedTuple):
+    """
+    Point de sauvegarde d'une partie (Game.snapshot / Game.restore)
+    Partage de structure: pièces, objets et portes ne sont pas copiés, seuls
+    leurs champs modifiables le sont (voir Room.getstate).
+    """
+    state: GameState
+    selected_direction: Optional[Direction]
+    pending_room_selection: tuple
+    room_objects: tuple
+    selected_object_index: int
+    used_room_names: FrozenSet[str]
+    position: Tuple[int, int]
+    inventory: tuple
+    manor: tuple
+    rooms: tuple
+    catalog: tuple
+    rng: tuple
+    modifiers: Tuple[Optional[dict], Optional[dict]]
+
+
 class Game:
     """Moteur principal du jeu Blue Prince"""
 
-    def __init__(self):
-        self.player = Player()
-        self.manor = Manor(width=5, height=9)
-        self.catalog = RoomCatalog()
+    def __init__(self, headless: bool = False, event_sink: Optional[EventSink] = None,
+                 seed: Optional[int] = None, bitboard: bool = False,
+                 size: Tuple[int, int] = (9, 5), sparse: Optional[bool] = None):
+        """
+        headless: si True, aucun message n'est affiché (simulations, bots)
+        event_sink: puits d'événements personnalisé (prioritaire sur headless)
+        seed: graine de la partie (None = partie aléatoire non reproductible)
+        bitboard: manoir à tableaux de bits (game1/bitboard.py), mêmes parties que Manor
+                  (moins de SPARSE_CELLS cases, ValueError au-delà)
+        size: (lignes, colonnes) du manoir; entrée au milieu de la dernière ligne,
+        Antechamber au milieu de la première
+        sparse: manoir sans grille de listes (None = selon la taille, voir game1/manor.py)
+        """
+        # Générateur aléatoire propre à la partie (sous-flux par sous-système)
+        self.rng = GameRandom(seed)
+
+        if event_sink is None:
+            event_sink = NullSink() if headless else ConsoleSink()
+        self.events = event_sink
+
+        self.player = Player(events=self.events)
+        height, width = size
+        manor_class = BitboardManor if bitboard else Manor
+        self.manor = manor_class(width=width, height=height, events=self.events, sparse=sparse)
+        self.catalog = RoomCatalog(rng=self.rng, size=size)
+        # Cases de départ (Entrance Hall) et d'arrivée (Antechamber)
+        self.start = (height - 1, width // 2)
+        self.goal = (0, width // 2)
         self.state = GameState.PLAYING  # Commencer en mode PLAYING pour choisir direction
 
         # Pièces proposées pour le choix
@@ -49,28 +102,36 @@ class Game:
         # Track des chambres déjà utilisées (par nom)
         self.used_room_names: set = set()
 
-        # Démarrer par l'Entrance Hall en dernière ligne, colonne 3
+        # Démarrer par l'Entrance Hall au milieu de la dernière ligne
         entrance = self.catalog.get_entrance()
         if entrance:
-            entrance_row = self.manor.height - 1  # Dernière ligne (4 pour un grid 5x5)
-            entrance_col = 2  # Colonne 3 (index 2)
+            entrance_row, entrance_col = self.start
             self.manor.place_room(entrance, entrance_row, entrance_col)
             self.player.position = (entrance_row, entrance_col)
             self.used_room_names.add(entrance.name)  # Marquer comme utilisée
-            print(f"🏰 Jeu démarré à l'Entrance Hall en position {self.player.position}")
+            self.events.emit("game_started", "🏰 Jeu démarré à l'Entrance Hall en position {position}",
+                             position=self.player.position)
 
-        # Placer l'Antechamber comme point d'arrivée en ligne 2, colonne 3
+        # Placer l'Antechamber comme point d'arrivée au milieu de la première ligne
         antechamber = self.catalog.get_room_by_name("Antechamber")
         if antechamber:
-            goal_row = 0  # Ligne 2 (index 1)
-            goal_col = 2  # Colonne 3 (index 2)
+            goal_row, goal_col = self.goal
             self.manor.place_room(antechamber, goal_row, goal_col)
             self.used_room_names.add(antechamber.name)  # Marquer comme utilisée
-            print(f"🎯 Objectif: Antechamber placée en position ({goal_row}, {goal_col})")
+            self.events.emit("goal_placed", "🎯 Objectif: Antechamber placée en position ({row}, {col})",
+                             row=goal_row, col=goal_col)
+
+        # Distance minimale jusqu'à l'Antechamber, mémorisée par case jusqu'au prochain changement du manoir
+        self.reachability = ReachabilityMap(self.manor, self.catalog, goal=self.goal)
+        self.step_bound = StepBound(self.reachability)
+        self.pathfinder = PathFinder(self.manor)
+        # Probabilités exactes de la prochaine offre (cache invalidé quand le catalogue change)
+        self.draw_odds = DrawOdds(self.catalog)
 
         # Message pour inviter à choisir une direction
-        print("\n🧭 Choisissez une direction pour placer votre première pièce:")
-        print("   W = Nord  |  A = Ouest  |  D = Est")
+        self.events.emit("choose_direction",
+                         "\n🧭 Choisissez une direction pour placer votre première pièce:\n"
+                         "   W = Nord  |  A = Ouest  |  D = Est")
 
     def generate_room_selection(self):
         """Génère 3 pièces aléatoires pour le choix (version simplifiée)"""
@@ -84,91 +145,87 @@ class Game:
                 Direction.WEST: Direction.EAST
             }
             opposite_direction = opposite_map.get(self.selected_direction)
-            print(f"🔄 Direction choisie: {self.selected_direction.value} → Les chambres doivent avoir une porte {opposite_direction.value}")
+            self.events.emit("direction_chosen",
+                             "🔄 Direction choisie: {direction.value} → Les chambres doivent avoir une porte {required.value}",
+                             direction=self.selected_direction, required=opposite_direction)
         
         # Calculer les portes interdites selon la position cible
         current_pos = self.player.position
         target_pos = self.manor.get_adjacent_position(current_pos, self.selected_direction) if self.selected_direction else None
         
-        forbidden_doors = []
+        forbidden_mask = 0
         if target_pos:
             row, col = target_pos
             # Interdire les portes qui donneraient sur l'extérieur du manoir
-            if row == 0:
-                forbidden_doors.append(Direction.NORTH)
-            if row == self.manor.height - 1:
-                forbidden_doors.append(Direction.SOUTH)
-            if col == 0:
-                forbidden_doors.append(Direction.WEST)
-            if col == self.manor.width - 1:
-                forbidden_doors.append(Direction.EAST)
-            
-            if forbidden_doors:
-                forbidden_str = ', '.join([d.value for d in forbidden_doors])
-                print(f"🚫 Portes interdites à cette position: {forbidden_str}")
-        
-        # Pour les tests: toujours proposer les mêmes pièces
-        all_rooms = self.catalog.get_all_rooms()
-        
-        # Filtrer l'entrance, l'antechamber ET les chambres déjà utilisées
-        available_rooms = [
-            r for r in all_rooms 
-            if r.name not in ["Entrance Hall", "Antechamber"] 
-            and r.name not in self.used_room_names
-        ]
+            forbidden_mask = border_mask(row, col, self.manor.height, self.manor.width)
+
+            if forbidden_mask and self.events.enabled:
+                forbidden_str = ', '.join([d.value for d in MASK_DIRECTIONS[forbidden_mask]])
+                self.events.emit("forbidden_doors", "🚫 Portes interdites à cette position: {doors}",
+                                 doors=forbidden_str)
         
-        if len(available_rooms) == 0:
-            print("❌ Plus aucune chambre disponible!")
-            print("   Toutes les chambres ont été utilisées.")
+        # Chambres non utilisées (hors Entrance Hall et Antechamber), lues dans l'index du catalogue
+        available_count = len(self.catalog.find_unused())
+
+        if available_count == 0:
+            self.events.emit("catalog_exhausted",
+                             "❌ Plus aucune chambre disponible!\n"
+                             "   Toutes les chambres ont été utilisées.")
             self.pending_room_selection = []
             return
         
-        print(f"🏠 {len(available_rooms)} chambre(s) non utilisée(s) disponible(s)")
-        
-        # Filtrer les chambres qui ont une porte dans la direction OPPOSÉE
+        self.events.emit("rooms_available", "🏠 {count} chambre(s) non utilisée(s) disponible(s)",
+                         count=available_count)
+
+        # Chambres qui ont une porte dans la direction OPPOSÉE
+        required_bit = 0
         if opposite_direction:
-            compatible_rooms = [r for r in available_rooms if opposite_direction in r.doors_directions]
-            
-            if len(compatible_rooms) == 0:
-                print(f"⚠️ Aucune chambre compatible avec porte {opposite_direction.value}!")
-                print(f"   Proposition de chambres sans cette restriction...")
-                compatible_rooms = available_rooms
-            elif len(compatible_rooms) < 3:
-                print(f"ℹ️  Seulement {len(compatible_rooms)} chambre(s) compatible(s) avec porte {opposite_direction.value}")
-        else:
-            compatible_rooms = available_rooms
-        
-        # Filtrer les chambres qui n'ont AUCUNE porte interdite
-        if forbidden_doors:
-            compatible_rooms = [
-                r for r in compatible_rooms 
-                if not any(door in forbidden_doors for door in r.doors_directions)
-            ]
-            print(f"✅ {len(compatible_rooms)} chambre(s) sans portes interdites")
-        
+            required_bit = DIRECTION_BITS[opposite_direction]
+            compatible_count = len(self.catalog.find_unused(required_bit))
+
+            if compatible_count == 0:
+                self.events.emit("no_compatible_room",
+                                 "⚠️ Aucune chambre compatible avec porte {required.value}!\n"
+                                 "   Proposition de chambres sans cette restriction...",
+                                 required=opposite_direction)
+                required_bit = 0
+            elif compatible_count < 3:
+                self.events.emit("few_compatible_rooms",
+                                 "ℹ️  Seulement {count} chambre(s) compatible(s) avec porte {required.value}",
+                                 count=compatible_count, required=opposite_direction)
+
+        # Chambres qui n'ont AUCUNE porte interdite: simple lecture de l'index
+        compatible_rooms = self.catalog.find_unused(required_bit, forbidden_mask)
+        if forbidden_mask:
+            self.events.emit("rooms_filtered", "✅ {count} chambre(s) sans portes interdites",
+                             count=len(compatible_rooms))
+
         # Choisir jusqu'à 3 pièces (ou moins si pas assez disponibles)
-        num_to_select = min(3, len(compatible_rooms))
-        if num_to_select > 0:
-            self.pending_room_selection = random.sample(compatible_rooms, num_to_select)
+        if len(compatible_rooms) > 0:
+            # Chaque pièce est tournée pour convenir à la case, portes contre les murs voisins évitées
+            avoid_mask = self.manor.wall_mask(*target_pos) if target_pos else 0
+            self.pending_room_selection = self.catalog.sample_unused(required_bit, forbidden_mask, 3, avoid_mask)
         else:
             self.pending_room_selection = []
-            print("❌ Aucune chambre disponible!")
+            self.events.emit("no_room_available", "❌ Aucune chambre disponible!")
             return
         
         self.state = GameState.ROOM_SELECTION
         
         # Message adapté selon le nombre de chambres
+        if not self.events.enabled:
+            return
         if len(self.pending_room_selection) == 1:
-            print(f"\n🎲 1 chambre proposée:")
-        elif len(self.pending_room_selection) == 2:
-            print(f"\n🎲 2 chambres proposées:")
+            self.events.emit("rooms_offered", "\n🎲 1 chambre proposée:", count=1)
         else:
-            print(f"\n🎲 3 chambres proposées:")
+            self.events.emit("rooms_offered", "\n🎲 {count} chambres proposées:",
+                             count=len(self.pending_room_selection))
             
         for i, room in enumerate(self.pending_room_selection):
             cost = f"💎 {room.gem_cost}" if room.gem_cost > 0 else "Gratuit"
             doors_str = ', '.join([d.value for d in room.doors_directions])
-            print(f"  {i+1}. {room.name} ({cost}) - Portes: {doors_str}")
+            self.events.emit("room_offer", "  {number}. {room.name} ({cost}) - Portes: {doors}",
+                             number=i + 1, room=room, cost=cost, doors=doors_str)
 
     def select_room(self, index: int) -> bool:
         """Sélectionne une pièce parmi les choix"""
@@ -180,7 +237,8 @@ class Game:
         # Vérifier le coût en gemmes
         if selected_room.gem_cost > 0:
             if not self.player.inventory.spend_gems(selected_room.gem_cost):
-                print(f"❌ Pas assez de gemmes! (besoin: {selected_room.gem_cost})")
+                self.events.emit("not_enough_gems", "❌ Pas assez de gemmes! (besoin: {cost})",
+                                 cost=selected_room.gem_cost)
                 return False
 
         # Utiliser la direction sélectionnée pour placer la pièce
@@ -192,36 +250,48 @@ class Game:
             if new_pos and self.manor.get_room(*new_pos) is None:
                 # Dépenser 1 pas pour placer la pièce
                 if not self.player.inventory.use_steps(1):
-                    print("❌ Plus de pas disponibles!")
+                    self.events.emit("out_of_steps", "❌ Plus de pas disponibles!")
                     self.state = GameState.GAME_OVER
                     return False
                 
                 # Place la pièce
+                was_reachable = self.events.enabled and self.is_goal_reachable()
                 self.manor.place_room(selected_room, *new_pos)
-                print(f"✓ Pièce '{selected_room.name}' placée en {new_pos} ({self.selected_direction.value})")
+                self.events.emit("room_selected", "✓ Pièce '{room.name}' placée en {position} ({direction.value})",
+                                 room=selected_room, position=new_pos, direction=self.selected_direction)
                 
                 # Marquer la chambre comme utilisée
                 self.used_room_names.add(selected_room.name)
-                print(f"📝 Chambre '{selected_room.name}' marquée comme utilisée ({len(self.used_room_names)} chambres utilisées au total)")
+                self.catalog.mark_used(selected_room)
+                self.events.emit("room_used",
+                                 "📝 Chambre '{room.name}' marquée comme utilisée ({used} chambres utilisées au total)",
+                                 room=selected_room, used=len(self.used_room_names))
                 
                 # Déplacer le joueur dans la nouvelle pièce
                 self.player.position = new_pos
-                print(f"✓ Vous entrez dans {selected_room.name} (pas restants: {self.player.inventory.steps.quantity})")
+                self.events.emit("room_entered", "✓ Vous entrez dans {room.name} (pas restants: {steps})",
+                                 room=selected_room, steps=self.player.inventory.counts[STEPS])
+
+                if was_reachable and not self.is_goal_reachable():
+                    self.events.emit("goal_unreachable",
+                                     "⚠️ L'Antechamber n'est plus accessible: aucun chemin possible, "
+                                     "même avec les pièces restantes!")
                 
                 # Si c'est une pièce rouge, retirer automatiquement 2-10 pas
-                from core.game_objects import RoomColor
                 if selected_room.color == RoomColor.RED:
-                    import random
-                    steps_lost = random.randint(2, 10)
-                    self.player.inventory.steps.quantity -= steps_lost
-                    print(f"⚠️ DANGER! Cette pièce vous fait perdre {steps_lost} pas! (pas restants: {self.player.inventory.steps.quantity})")
+                    steps_lost = self.rng.rolls.randint(2, 10)
+                    self.player.inventory.counts[STEPS] -= steps_lost
+                    self.events.emit("red_room_penalty",
+                                     "⚠️ DANGER! Cette pièce vous fait perdre {lost} pas! (pas restants: {steps})",
+                                     lost=steps_lost, steps=self.player.inventory.counts[STEPS])
                 
                 # Si c'est une pièce violette, gagner automatiquement 4-12 gold
                 if selected_room.color == RoomColor.PURPLE:
-                    import random
-                    gold_gained = random.randint(4, 12)
+                    gold_gained = self.rng.rolls.randint(4, 12)
                     self.player.inventory.gold.quantity += gold_gained
-                    print(f"💰 BONUS! Vous gagnez {gold_gained} gold dans cette chambre! (gold total: {self.player.inventory.gold.quantity})")
+                    self.events.emit("purple_room_bonus",
+                                     "💰 BONUS! Vous gagnez {gained} gold dans cette chambre! (gold total: {gold})",
+                                     gained=gold_gained, gold=self.player.inventory.gold.quantity)
                 
                 # Réinitialiser la direction
                 self.selected_direction = None
@@ -235,7 +305,8 @@ class Game:
                 
                 return True
             else:
-                print(f"❌ Position {new_pos} occupée ou invalide")
+                self.events.emit("invalid_position", "❌ Position {position} occupée ou invalide",
+                                 position=new_pos)
                 return False
         else:
             # Fallback: chercher n'importe quelle position adjacente
@@ -245,104 +316,136 @@ class Game:
                 if new_pos and self.manor.get_room(*new_pos) is None:
                     # Dépenser 1 pas pour placer la pièce
                     if not self.player.inventory.use_steps(1):
-                        print("❌ Plus de pas disponibles!")
+                        self.events.emit("out_of_steps", "❌ Plus de pas disponibles!")
                         self.state = GameState.GAME_OVER
                         return False
                     
                     self.manor.place_room(selected_room, *new_pos)
-                    print(f"✓ Pièce '{selected_room.name}' placée en {new_pos}")
+                    self.events.emit("room_selected", "✓ Pièce '{room.name}' placée en {position}",
+                                     room=selected_room, position=new_pos, direction=direction)
                     
                     self.player.position = new_pos
-                    print(f"✓ Vous entrez dans {selected_room.name} (pas restants: {self.player.inventory.steps.quantity})")
+                    self.events.emit("room_entered", "✓ Vous entrez dans {room.name} (pas restants: {steps})",
+                                     room=selected_room, steps=self.player.inventory.counts[STEPS])
                     
                     self.state = GameState.PLAYING
                     return True
 
-        print("❌ Impossible de placer la pièce")
+        self.events.emit("placement_failed", "❌ Impossible de placer la pièce")
         return False
 
     def reroll_rooms(self) -> bool:
         """Relancer le choix de pièces avec un dé"""
         if self.player.inventory.spend_dice():
-            print("🎲 Relance avec un dé!")
+            self.events.emit("reroll", "🎲 Relance avec un dé!")
             self.generate_room_selection()
             return True
         else:
-            print("❌ Pas de dés disponibles!")
+            self.events.emit("no_dice", "❌ Pas de dés disponibles!")
             return False
 
     def try_move(self, direction: Direction) -> bool:
         """Tente de se déplacer dans une direction"""
-        print(f"🚶 try_move() appelé: direction={direction.value}, état={self.state.value}")
+        self.events.emit("move_requested", "🚶 try_move() appelé: direction={direction.value}, état={state.value}",
+                         direction=direction, state=self.state)
         
         if self.state != GameState.PLAYING:
-            print(f"❌ État incorrect: {self.state.value}")
+            self.events.emit("invalid_state", "❌ État incorrect: {state.value}", state=self.state)
             return False
 
         current_pos = self.player.position
         current_room = self.manor.get_room(*current_pos)
 
         if not current_room:
-            print("❌ Pas de pièce actuelle!")
+            self.events.emit("no_current_room", "❌ Pas de pièce actuelle!")
             return False
 
         # Calculer la nouvelle position
         new_pos = self.manor.get_adjacent_position(current_pos, direction)
         if not new_pos:
-            print("❌ Hors limites du manoir!")
+            self.events.emit("out_of_bounds", "❌ Hors limites du manoir!")
             return False
 
         # Vérifier s'il y a une pièce à destination
         dest_room = self.manor.get_room(*new_pos)
         if not dest_room:
             # Pas de pièce dans cette direction - ne rien faire
-            print(f"❌ Aucune pièce au {direction.value}. Utilisez W/A/S/D + ESPACE pour ouvrir une nouvelle porte.")
+            self.events.emit("no_room_there",
+                             "❌ Aucune pièce au {direction.value}. Utilisez W/A/S/D + ESPACE pour ouvrir une nouvelle porte.",
+                             direction=direction)
             return False
 
         # Vérifier si la chambre actuelle a une porte dans cette direction
         if not current_room.has_door(direction):
-            print(f"❌ Pas de porte au {direction.value} dans {current_room.name}")
+            self.events.emit("no_door", "❌ Pas de porte au {direction.value} dans {room.name}",
+                             direction=direction, room=current_room)
             return False
 
         # NOUVEAU: Vérifier si la chambre de destination a une porte dans la direction opposée
         opposite_direction = direction.opposite()
         if not dest_room.has_door(opposite_direction):
-            print(f"❌ La chambre {dest_room.name} n'a pas de porte au {opposite_direction.value} (direction opposée)")
-            print(f"   Vous ne pouvez pas entrer dans cette chambre depuis {direction.value}")
+            self.events.emit("no_matching_door",
+                             "❌ La chambre {room.name} n'a pas de porte au {opposite.value} (direction opposée)\n"
+                             "   Vous ne pouvez pas entrer dans cette chambre depuis {direction.value}",
+                             room=dest_room, opposite=opposite_direction, direction=direction)
             return False
 
         door = current_room.get_door(direction)
         
         # Vérifier si la porte est verrouillée
         if door and not door.can_open(self.player):
-            print(f"🔒 La porte est verrouillée (niveau {door.lock_level})!")
+            self.events.emit("door_locked", "🔒 La porte est verrouillée (niveau {level})!",
+                             level=door.lock_level)
+            return False
+        
+        if not self._pass_door(current_pos, direction, door, new_pos, dest_room):
             return False
+        if self.state == GameState.GAME_WON:
+            return True
+        
+        # Activer automatiquement le mode interaction si la chambre a des objets
+        if len(dest_room.objects) > 0:
+            self.enter_room_interaction()
         
+        return True
+
+    def _pass_door(self, current_pos: Tuple[int, int], direction: Direction, door, new_pos: Tuple[int, int],
+                   dest_room, announce: bool = True) -> bool:
+        """
+        Franchit une porte dont les deux côtés ont été vérifiés: ouverture, pas,
+        pièce rouge, effets d'entrée, victoire
+        announce: messages de passage et de déplacement (omis par walk_to)
+        """
         # Ouvrir la porte si elle n'est pas encore ouverte
         if door and not door.is_opened:
-            if not door.open(self.player):
+            opened = door.open(self.player)
+            self.manor.refresh_cell(*current_pos)  # État de la porte (ou verrou forcé) dans le hachage
+            if not opened:
                 return False
-            print(f"🚪 Porte ouverte vers {direction.value}")
-        else:
-            print(f"🚪 Passage par la porte déjà ouverte au {direction.value}")
+            if announce:
+                self.events.emit("door_opened", "🚪 Porte ouverte vers {direction.value}", direction=direction)
+        elif announce:
+            self.events.emit("door_passed", "🚪 Passage par la porte déjà ouverte au {direction.value}",
+                             direction=direction)
 
         # Déplacement avec consommation de 1 pas
         if not self.player.inventory.use_steps(1):
-            print("💀 YOU LOSE! HARD LUCK, NEXT TIME!")
-            print("❌ Plus de pas disponibles!")
+            self.events.emit("game_lost", "💀 YOU LOSE! HARD LUCK, NEXT TIME!\n❌ Plus de pas disponibles!")
             self.state = GameState.GAME_OVER
             return False
             
         self.player.position = new_pos
-        print(f"✓ Déplacement vers {dest_room.name} (pas restants: {self.player.inventory.steps.quantity})")
+        if announce:
+            self.events.emit("move", "✓ Déplacement vers {room.name} (pas restants: {steps})",
+                             room=dest_room, position=new_pos, steps=self.player.inventory.counts[STEPS])
         
         # Si c'est une pièce rouge, retirer automatiquement 2-10 pas
-        from core.game_objects import RoomColor
         if dest_room.color == RoomColor.RED:
-            import random
-            steps_lost = random.randint(2, 10)
-            self.player.inventory.steps.quantity -= steps_lost
-            print(f"⚠️ DANGER! Cette pièce vous fait perdre {steps_lost} pas! (pas restants: {self.player.inventory.steps.quantity})")
+            steps_lost = self.rng.rolls.randint(2, 10)
+            self.player.inventory.counts[STEPS] -= steps_lost
+            self.events.emit("red_room_penalty",
+                             "⚠️ DANGER! Cette pièce vous fait perdre {lost} pas! (pas restants: {steps})",
+                             lost=steps_lost, steps=self.player.inventory.counts[STEPS])
         
         # Appeler la méthode enter() de la pièce pour appliquer les effets (magasin, etc.)
         dest_room.enter(self.player)
@@ -350,13 +453,47 @@ class Game:
         # Vérifier si c'est l'Antechamber (victoire)
         if dest_room.name == "Antechamber":
             self.state = GameState.GAME_WON
-            print("🎉 VICTOIRE! Vous avez atteint l'Antechamber!")
-            return True
-        
-        # Activer automatiquement le mode interaction si la chambre a des objets
-        if len(dest_room.objects) > 0:
+            self.events.emit("game_won", "🎉 VICTOIRE! Vous avez atteint l'Antechamber!")
+        return True
+
+    def find_route(self, target: Tuple[int, int]) -> Optional[Route]:
+        """Itinéraire le moins coûteux (pas, clés) vers une pièce placée, None si inaccessible"""
+        return self.pathfinder.route(self.player.position, target, self.player.inventory)
+
+    def walk_to(self, target: Tuple[int, int]) -> bool:
+        """
+        Aller à une pièce placée en un seul appel (clic sur la grille)
+        Suit find_route sans les vérifications ni les messages de chaque try_move;
+        s'arrête sur la victoire ou si le joueur n'a plus de pas.
+        """
+        if self.state != GameState.PLAYING:
+            self.events.emit("invalid_state", "❌ État incorrect: {state.value}", state=self.state)
+            return False
+        route = self.find_route(target)
+        if route is None:
+            self.events.emit("no_route", "❌ Aucun chemin vers la case {target} (portes, verrous ou clés)",
+                             target=target)
+            return False
+        if not route.directions:
+            return False
+
+        position = self.player.position
+        for direction in route.directions:
+            room = self.manor.get_room(*position)
+            next_position = self.manor.get_adjacent_position(position, direction)
+            door = room.get_door(direction)
+            if not self._pass_door(position, direction, door, next_position,
+                                   self.manor.get_room(*next_position), announce=False):
+                return False
+            position = next_position
+            if self.state == GameState.GAME_WON or not self.player.is_alive():
+                return True
+
+        dest_room = self.manor.get_room(*position)
+        self.events.emit("walk", "🚶 Arrivée dans {room.name} en {moves} déplacements (pas restants: {steps})",
+                         room=dest_room, moves=len(route.directions), steps=self.player.inventory.counts[STEPS])
+        if dest_room.objects:
             self.enter_room_interaction()
-        
         return True
 
     def interact_with_object(self, object_index: int):
@@ -367,10 +504,11 @@ class Game:
 
         if 0 <= object_index < len(current_room.objects):
             obj = current_room.objects[object_index]
-            print(f"🔍 Interaction avec: {obj.name}")
+            self.events.emit("object_interaction", "🔍 Interaction avec: {item.name}", item=obj)
             obj.interact(self.player)
+            self.manor.refresh_cell(*self.player.position)
         else:
-            print(f"❌ Pas d'objet à l'index {object_index}")
+            self.events.emit("no_object", "❌ Pas d'objet à l'index {index}", index=object_index)
 
     def enter_room_interaction(self):
         """Entre en mode interaction avec les objets de la pièce actuelle"""
@@ -379,7 +517,8 @@ class Game:
             self.room_objects = current_room.objects.copy()
             self.selected_object_index = 0
             self.state = GameState.ROOM_INTERACTION
-            print(f"🚪 Entrée dans {current_room.name} - {len(self.room_objects)} objets disponibles")
+            self.events.emit("interaction_started", "🚪 Entrée dans {room.name} - {count} objets disponibles",
+                             room=current_room, count=len(self.room_objects))
             return True
         return False
     
@@ -389,7 +528,8 @@ class Game:
             return
         
         self.selected_object_index = (self.selected_object_index + direction) % len(self.room_objects)
-        print(f"📍 Objet sélectionné: {self.room_objects[self.selected_object_index].name}")
+        self.events.emit("object_selected", "📍 Objet sélectionné: {item.name}",
+                         item=self.room_objects[self.selected_object_index])
     
     def take_selected_object(self):
         """Prend l'objet sélectionné"""
@@ -405,10 +545,10 @@ class Game:
                 # Vérifier si on peut l'ouvrir (comme Gold avec Shovel)
                 if obj.can_open(self.player):
                     # OUVRIR LE COFFRET : remplacer par son contenu dans la liste
-                    print(f"✅ {obj.name} ouvert!")
-                    print(f"📦 Contenu du coffret:")
-                    for content_item in obj.contents:
-                        print(f"   - {content_item.name}")
+                    self.events.emit("container_opened", "✅ {item.name} ouvert!\n📦 Contenu du coffret:", item=obj)
+                    if self.events.enabled:
+                        for content_item in obj.contents:
+                            self.events.emit("container_item", "   - {item.name}", item=content_item)
                     
                     # Retirer le coffret de la liste
                     self.room_objects.pop(self.selected_object_index)
@@ -424,8 +564,10 @@ class Game:
                         self.room_objects.insert(self.selected_object_index, content_item)
                         if current_room:
                             current_room.objects.append(content_item)
+                    if current_room:
+                        self.manor.refresh_cell(*self.player.position)
                     
-                    print("💡 Vous pouvez maintenant ramasser les objets un par un avec R")
+                    self.events.emit("hint", "💡 Vous pouvez maintenant ramasser les objets un par un avec R")
                     
                     # Ajuster l'index pour pointer sur le premier objet du coffret
                     if len(self.room_objects) > 0:
@@ -451,6 +593,7 @@ class Game:
                     current_room.objects.remove(obj)
                 except ValueError:
                     pass
+                self.manor.refresh_cell(*self.player.position)
             
             # Ajuster l'index si nécessaire
             if self.selected_object_index >= len(self.room_objects) and self.selected_object_index > 0:
@@ -464,50 +607,128 @@ class Game:
         return False
     
     def _add_to_inventory(self, obj):
-        """Ajoute un objet à l'inventaire du joueur"""
-        if obj.name == "Gâteau" or obj.name == "Cake":
-            self.player.inventory.steps.quantity += 10
-            print(f"🍰 Cake ramassé! +10 pas (Total: {self.player.inventory.steps.quantity})")
-        elif obj.name == "Gold" or obj.name == "Or":
-            # Tout l'or nécessite la pelle (Shovel)
-            if self.player.inventory.has_permanent_item("Shovel"):
-                self.player.inventory.gold.quantity += obj.quantity
-                print(f"💰 Gold ramassé! +{obj.quantity} pièces d'or (Total: {self.player.inventory.gold.quantity})")
-            else:
-                print("❗ Vous devez d'abord trouver la pelle (Shovel). Revenez ensuite pour récupérer l'or.")
-                return False
-        elif obj.name == "Gemmes" or obj.name == "Gems":
-            self.player.inventory.gems.quantity += obj.quantity
-            print(f"💎 Gem ramassée! (Total: {self.player.inventory.gems.quantity})")
-        elif obj.name == "Clés" or obj.name == "Keys":
-            self.player.inventory.keys.quantity += obj.quantity
-            print(f"🔑 Key ramassée! (Total: {self.player.inventory.keys.quantity})")
-        elif obj.name == "Dés" or obj.name == "Dice":
-            self.player.inventory.dice.quantity += obj.quantity
-            print(f"🎲 Dice ramassé! (Total: {self.player.inventory.dice.quantity})")
-        elif obj.name == "Shovel" or obj.name == "Pelle":
-            added = self.player.inventory.add_permanent_item(obj)
-            if added:
-                print(f"🛠️  Vous avez trouvé la pelle! ({obj.name})")
-            else:
-                print(f"ℹ️  Vous possédez déjà l'objet permanent: {obj.name}")
-        elif obj.name == "Marteau" or obj.name == "Hammer":
-            added = self.player.inventory.add_permanent_item(obj)
-            if added:
-                print(f"🔨 Vous avez trouvé le marteau! ({obj.name})")
-            else:
-                print(f"ℹ️  Vous possédez déjà l'objet permanent: {obj.name}")
-        else:
-            print(f"✅ {obj.name} ramassé!")
-        
-        return True
+        """Ajoute un objet à l'inventaire du joueur (table des règles par type d'objet)"""
+        return collect_item(self.player, obj)
     
+    def goal_distance(self) -> Optional[int]:
+        """Pas minimaux pour atteindre l'Antechamber depuis la position du joueur (None = inaccessible)"""
+        return self.reachability.distance(self.player.position)
+
+    def is_goal_reachable(self) -> bool:
+        """L'Antechamber peut-elle encore être atteinte (résultat mémorisé tant que le manoir ne change pas)"""
+        return self.goal_distance() is not None
+
+    def offer_odds(self, direction: Optional[Direction] = None) -> Optional[OfferOdds]:
+        """
+        Probabilités exactes de l'offre qu'ouvrirait la porte direction (défaut:
+        selected_direction), avec les mêmes filtres que generate_room_selection
+        None si la case visée est hors du manoir ou déjà occupée
+        """
+        direction = direction or self.selected_direction
+        if direction is None:
+            return None
+        target = self.manor.get_adjacent_position(self.player.position, direction)
+        if target is None or self.manor.get_room(*target) is not None:
+            return None
+        forbidden_mask = border_mask(target[0], target[1], self.manor.height, self.manor.width)
+        required_bit = DIRECTION_BITS[direction.opposite()]
+        if not len(self.catalog.find_unused(required_bit)):
+            required_bit = 0  # Aucune pièce compatible: offre sans cette restriction
+        return self.draw_odds.offer(required_bit, forbidden_mask, avoid_mask=self.manor.wall_mask(*target))
+
+    def is_hopeless(self) -> bool:
+        """
+        Partie perdue d'avance: les pas restants, plus tous les pas encore
+        récupérables (nourriture, effets, magasins), ne couvrent pas la distance
+        minimale jusqu'à l'Antechamber
+        """
+        return self.step_bound.is_hopeless(self.player.position, self.player.inventory.counts[STEPS])
+
+    def buy_shop_item(self) -> bool:
+        """Achète l'objet du magasin de la pièce actuelle"""
+        current_room = self.manor.get_room(*self.player.position)
+        if current_room is None:
+            return False
+        bought = current_room.buy_shop_item(self.player)
+        if bought:
+            self.manor.refresh_cell(*self.player.position)
+        return bought
+
+    def set_event_sink(self, sink: EventSink) -> EventSink:
+        """Change la destination des messages (partie, joueur, inventaire, manoir); retourne l'ancienne"""
+        previous = self.events
+        self.events = self.player.events = self.player.inventory.events = self.manor.events = sink
+        return previous
+
+    def state_hash(self) -> int:
+        """
+        Hachage de Zobrist de l'état: manoir (tenu à jour à chaque modification),
+        inventaire, position, phase de jeu et pièces proposées
+        """
+        key = (self.manor.zobrist ^ inventory_key(self.player.inventory)
+               ^ zobrist_key("position", self.player.position)
+               ^ zobrist_key("phase", self.state.value, self.selected_direction, self.selected_object_index))
+        for room in self.pending_room_selection:
+            key ^= zobrist_key("offer", room.name, room.door_mask)
+        return key
+
+    def snapshot(self) -> GameSnapshot:
+        """
+        Sauvegarde l'état de la partie (recherche arborescente, prévisualisation)
+        Coût proportionnel aux pièces placées, sans copie profonde.
+        """
+        manor = self.manor.getstate()
+        rooms = [room for _, room in manor[0]]
+        rooms.extend(self.pending_room_selection)
+        return GameSnapshot(
+            state=self.state,
+            selected_direction=self.selected_direction,
+            pending_room_selection=tuple(self.pending_room_selection),
+            room_objects=tuple(self.room_objects),
+            selected_object_index=self.selected_object_index,
+            used_room_names=frozenset(self.used_room_names),
+            position=self.player.position,
+            inventory=self.player.inventory.getstate(),
+            manor=manor,
+            rooms=tuple((room, room.getstate()) for room in rooms),
+            catalog=self.catalog.getstate(),
+            rng=self.rng.getstate(),
+            modifiers=(self._copy_modifiers("probability_modifiers"),
+                       self._copy_modifiers("item_probability_modifiers"))
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Remet la partie exactement dans l'état d'un snapshot (réutilisable plusieurs fois)"""
+        self.state = snapshot.state
+        self.selected_direction = snapshot.selected_direction
+        self.pending_room_selection = list(snapshot.pending_room_selection)
+        self.room_objects = list(snapshot.room_objects)
+        self.selected_object_index = snapshot.selected_object_index
+        self.used_room_names = set(snapshot.used_room_names)
+        self.player.position = snapshot.position
+        self.player.inventory.setstate(snapshot.inventory)
+        self.manor.setstate(snapshot.manor)
+        for room, state in snapshot.rooms:
+            room.setstate(state)
+        self.catalog.setstate(snapshot.catalog, (room for room, _ in snapshot.rooms))
+        self.rng.setstate(snapshot.rng)
+        for name, modifiers in zip(("probability_modifiers", "item_probability_modifiers"), snapshot.modifiers):
+            if modifiers is None:
+                self.__dict__.pop(name, None)
+            else:
+                setattr(self, name, dict(modifiers))
+
+    def _copy_modifiers(self, name: str) -> Optional[dict]:
+        """Copie d'un dictionnaire de modificateurs posé par un effet de pièce (None si absent)"""
+        modifiers = getattr(self, name, None)
+        return dict(modifiers) if modifiers is not None else None
+
     def exit_room_interaction(self):
         """Sort du mode interaction"""
         self.state = GameState.PLAYING
         self.room_objects = []
         self.selected_object_index = 0
-        print("🚪 Sortie du mode interaction")
+        self.events.emit("interaction_ended", "🚪 Sortie du mode interaction")
 
     def is_game_over(self) -> bool:
         """Vérifie si le jeu est terminé"""
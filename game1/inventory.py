@@ -5,100 +5,196 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from array import array
+from typing import Optional, Tuple
+
 from items.consumables import Steps, Gold, Gems, Keys, Dice
 from items.permanent import PermanentItem
+from core.game_objects import ItemKind
+from core.item_rules import ITEM_RULES, RESOURCE, STEPS, GOLD, GEMS, KEYS, DICE
+from game1.events import EventSink, ConsoleSink
+
+# Ressources de départ (selon la capture d'écran): 70 pas, 0 or, 2 gemmes, 0 clé, 0 dé
+START_COUNTS = (70, 0, 2, 0, 0)
+
+_RESOURCE_TYPES = (Steps, Gold, Gems, Keys, Dice)
+_RESOURCE_NAMES = tuple(cls().name for cls in _RESOURCE_TYPES)
+
+
+class ResourceView:
+    """
+    Vue sur un compteur de l'inventaire, compatible avec l'ancien ConsumableItem
+    (inventory.steps.quantity += 3, inventory.keys.consume(1), ...)
+    """
+
+    __slots__ = ("_counts", "_index", "item_type")
+
+    def __init__(self, counts: array, index: int, item_type: type):
+        self._counts = counts
+        self._index = index
+        self.item_type = item_type
+
+    @property
+    def quantity(self) -> int:
+        return self._counts[self._index]
+
+    @quantity.setter
+    def quantity(self, value: int) -> None:
+        self._counts[self._index] = value
+
+    @property
+    def name(self) -> str:
+        return _RESOURCE_NAMES[self._index]
+
+    @property
+    def kind(self) -> ItemKind:
+        return self.item_type.kind
+
+    def consume(self, amount: int = 1) -> bool:
+        """Consomme une quantité du compteur"""
+        if self._counts[self._index] >= amount:
+            self._counts[self._index] -= amount
+            return True
+        return False
+
+    def __str__(self):
+        return self.name
+
+
+def _resource(index: int) -> property:
+    """Propriété renvoyant la vue d'un compteur"""
+    item_type = _RESOURCE_TYPES[index]
+    return property(lambda self: ResourceView(self.counts, index, item_type),
+                    doc=f"Vue sur le compteur {_RESOURCE_NAMES[index]}")
 
 
 class Inventory:
-    """Gestion de l'inventaire du joueur"""
+    """
+    Gestion de l'inventaire du joueur
+    Les cinq ressources sont des entiers dans un tableau compact (counts, indices
+    STEPS..DICE de core.item_rules); les objets permanents possédés forment un
+    masque de bits indexé par ItemKind (test de possession en O(1)).
+    """
+
+    __slots__ = ("events", "counts", "permanent_mask", "permanent_items", "food_items")
 
-    def __init__(self):
-        # Ressources consommables (selon la capture d'écran)
-        self.steps = Steps(70)  # 70 pas au départ
-        self.gold = Gold(0)     # 0 or au départ
-        self.gems = Gems(2)     # 2 gemmes au départ
-        self.keys = Keys(0)     # 0 clés au départ
-        self.dice = Dice(0)     # 0 dés au départ
+    steps = _resource(STEPS)
+    gold = _resource(GOLD)
+    gems = _resource(GEMS)
+    keys = _resource(KEYS)
+    dice = _resource(DICE)
 
-        # Objets permanents
+    def __init__(self, events: Optional[EventSink] = None):
+        self.events = events if events is not None else ConsoleSink()
+
+        # Ressources consommables
+        self.counts = array("l", START_COUNTS)
+
+        # Objets permanents (objets pour l'affichage, bits 1 << kind.value pour les tests)
+        self.permanent_mask = 0
         self.permanent_items = []
 
         # Nourriture
         self.food_items = []
 
+    def clone(self, events: Optional[EventSink] = None) -> 'Inventory':
+        """Copie indépendante (compteurs et listes copiés, objets permanents partagés)"""
+        other = Inventory.__new__(Inventory)
+        other.events = events if events is not None else self.events
+        other.counts = array("l", self.counts)
+        other.permanent_mask = self.permanent_mask
+        other.permanent_items = list(self.permanent_items)
+        other.food_items = list(self.food_items)
+        return other
+
+    def getstate(self) -> tuple:
+        """État de l'inventaire (Game.snapshot); les objets permanents sont partagés"""
+        return (array("l", self.counts), self.permanent_mask, tuple(self.permanent_items), tuple(self.food_items))
+
+    def setstate(self, state: tuple) -> None:
+        """Restaure un état retourné par getstate (sur place: les vues restent valides)"""
+        counts, self.permanent_mask, permanent_items, food_items = state
+        self.counts[:] = counts
+        self.permanent_items = list(permanent_items)
+        self.food_items = list(food_items)
+
+    def state_key(self) -> Tuple[int, ...]:
+        """Clé hachable de l'état (compteurs + objets permanents possédés)"""
+        return (*self.counts, self.permanent_mask)
+
     def spend_gold(self, amount: int) -> bool:
         """Dépense de l'or"""
-        if self.gold.quantity >= amount:
-            self.gold.quantity -= amount
+        if self.counts[GOLD] >= amount:
+            self.counts[GOLD] -= amount
             return True
-        print("Pas assez d'or !")
+        self.events.emit("not_enough_gold", "Pas assez d'or !")
         return False
 
     def add_item(self, item):
         """Ajoute un objet consommable à l'inventaire"""
-        if hasattr(item, 'quantity'):
-            # C'est un objet consommable
-            if item.name == "Steps" or item.name == "Pas":
-                self.steps.quantity += item.quantity
-            elif item.name == "Gold" or item.name == "Or":
-                self.gold.quantity += item.quantity
-            elif item.name == "Gems" or item.name == "Gemmes":
-                self.gems.quantity += item.quantity
-            elif item.name == "Keys" or item.name == "Clés":
-                self.keys.quantity += item.quantity
-            elif item.name == "Dice" or item.name == "Dés":
-                self.dice.quantity += item.quantity
+        rule = ITEM_RULES.get(item.kind)
+        if rule is not None and rule.action == RESOURCE:
+            self.counts[rule.resource] += item.quantity
             return True
         return False
 
     def add_permanent_item(self, item: PermanentItem):
-        """Ajoute un objet permanent à l'inventaire"""
-        if item not in self.permanent_items:
-            self.permanent_items.append(item)
-            print(f"✓ Objet permanent ajouté: {item.name}")
-            return True
-        return False
+        """Ajoute un objet permanent à l'inventaire (un seul exemplaire par type)"""
+        if item.kind is not None:
+            bit = 1 << item.kind.value
+            if self.permanent_mask & bit:
+                return False
+            self.permanent_mask |= bit
+        elif item in self.permanent_items:
+            return False
+        self.permanent_items.append(item)
+        self.events.emit("permanent_item_added", "✓ Objet permanent ajouté: {item.name}", item=item)
+        return True
 
     def has_permanent_item(self, item_name: str) -> bool:
-        """Vérifie si le joueur possède un objet permanent"""
+        """Vérifie si le joueur possède un objet permanent (par nom affiché)"""
         return any(item.name == item_name for item in self.permanent_items)
 
+    def has_permanent_kind(self, kind: ItemKind) -> bool:
+        """Vérifie si le joueur possède un objet permanent de ce type (O(1))"""
+        return bool(self.permanent_mask >> kind.value & 1)
+
     def spend_key(self) -> bool:
         """Utilise une clé"""
-        if self.keys.quantity > 0:
-            self.keys.quantity -= 1
+        if self.counts[KEYS] > 0:
+            self.counts[KEYS] -= 1
             return True
         return False
 
     def spend_gems(self, amount: int) -> bool:
         """Dépense des gemmes"""
-        if self.gems.quantity >= amount:
-            self.gems.quantity -= amount
+        if self.counts[GEMS] >= amount:
+            self.counts[GEMS] -= amount
             return True
         return False
 
     def spend_dice(self) -> bool:
         """Utilise un dé"""
-        if self.dice.quantity > 0:
-            self.dice.quantity -= 1
+        if self.counts[DICE] > 0:
+            self.counts[DICE] -= 1
             return True
         return False
 
     def use_steps(self, amount: int = 1) -> bool:
         """Utilise des pas (pour se déplacer)"""
-        if self.steps.quantity >= amount:
-            self.steps.quantity -= amount
+        if self.counts[STEPS] >= amount:
+            self.counts[STEPS] -= amount
             return True
         return False
 
     def __str__(self):
         """Affichage de l'inventaire"""
         result = "\n=== INVENTAIRE ===\n"
-        result += f"👣 Pas: {self.steps.quantity}\n"
-        result += f"💰 Or: {self.gold.quantity}\n"
-        result += f"💎 Gemmes: {self.gems.quantity}\n"
-        result += f"🔑 Clés: {self.keys.quantity}\n"
-        result += f"🎲 Dés: {self.dice.quantity}\n"
+        result += f"👣 Pas: {self.counts[STEPS]}\n"
+        result += f"💰 Or: {self.counts[GOLD]}\n"
+        result += f"💎 Gemmes: {self.counts[GEMS]}\n"
+        result += f"🔑 Clés: {self.counts[KEYS]}\n"
+        result += f"🎲 Dés: {self.counts[DICE]}\n"
 
         if self.permanent_items:
             result += "\n🛠️  Objets permanents:\n"
@@ -1,39 +1,122 @@
 """
 Classe Manor - Représente la grille du manoir
+Taille quelconque. Les pièces placées sont indexées par position (rooms):
+parcours, hachage et sauvegarde coûtent en proportion des pièces placées.
+Petits manoirs: grille de listes en plus, pour get_room; grands manoirs
+(SPARSE_CELLS cases et plus, ou sparse=True): dictionnaire seul.
 """
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 from core.game_objects import Direction
+from core.doors import DIRECTION_BITS, DOOR_BITS, DOOR_DELTAS, OPPOSITE_BITS
+from game1.events import EventSink, ConsoleSink
+from game1.zobrist import room_key
+
+if TYPE_CHECKING:
+    from rooms.room import Room
+
+# Nombre de cases à partir duquel la grille de listes n'est plus allouée (100 x 100 et plus)
+SPARSE_CELLS = 10_000
+
+# Pour exits(), dans l'ordre de Direction: (direction, bit de porte, bit de la porte d'en face, déplacement)
+_EXIT_SIDES = tuple((direction, DIRECTION_BITS[direction], OPPOSITE_BITS[DIRECTION_BITS[direction]],
+                     DOOR_DELTAS[DIRECTION_BITS[direction]]) for direction in Direction)
 
 
 class Manor:
     """Grille du manoir où les pièces sont placées"""
 
-    def __init__(self, width: int = 5, height: int = 10):
+    def __init__(self, width: int = 5, height: int = 10, events: Optional[EventSink] = None,
+                 sparse: Optional[bool] = None):
+        """sparse: sans grille de listes (None = selon la taille, voir SPARSE_CELLS)"""
+        self.events = events if events is not None else ConsoleSink()
         self.width = width
         self.height = height
-        # Grille de pièces (None = case vide)
-        self.grid = [[None for _ in range(width)] for _ in range(height)]
+        if sparse is None:
+            sparse = width * height >= SPARSE_CELLS
+        # Pièces placées par position (ordre de placement)
+        self.rooms: Dict[Tuple[int, int], 'Room'] = {}
+        # Grille de pièces (None = case vide; None pour un manoir creux)
+        self.grid = None if sparse else [[None for _ in range(width)] for _ in range(height)]
+        # Hachage de Zobrist de la grille (XOR des contributions des cases, voir game1/zobrist.py)
+        self.zobrist = 0
+        self._cell_keys: Dict[Tuple[int, int], int] = {}
+        # Incrémenté à chaque changement d'occupation (caches dérivés de la grille)
+        self.version = 0
 
     def get_room(self, row: int, col: int):
         """Récupère une pièce à une position donnée"""
         if 0 <= row < self.height and 0 <= col < self.width:
-            return self.grid[row][col]
+            grid = self.grid
+            return grid[row][col] if grid is not None else self.rooms.get((row, col))
         return None
 
+    @property
+    def sparse(self) -> bool:
+        return self.grid is None
+
+    def wall_mask(self, row: int, col: int) -> int:
+        """Portes de la case (row, col) qui buteraient contre une pièce voisine sans porte en face"""
+        mask = 0
+        for bit in DOOR_BITS:
+            d_row, d_col = DOOR_DELTAS[bit]
+            neighbour = self.get_room(row + d_row, col + d_col)
+            if neighbour is not None and not neighbour.door_mask & OPPOSITE_BITS[bit]:
+                mask |= bit
+        return mask
+
     def place_room(self, room, row: int, col: int) -> bool:
         """Place une pièce dans la grille"""
         if 0 <= row < self.height and 0 <= col < self.width:
-            if self.grid[row][col] is None:
-                self.grid[row][col] = room
+            if (row, col) not in self.rooms:
+                self.rooms[(row, col)] = room
+                if self.grid is not None:
+                    self.grid[row][col] = room
                 room.position = (row, col)
-                print(f"Pièce '{room.name}' placée en ({row}, {col})")
+                self.refresh_cell(row, col)
+                self.version += 1
+                self.events.emit("room_placed", "Pièce '{room.name}' placée en ({row}, {col})",
+                                 room=room, row=row, col=col)
                 return True
         return False
 
+    def refresh_cell(self, row: int, col: int) -> None:
+        """Met à jour le hachage après une modification de la case (objets, portes, achat) en O(1)"""
+        room = self.rooms.get((row, col))
+        key = room_key(row, col, room) if room is not None else 0
+        self.zobrist ^= self._cell_keys.get((row, col), 0) ^ key
+        self._cell_keys[(row, col)] = key
+
+    def recompute_zobrist(self) -> int:
+        """Recalcule le hachage depuis zéro (vérification)"""
+        zobrist = 0
+        for (row, col), room in self.rooms.items():
+            zobrist ^= room_key(row, col, room)
+        return zobrist
+
+    def getstate(self) -> tuple:
+        """
+        Pièces placées ((position, pièce) dans l'ordre de placement) et hachage
+        (les pièces sont partagées, voir Game.snapshot)
+        """
+        return tuple(self.rooms.items()), self.zobrist, tuple(self._cell_keys.items())
+
+    def setstate(self, state: tuple) -> None:
+        """Restaure une occupation retournée par getstate"""
+        rooms, self.zobrist, cell_keys = state
+        grid = self.grid
+        if grid is not None:
+            for row, col in self.rooms:
+                grid[row][col] = None
+            for (row, col), room in rooms:
+                grid[row][col] = room
+        self.rooms = dict(rooms)
+        self._cell_keys = dict(cell_keys)
+        self.version += 1
+
     def get_adjacent_position(self, position: Tuple[int, int], direction: Direction) -> Optional[Tuple[int, int]]:
         """Calcule la position adjacente dans une direction"""
         row, col = position
@@ -75,12 +158,88 @@ class Manor:
 
         return True
 
+    # Interface commune avec BitboardManor (game1/bitboard.py): mêmes résultats, même ordre
+
+    def exits(self, position: Tuple[int, int]) -> List[Tuple[Direction, Tuple[int, int], bool]]:
+        """
+        Portes de la pièce en position menant à une case de la grille (ordre de Direction):
+        (direction, case voisine, case libre). Une case occupée n'est retenue que si
+        sa pièce a une porte en face.
+        """
+        room = self.get_room(*position)
+        if room is None:
+            return []
+        row, col = position
+        door_mask = room.door_mask
+        exits = []
+        for direction, bit, opposite_bit, (d_row, d_col) in _EXIT_SIDES:
+            if not door_mask & bit:
+                continue
+            r, c = row + d_row, col + d_col
+            if not (0 <= r < self.height and 0 <= c < self.width):
+                continue
+            dest_room = self.get_room(r, c)
+            if dest_room is None:
+                exits.append((direction, (r, c), True))
+            elif dest_room.door_mask & opposite_bit:
+                exits.append((direction, (r, c), False))
+        return exits
+
+    def free_neighbours(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Cases vides derrière une porte de la pièce en position, où placer une pièce (ordre ligne par ligne)"""
+        return sorted(target for _, target, free in self.exits(position) if free)
+
+    def frontier(self) -> List[Tuple[int, int]]:
+        """Cases vides derrière une porte d'au moins une pièce placée (ordre ligne par ligne)"""
+        cells = set()
+        for (row, col), room in self.rooms.items():
+            for bit in DOOR_BITS:
+                if room.door_mask & bit:
+                    d_row, d_col = DOOR_DELTAS[bit]
+                    r, c = row + d_row, col + d_col
+                    if 0 <= r < self.height and 0 <= c < self.width and (r, c) not in self.rooms:
+                        cells.add((r, c))
+        return sorted(cells)
+
+    def reachable_cells(self, position: Tuple[int, int], unlocked_only: bool = False) -> List[Tuple[int, int]]:
+        """
+        Pièces accessibles depuis position par des portes présentes des deux côtés
+        (ordre ligne par ligne). unlocked_only: sans franchir de porte verrouillée non ouverte
+        """
+        if self.get_room(*position) is None:
+            return []
+        seen = {position}
+        stack = [position]
+        while stack:
+            row, col = stack.pop()
+            room = self.rooms[(row, col)]
+            for direction in Direction:
+                bit = DIRECTION_BITS[direction]
+                if not room.door_mask & bit:
+                    continue
+                if unlocked_only:
+                    door = room.get_door(direction)
+                    if door is not None and door.lock_level and not door.is_opened:
+                        continue
+                d_row, d_col = DOOR_DELTAS[bit]
+                target = (row + d_row, col + d_col)
+                dest_room = self.get_room(*target)
+                if (target not in seen and dest_room is not None
+                        and dest_room.door_mask & OPPOSITE_BITS[bit]):
+                    seen.add(target)
+                    stack.append(target)
+        return sorted(seen)
+
     def __str__(self):
-        """Affichage du manoir"""
+        """Affichage du manoir (manoir creux: rectangle englobant des pièces placées)"""
         result = "\n=== MANOIR ===\n"
-        for row in range(self.height):
-            for col in range(self.width):
-                room = self.grid[row][col]
+        rows, cols = range(self.height), range(self.width)
+        if self.sparse and self.rooms:
+            rows = range(min(r for r, _ in self.rooms), max(r for r, _ in self.rooms) + 1)
+            cols = range(min(c for _, c in self.rooms), max(c for _, c in self.rooms) + 1)
+        for row in rows:
+            for col in cols:
+                room = self.rooms.get((row, col))
                 if room:
                     result += f"[{room.name[:4]:4s}]"
                 else:
@@ -0,0 +1,125 @@
+"""
+Itinéraires entre pièces déjà placées (déplacement automatique, "aller à")
+Une arête relie deux pièces voisines qui ont chacune la porte vers l'autre.
+Coût d'un itinéraire: pas dépensés (1 par pièce, perte moyenne d'une pièce
+rouge en plus) + KEY_WEIGHT par clé utilisée. Une porte déjà ouverte, non
+verrouillée ou crochetable (niveau 1 avec le kit) ne coûte pas de clé;
+sinon il faut une clé, dans la limite des clés possédées.
+Les itinéraires depuis la position du joueur sont calculés une fois
+(Dijkstra sur (case, clés utilisées)) puis conservés tant que le manoir
+(pièces, portes, objets: hachage de Zobrist) et les clés ne changent pas.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import heapq
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from core.doors import MASK_DIRECTIONS, DIRECTION_BITS
+from core.game_objects import Direction, ItemKind, RoomColor
+
+if TYPE_CHECKING:
+    from game1.manor import Manor
+    from game1.inventory import Inventory
+
+# Pas perdus en moyenne en entrant dans une pièce rouge (tirage 2-10 de Game.try_move)
+RED_ROOM_EXPECTED_LOSS = 6
+# Valeur d'une clé en pas: entre deux itinéraires, une clé économisée vaut ce détour
+KEY_WEIGHT = 3
+
+GOAL_ROOM = "Antechamber"
+
+
+class Route(NamedTuple):
+    """Itinéraire vers une case: directions successives, pas estimés et clés utilisées"""
+    directions: Tuple[Direction, ...]
+    steps: int
+    keys: int
+
+
+class PathFinder:
+    """Plus courts chemins pondérés depuis la position du joueur"""
+
+    def __init__(self, manor: 'Manor'):
+        self.manor = manor
+        self._key: Optional[tuple] = None
+        # (case, clés utilisées) -> (coût, pas, case précédente, clés avant, direction)
+        self._tree: Dict[Tuple[Tuple[int, int], int], tuple] = {}
+        self._best: Dict[Tuple[int, int], Tuple[int, int]] = {}  # case -> meilleur état (case, clés)
+
+    def _door_keys(self, room, direction: Direction, lockpick: bool) -> int:
+        """Clés nécessaires pour franchir la porte de room vers direction (Door.open)"""
+        door = room.get_door(direction)
+        if door is None or door.is_opened or door.lock_level == 0:
+            return 0
+        if door.lock_level == 1 and lockpick:
+            return 0
+        return 1
+
+    def _build(self, start: Tuple[int, int], keys: int, lockpick: bool) -> None:
+        """Dijkstra depuis start; une case peut être atteinte avec différents nombres de clés"""
+        manor = self.manor
+        tree = {(start, 0): (0, 0, None, None, None)}
+        best: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        queue = [(0, 0, start)]
+        while queue:
+            cost, used, cell = heapq.heappop(queue)
+            entry = tree[(cell, used)]
+            if entry[0] != cost:
+                continue
+            if cell not in best:
+                best[cell] = (cell, used)
+            room = manor.get_room(*cell)
+            if cell != start and room.name == GOAL_ROOM:
+                continue  # Entrer dans l'Antechamber termine la partie
+            for direction in MASK_DIRECTIONS[room.door_mask]:
+                neighbour = manor.get_adjacent_position(cell, direction)
+                if neighbour is None:
+                    continue
+                target = manor.get_room(*neighbour)
+                if target is None or not target.door_mask & DIRECTION_BITS[direction.opposite()]:
+                    continue
+                spend = self._door_keys(room, direction, lockpick)
+                if used + spend > keys:
+                    continue
+                steps = 1 + (RED_ROOM_EXPECTED_LOSS if target.color == RoomColor.RED else 0)
+                state = (neighbour, used + spend)
+                new_cost = cost + steps + KEY_WEIGHT * spend
+                known = tree.get(state)
+                if known is None or new_cost < known[0]:
+                    tree[state] = (new_cost, entry[1] + steps, cell, used, direction)
+                    heapq.heappush(queue, (new_cost, used + spend, neighbour))
+        self._tree = tree
+        self._best = best
+
+    def _refresh(self, start: Tuple[int, int], inventory: 'Inventory') -> None:
+        keys = inventory.keys.quantity
+        lockpick = inventory.has_permanent_kind(ItemKind.LOCKPICK_KIT)
+        key = (start, self.manor.zobrist, keys, lockpick)
+        if key != self._key:
+            self._build(start, keys, lockpick)
+            self._key = key
+
+    def route(self, start: Tuple[int, int], target: Tuple[int, int], inventory: 'Inventory') -> Optional[Route]:
+        """Itinéraire le moins coûteux de start à target (None si aucune pièce placée n'y mène)"""
+        self._refresh(start, inventory)
+        state = self._best.get(target)
+        if state is None:
+            return None
+        cost, steps, _, _, _ = self._tree[state]
+        directions: List[Direction] = []
+        keys = state[1]
+        while True:
+            _, _, previous, used, direction = self._tree[state]
+            if previous is None:
+                break
+            directions.append(direction)
+            state = (previous, used)
+        directions.reverse()
+        return Route(tuple(directions), steps, keys)
+
+    def reachable_cells(self, start: Tuple[int, int], inventory: 'Inventory') -> List[Tuple[int, int]]:
+        """Cases placées atteignables depuis start avec les clés actuelles"""
+        self._refresh(start, inventory)
+        return list(self._best)
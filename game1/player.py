@@ -6,28 +6,32 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from game1.inventory import Inventory
-from typing import Tuple
+from core.item_rules import STEPS
+from game1.events import EventSink, ConsoleSink
+from typing import Optional, Tuple
 
 
 class Player:
     """Classe représentant le joueur"""
 
-    def __init__(self):
-        self.inventory = Inventory()
+    def __init__(self, events: Optional[EventSink] = None):
+        self.events = events if events is not None else ConsoleSink()
+        self.inventory = Inventory(events=self.events)
         self.position = (0, 0)  # Position (row, col) dans le manoir
 
     def is_alive(self) -> bool:
         """Vérifie si le joueur est toujours vivant (a des pas)"""
-        return self.inventory.steps.quantity > 0
+        return self.inventory.counts[STEPS] > 0
 
     def move(self, new_position: Tuple[int, int]) -> bool:
         """Déplace le joueur vers une nouvelle position"""
         if self.inventory.use_steps(1):
             self.position = new_position
-            print(f"Déplacement vers {new_position}. Pas restants: {self.inventory.steps.quantity}")
+            self.events.emit("player_moved", "Déplacement vers {position}. Pas restants: {steps}",
+                             position=new_position, steps=self.inventory.steps.quantity)
             return True
         else:
-            print("Plus de pas disponibles!")
+            self.events.emit("out_of_steps", "Plus de pas disponibles!")
             return False
 
     def can_afford_room(self, gem_cost: int) -> bool:
@@ -0,0 +1,384 @@
+"""
+Accessibilité de l'objectif (Antechamber) et distance minimale en pas
+Relaxation optimiste du jeu: une case vide peut recevoir n'importe quelle
+pièce encore au catalogue compatible avec sa position, dans l'une de ses
+orientations (portes vers l'extérieur interdites, porte d'entrée exigée si
+le catalogue en a une), comme dans Game.generate_room_selection; verrous et coût en gemmes sont
+ignorés. Si l'objectif est inaccessible dans cette relaxation, il l'est
+dans la partie: la partie est perdue.
+
+Distance depuis une case: recherche A* (heuristique de Manhattan, chaque
+entrée coûte au moins un pas) sur les pièces placées et les cases vides
+effectivement parcourues, sans tableau de la taille de la grille: le coût
+suit la longueur du chemin, pas la surface du manoir. Résultats mémorisés par
+case jusqu'au prochain changement de la grille ou du catalogue (compteurs version).
+
+StepBound s'en sert pour reconnaître une partie perdue d'avance (pas
+restants, nourriture et effets encore disponibles compris).
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import heapq
+from operator import is_
+from typing import Dict, FrozenSet, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from core.doors import DOOR_BITS, DOOR_DELTAS, OPPOSITE_BITS, border_mask
+from core.game_objects import GameObject, InteractiveObject, RoomColor
+from core.item_rules import FOOD, ITEM_RULES, LOOT_RULES, RESOURCE, STEPS, rule_for
+
+if TYPE_CHECKING:
+    from game1.manor import Manor
+    from rooms.catalog import RoomCatalog
+
+UNREACHABLE = None
+
+# Pas minimaux pour entrer dans une pièce (placement ou déplacement); pièce rouge: 2 pas perdus au moins
+ENTER_COST = 1
+RED_ROOM_PENALTY = 2
+
+# État de recherche (ligne, colonne, côté): pièce placée, ou case vide entrée en se déplaçant vers DOOR_BITS[côté]
+PLACED = 4
+
+# Bit de porte -> indice dans DOOR_BITS
+_SIDES = {bit: k for k, bit in enumerate(DOOR_BITS)}
+
+# (masques des pièces non utilisées, portes interdites) -> table ReachabilityMap._exit_masks
+_EXIT_MASKS = {}
+
+
+class ReachabilityMap:
+    """Distances minimales (en pas) d'une pièce placée jusqu'à l'objectif"""
+
+    def __init__(self, manor: 'Manor', catalog: 'RoomCatalog', goal: Tuple[int, int] = (0, 2)):
+        self.manor = manor
+        self.catalog = catalog
+        self.goal = goal
+        self._version: Optional[tuple] = None
+        self._unused_masks: FrozenSet[int] = frozenset()
+        self._distances: Dict[Tuple[int, int], Optional[int]] = {}
+
+    @staticmethod
+    def _exit_masks(masks: FrozenSet[int], forbidden: int) -> Tuple[int, ...]:
+        """
+        Case vide: côté d'entrée k -> portes de sortie d'une pièce non utilisée
+        ayant la porte d'entrée et aucune porte interdite
+        """
+        exits = []
+        for entry in DOOR_BITS:
+            required = OPPOSITE_BITS[entry]
+            if not any(mask & required for mask in masks):
+                required = 0  # Le jeu lève alors l'exigence de porte d'entrée
+            union = 0
+            for mask in masks:
+                if mask & required == required and not mask & forbidden:
+                    union |= mask
+            exits.append(union)
+        return tuple(exits)
+
+    def _empty_exits(self, row: int, col: int, side: int) -> int:
+        manor = self.manor
+        forbidden = border_mask(row, col, manor.height, manor.width)
+        key = (self._unused_masks, forbidden)
+        exits = _EXIT_MASKS.get(key)
+        if exits is None:
+            exits = _EXIT_MASKS[key] = self._exit_masks(self._unused_masks, forbidden)
+        return exits[side]
+
+    def _prepare(self) -> None:
+        """Données propres à une version de la grille et du catalogue"""
+        self._unused_masks = frozenset(self.catalog.unused_door_masks())
+
+    def _is_target(self, row: int, col: int, side: int) -> bool:
+        return side == PLACED and (row, col) == self.goal
+
+    # Poids de l'heuristique de Manhattan (0: recherche de Dijkstra)
+    heuristic_weight = ENTER_COST
+
+    def _search(self, position: Tuple[int, int]) -> Optional[int]:
+        """
+        A* depuis la pièce placée en position jusqu'au premier état cible
+        Heuristique: heuristic_weight x distance de Manhattan jusqu'à l'objectif
+        (cohérente: chaque entrée coûte au moins ENTER_COST)
+        """
+        manor = self.manor
+        rooms = manor.rooms
+        height, width = manor.height, manor.width
+        goal_row, goal_col = self.goal
+        weight = self.heuristic_weight
+        is_target = self._is_target
+        empty_exits = self._empty_exits
+        row, col = position
+        if (row, col) not in rooms:
+            return UNREACHABLE
+        start = (row, col, PLACED)
+        best = {start: 0}
+        # À f égal, l'état le plus avancé d'abord (plateaux des grandes zones vides)
+        heap = [(weight * (abs(row - goal_row) + abs(col - goal_col)), 0, start)]
+        while heap:
+            _, distance, state = heapq.heappop(heap)
+            distance = -distance
+            if best[state] != distance:
+                continue
+            row, col, side = state
+            if is_target(row, col, side):
+                return distance
+            exits = rooms[(row, col)].door_mask if side == PLACED else empty_exits(row, col, side)
+            for bit in DOOR_BITS:
+                if not exits & bit:
+                    continue
+                d_row, d_col = DOOR_DELTAS[bit]
+                r, c = row + d_row, col + d_col
+                if not (0 <= r < height and 0 <= c < width):
+                    continue
+                room = rooms.get((r, c))
+                if room is None:
+                    following, candidate = (r, c, _SIDES[bit]), distance + ENTER_COST
+                elif room.door_mask & OPPOSITE_BITS[bit]:
+                    candidate = distance + ENTER_COST
+                    if room.color is RoomColor.RED:
+                        candidate += RED_ROOM_PENALTY
+                    following = (r, c, PLACED)
+                else:
+                    continue
+                known = best.get(following)
+                if known is None or candidate < known:
+                    best[following] = candidate
+                    heapq.heappush(heap, (candidate + weight * (abs(r - goal_row) + abs(c - goal_col)),
+                                          -candidate, following))
+        return UNREACHABLE
+
+    def _refresh(self) -> None:
+        version = (self.manor.version, self.catalog.version)
+        if version != self._version:
+            self._distances.clear()
+            self._prepare()
+            self._version = version
+
+    def distance(self, position: Tuple[int, int]) -> Optional[int]:
+        """Pas minimaux depuis la pièce placée en position jusqu'à l'objectif (None = inaccessible)"""
+        self._refresh()
+        position = tuple(position)
+        if position not in self._distances:
+            self._distances[position] = self._search(position)
+        return self._distances[position]
+
+    def is_reachable(self, position: Tuple[int, int]) -> bool:
+        return self.distance(position) is not UNREACHABLE
+
+
+def object_step_gain(obj: GameObject, rules=ITEM_RULES) -> int:
+    """Pas que peut rapporter un objet (nourriture, pas, contenu d'un contenant)"""
+    if isinstance(obj, InteractiveObject):
+        # Contenu compté comme butin (LOOT_RULES): au moins autant que ramassé objet par objet
+        return sum(object_step_gain(item, LOOT_RULES) for item in obj.contents)
+    rule = rule_for(obj, rules)
+    if rule.action == FOOD:
+        return obj.steps_restored
+    if rule.action == RESOURCE and rule.resource == STEPS:
+        return obj.quantity
+    return 0
+
+
+def _step_effect(effect) -> int:
+    """Pas rendus par un effet de pièce (ResourceEffect sur 'steps'), 0 sinon"""
+    effect = getattr(effect, "effect", effect)  # ConditionalEffect: effet encapsulé
+    if getattr(effect, "resource_type", None) == "steps":
+        return max(effect.amount, 0)
+    return 0
+
+
+def is_refuel_effect(effect) -> bool:
+    """Effet rendant des pas à chaque entrée: gain non borné (aller-retours)"""
+    return _step_effect(effect) > 0 and getattr(effect, "on_enter_flag", False)
+
+
+def room_step_gain(definition, objects, shop_purchased: bool = False) -> int:
+    """Pas que peut encore rapporter une pièce: objets, achat au magasin, effet unique"""
+    gain = sum(object_step_gain(obj) for obj in objects)
+    shop = definition.shop_item
+    if shop and not shop_purchased:
+        gain += object_step_gain(shop['item']())
+    if not is_refuel_effect(definition.effect):
+        gain += _step_effect(definition.effect)
+    return gain
+
+
+_DEFINITION_GAINS = {}
+
+# Dernières colonnes de pas calculées: (définitions, pas rapportés, effet rendant des pas à chaque entrée)
+_STEP_COLUMNS: Optional[tuple] = None
+
+
+def definition_step_gain(definition) -> int:
+    """room_step_gain d'une pièce neuve (mis en cache: les définitions sont figées)"""
+    cached = _DEFINITION_GAINS.get(id(definition))
+    if cached is None or cached[0] is not definition:
+        cached = _DEFINITION_GAINS[id(definition)] = (definition, room_step_gain(definition, definition.objects))
+    return cached[1]
+
+
+class StepSourceMap(ReachabilityMap):
+    """
+    Distances jusqu'à la source de pas la plus proche: pièce placée qui peut
+    encore en rapporter, ou case vide où une telle pièce du catalogue peut être posée
+    Une pièce vidée depuis le dernier calcul reste une cible: distance sous-estimée, borne valide.
+    """
+
+    def step_columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (pas rapportés, effet rendant des pas à chaque entrée) par ligne du catalogue
+        Partagées par les parties jouées sur les mêmes définitions
+        """
+        global _STEP_COLUMNS
+        definitions = self.catalog.definitions
+        cached = _STEP_COLUMNS
+        if cached is None or len(cached[0]) != len(definitions) or not all(map(is_, cached[0], definitions)):
+            gains = np.array([definition_step_gain(definition) for definition in definitions], dtype=np.int64)
+            refuel = np.array([is_refuel_effect(definition.effect) for definition in definitions], dtype=bool)
+            cached = _STEP_COLUMNS = (tuple(definitions), gains, refuel)
+        return cached[1], cached[2]
+
+    def _source_masks(self) -> FrozenSet[int]:
+        """Masques de portes possibles des pièces sources encore au catalogue (colonnes de la table)"""
+        table = self.catalog.table
+        gains, refuel = self.step_columns()
+        keep = table.unused() & ((gains > 0) | refuel)
+        shapes = int(np.bitwise_or.reduce(table.shapes[keep])) if keep.any() else 0
+        return frozenset(mask for mask in range(16) if shapes >> mask & 1)
+
+    def _prepare(self) -> None:
+        # Sources placées, masques sources et gain du manoir calculés à la demande
+        super()._prepare()
+        self._sources: Dict[Tuple[int, int], bool] = {}
+        self._source_mask_set: Optional[FrozenSet[int]] = None
+        self._empty_targets: Dict[Tuple[int, int], bool] = {}
+        self._board_known = False
+        self._board_gain: Optional[int] = None
+
+    def board_gain(self) -> Optional[int]:
+        """Pas que peuvent encore rapporter les pièces placées (None = non borné)"""
+        self._refresh()
+        if not self._board_known:
+            gain = 0
+            for room in self.manor.rooms.values():
+                if is_refuel_effect(room.effect):
+                    gain = None
+                    break
+                gain += room_step_gain(room.definition, room.objects, room.shop_purchased)
+            self._board_gain, self._board_known = gain, True
+        return self._board_gain
+
+    def _is_target(self, row: int, col: int, side: int) -> bool:
+        if side == PLACED:
+            target = self._sources.get((row, col))
+            if target is None:
+                room = self.manor.rooms[(row, col)]
+                target = self._sources[(row, col)] = bool(
+                    is_refuel_effect(room.effect) or room_step_gain(room.definition, room.objects, room.shop_purchased))
+            return target
+        # Case vide entrée par ce côté: une pièce source peut-elle y être posée?
+        forbidden = border_mask(row, col, self.manor.height, self.manor.width)
+        key = (forbidden, side)
+        target = self._empty_targets.get(key)
+        if target is None:
+            if self._source_mask_set is None:
+                self._source_mask_set = self._source_masks()
+            required = OPPOSITE_BITS[DOOR_BITS[side]]
+            if not any(mask & required for mask in self._unused_masks):
+                required = 0  # Exigence de porte d'entrée levée (voir _exit_masks)
+            target = self._empty_targets[key] = any(mask & required == required and not mask & forbidden
+                                                    for mask in self._source_mask_set)
+        return target
+
+    heuristic_weight = 0  # Cibles multiples (pièces et cases vides): recherche de Dijkstra
+
+
+class StepBound:
+    """
+    Partie perdue d'avance, une fois les pas restants sous la distance de
+    Manhattan jusqu'à l'Antechamber, dans l'un des cas suivants:
+      - l'Antechamber est inaccessible;
+      - les pas restants ne couvrent ni la distance jusqu'à l'Antechamber,
+        ni celle jusqu'à la source de pas la plus proche;
+      - même en récupérant tous les pas encore disponibles (manoir et
+        catalogue), la distance n'est pas couverte. Une pièce qui rend des
+        pas à chaque entrée (gain non borné) exclut ce dernier cas.
+    Jamais vrai pour une partie encore gagnable. À grille et case fixées, la
+    partie est perdue dès que les pas tombent sous un seuil: le seuil est
+    calculé une fois par (version du manoir, version du catalogue, case), puis
+    chaque test coûte une comparaison. Le test de Manhattan évite tout calcul
+    tant que le joueur a assez de pas; au-delà, la source de pas la plus proche
+    suffit le plus souvent, et l'Antechamber n'est cherchée qu'une fois par version.
+    """
+
+    def __init__(self, reachability: ReachabilityMap):
+        self.reachability = reachability
+        self.sources = StepSourceMap(reachability.manor, reachability.catalog)
+        self._version: Optional[tuple] = None
+        self._thresholds: Dict[Tuple[int, int], float] = {}
+        self._goal_reachable = False
+
+    def catalog_gain(self) -> Optional[int]:
+        """Pas que peuvent rapporter les pièces encore au catalogue (None = non borné)"""
+        gains, refuel = self.sources.step_columns()
+        unused = self.reachability.catalog.table.unused()
+        if refuel[unused].any():
+            return None
+        return int(gains[unused].sum())
+
+    def board_gain(self) -> Optional[int]:
+        """Pas que peuvent encore rapporter les pièces placées (None = non borné)"""
+        return self.sources.board_gain()
+
+    def is_hopeless(self, position: Tuple[int, int], steps: int) -> bool:
+        """
+        Vrai si la victoire est impossible depuis position avec steps pas
+        (il faut arriver vivant, avec au moins 1 pas, dans l'Antechamber ou à une source de pas)
+        """
+        goal_row, goal_col = self.reachability.goal
+        if steps > abs(position[0] - goal_row) + abs(position[1] - goal_col):
+            return False  # Cas courant, en O(1): la distance de Manhattan ne suffit pas à conclure
+        reachability = self.reachability
+        version = (reachability.manor.version, reachability.catalog.version)
+        if version != self._version:
+            self._thresholds.clear()
+            self._goal_reachable = False
+            self._version = version
+        position = tuple(position)
+        threshold = self._thresholds.get(position)
+        if threshold is None:
+            threshold = self._thresholds[position] = self.threshold(position)
+        return steps <= threshold
+
+    def goal_reachable(self, position: Tuple[int, int]) -> bool:
+        """
+        Antechamber accessible depuis position. Les déplacements du joueur sont
+        réversibles dans la relaxation: une réponse positive vaut pour toute la
+        version de la grille (au pire, une partie perdue est reconnue plus tard)
+        """
+        if not self._goal_reachable:
+            self._goal_reachable = self.reachability.distance(position) is not UNREACHABLE
+        return self._goal_reachable
+
+    def threshold(self, position: Tuple[int, int]) -> float:
+        """
+        Plus grand nombre de pas pour lequel la partie est perdue depuis position
+        (inf: toujours), valable sous la distance de Manhattan jusqu'à l'Antechamber,
+        donc sous la distance jusqu'à l'Antechamber. Perdue avec s pas si
+        l'Antechamber est inaccessible, si s <= distance jusqu'à la source la plus
+        proche, ou si s + pas récupérables <= distance jusqu'à l'Antechamber
+        Une pièce vidée depuis le calcul garde ses gains: seuil sous-estimé, borne valide.
+        """
+        source = self.sources.distance(position)
+        if source is UNREACHABLE or not self.goal_reachable(position):
+            return float('inf')
+        threshold = source
+        catalog = self.catalog_gain()
+        board = None if catalog is None else self.board_gain()
+        if board is not None:
+            threshold = max(threshold, self.reachability.distance(position) - board - catalog)
+        return threshold
@@ -0,0 +1,89 @@
+"""
+Classe GameRandom - Générateur aléatoire propre à une partie
+Chaque sous-système tire ses nombres dans son propre flux, dérivé de la
+graine de la partie: modifier un sous-système ne décale pas les tirages
+des autres (nombres aléatoires communs pour comparer des politiques).
+"""
+import random
+from typing import Dict, Optional
+
+
+def _lazy_stream(name: str) -> property:
+    """Sous-flux créé au premier accès (un Mersenne Twister occupe ~2,5 Ko)"""
+    def get(self) -> random.Random:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = self._streams[name] = self.stream(name)
+        return stream
+    return property(get)
+
+
+class GameRandom:
+    """Graine d'une partie et ses sous-flux aléatoires indépendants"""
+
+    __slots__ = ("seed", "_streams")
+
+    # Noms des sous-flux (un random.Random par sous-système)
+    STREAMS = ("rooms", "rotations", "loot", "locks", "rolls")
+
+    rooms = _lazy_stream("rooms")
+    rotations = _lazy_stream("rotations")
+    loot = _lazy_stream("loot")
+    locks = _lazy_stream("locks")
+    rolls = _lazy_stream("rolls")
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        seed: graine de la partie (None = graine tirée au hasard)
+        Sous-flux:
+          rooms     - tirage des pièces proposées
+          rotations - rotations des pièces du catalogue
+          loot      - contenu des coffres, casiers, trous et dispersions
+          locks     - niveaux de verrouillage des portes
+          rolls     - pertes de pas (rouge) et gains d'or (violet)
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 63)
+        self.seed = seed
+        self._streams: Dict[str, random.Random] = {}
+
+    def stream(self, name: str) -> random.Random:
+        """Crée un flux indépendant dérivé de la graine et d'un nom"""
+        return random.Random(f"{self.seed}:{name}")
+
+    def reseed_streams(self, seed: int) -> None:
+        """
+        Remplace tous les sous-flux par des flux dérivés d'une autre graine
+        (anticipation: simuler des tirages plausibles sans lire les vrais tirages
+        à venir). La graine de la partie ne change pas: setstate remet les vrais flux.
+        """
+        self._streams = {name: random.Random(f"{seed}:{name}") for name in self.STREAMS}
+
+    def override_streams(self, stream: random.Random) -> Dict[str, random.Random]:
+        """
+        Tous les sous-flux tirent dans stream (énumération exacte des tirages par
+        un solveur); retourne les flux remplacés, à remettre par restore_streams
+        """
+        previous = self._streams
+        self._streams = {name: stream for name in self.STREAMS}
+        return previous
+
+    def restore_streams(self, streams: Dict[str, random.Random]) -> None:
+        """Remet les flux retournés par override_streams"""
+        self._streams = streams
+
+    def getstate(self) -> tuple:
+        """Retourne l'état de tous les sous-flux (None = flux pas encore utilisé)"""
+        return tuple(self._streams[name].getstate() if name in self._streams else None
+                     for name in self.STREAMS)
+
+    def setstate(self, state: tuple) -> None:
+        """Restaure l'état de tous les sous-flux"""
+        for name, stream_state in zip(self.STREAMS, state):
+            if stream_state is None:
+                self._streams.pop(name, None)  # Sera recréé depuis la graine
+            else:
+                getattr(self, name).setstate(stream_state)
+
+    def __repr__(self):
+        return f"GameRandom(seed={self.seed})"
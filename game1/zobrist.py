@@ -0,0 +1,53 @@
+"""
+Hachage de Zobrist de l'état d'une partie
+Chaque caractéristique (pièce et rotation d'une case, état d'une porte,
+quantité d'une ressource, position...) reçoit une clé de 64 bits; l'état
+est le XOR des clés de ses caractéristiques. Une modification retire
+l'ancienne clé et ajoute la nouvelle: mise à jour en O(1).
+Les clés sont dérivées de la caractéristique (BLAKE2b), donc identiques
+d'un processus à l'autre.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import hashlib
+from typing import Dict, Hashable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from game1.inventory import Inventory
+    from rooms.room import Room
+
+_KEYS: Dict[Hashable, int] = {}
+
+
+def zobrist_key(*feature: Hashable) -> int:
+    """Clé 64 bits d'une caractéristique, calculée une fois puis mise en cache"""
+    key = _KEYS.get(feature)
+    if key is None:
+        digest = hashlib.blake2b(repr(feature).encode("utf-8"), digest_size=8).digest()
+        key = _KEYS[feature] = int.from_bytes(digest, "little")
+    return key
+
+
+def room_key(row: int, col: int, room: 'Room') -> int:
+    """
+    Contribution d'une case occupée: pièce et rotation (masque de portes),
+    objets restants, achat effectué, état de chaque porte
+    """
+    key = zobrist_key("room", row, col, room.name, room.door_mask)
+    if room.objects:
+        key ^= zobrist_key("objects", row, col, tuple(obj.kind or obj.name for obj in room.objects))
+    if room.shop_purchased:
+        key ^= zobrist_key("purchased", row, col)
+    for door in room.doors.values():
+        key ^= zobrist_key("door", row, col, door.direction, door.lock_level, door.is_opened)
+    return key
+
+
+def inventory_key(inventory: 'Inventory') -> int:
+    """Contribution de l'inventaire: 5 compteurs + objets permanents possédés (O(1))"""
+    key = zobrist_key("permanent", inventory.permanent_mask)
+    for resource, count in enumerate(inventory.counts):
+        key ^= zobrist_key("count", resource, count)
+    return key
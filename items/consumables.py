@@ -5,17 +5,23 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.game_objects import ConsumableItem
+from core.game_objects import ConsumableItem, ItemKind
 from core.game_objects import GameObject
 
 class Steps(ConsumableItem):
     """Pas du joueur"""
+    __slots__ = ()
+    kind = ItemKind.STEPS
+
     def __init__(self, quantity: int = 70):
         super().__init__("Pas", quantity)
 
 
 class Gold(ConsumableItem):
     """Pièces d'or"""
+    __slots__ = ()
+    kind = ItemKind.GOLD
+
     def __init__(self, quantity: int = 0):
         super().__init__("Gold", quantity)
  
@@ -23,17 +29,26 @@ class Gold(ConsumableItem):
 
 class Gems(ConsumableItem):
     """Gemmes"""
+    __slots__ = ()
+    kind = ItemKind.GEMS
+
     def __init__(self, quantity: int = 2):
         super().__init__("Gemmes", quantity)
 
 
 class Keys(ConsumableItem):
     """Clés"""
+    __slots__ = ()
+    kind = ItemKind.KEYS
+
     def __init__(self, quantity: int = 0):
         super().__init__("Clés", quantity)
 
 
 class Dice(ConsumableItem):
     """Dés pour retirer des pièces"""
+    __slots__ = ()
+    kind = ItemKind.DICE
+
     def __init__(self, quantity: int = 0):
         super().__init__("Dés", quantity)
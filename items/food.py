@@ -5,34 +5,49 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.game_objects import Food
+from core.game_objects import Food, ItemKind
 
 
 class Apple(Food):
     """Pomme - restaure 2 pas"""
+    __slots__ = ()
+    kind = ItemKind.APPLE
+
     def __init__(self):
         super().__init__("Pomme", 2)
 
 
 class Banana(Food):
     """Banane - restaure 3 pas"""
+    __slots__ = ()
+    kind = ItemKind.BANANA
+
     def __init__(self):
         super().__init__("Banane", 3)
 
 
 class Cake(Food):
     """Gâteau - restaure 10 pas"""
+    __slots__ = ()
+    kind = ItemKind.CAKE
+
     def __init__(self):
         super().__init__("Gâteau", 10)
 
 
 class Sandwich(Food):
     """Sandwich - restaure 15 pas"""
+    __slots__ = ()
+    kind = ItemKind.SANDWICH
+
     def __init__(self):
         super().__init__("Sandwich", 15)
 
 
 class Meal(Food):
     """Repas - restaure 25 pas"""
+    __slots__ = ()
+    kind = ItemKind.MEAL
+
     def __init__(self):
         super().__init__("Repas", 25)
\ No newline at end of file
@@ -6,8 +6,8 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import random
-from typing import TYPE_CHECKING
-from core.game_objects import InteractiveObject
+from typing import Optional, TYPE_CHECKING
+from core.game_objects import InteractiveObject, ItemKind
 from items.consumables import Gold, Keys, Gems, Dice
 from items.food import Apple, Banana, Cake, Sandwich
 
@@ -17,141 +17,154 @@ if TYPE_CHECKING:
 
 class Chest(InteractiveObject):
     """Coffre contenant des objets"""
+    __slots__ = ()
+    kind = ItemKind.CHEST
 
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        """rng: flux aléatoire du butin (ex: game.rng.loot), module random par défaut"""
         # Génère un contenu aléatoire pour le coffre
-        contents = random.choice([[Gems(1)], [Keys(1)], [Apple()]])
+        contents = (rng or random).choice([[Gems(1)], [Keys(1)], [Apple()]])
         super().__init__("Coffre", contents)
 
-    def can_open(self, player):
-        return player.inventory.keys > 0 or any(obj.name == "Marteau" for obj in player.inventory.permanent_items)
-    def _generate_contents(self) -> list:
+    def _generate_contents(self, rng: Optional[random.Random] = None) -> list:
         """Génère un contenu aléatoire pour le coffre"""
+        rng = rng or random
         possible_contents = [
-            Gold(random.randint(5, 20)),
-            Keys(random.randint(1, 2)),
+            Gold(rng.randint(5, 20)),
+            Keys(rng.randint(1, 2)),
             Gems(1),
             Dice(1),
             Apple(),
             Banana()
         ]
         # Choisit 1-3 objets aléatoires
-        num_items = random.randint(1, 3)
-        return random.sample(possible_contents, num_items)
+        num_items = rng.randint(1, 3)
+        return rng.sample(possible_contents, num_items)
 
     def can_open(self, player: 'Player') -> bool:
         """Peut ouvrir avec une clé ou un marteau"""
-        has_hammer = player.inventory.has_permanent_item("Marteau")
+        has_hammer = player.inventory.has_permanent_kind(ItemKind.HAMMER)
         has_key = player.inventory.keys.quantity > 0
 
         if has_hammer:
-            print("Vous utilisez le marteau pour ouvrir le coffre.")
+            player.events.emit("tool_used", "Vous utilisez le marteau pour ouvrir le coffre.", item=self)
             return True
         elif has_key:
             player.inventory.keys.consume(1)
-            print("Vous utilisez une clé pour ouvrir le coffre.")
+            player.events.emit("key_used", "Vous utilisez une clé pour ouvrir le coffre.", item=self)
             return True
         else:
-            print("Vous avez besoin d'une clé ou d'un marteau pour ouvrir ce coffre.")
+            player.events.emit("key_required", "Vous avez besoin d'une clé ou d'un marteau pour ouvrir ce coffre.",
+                               item=self)
             return False
 
 
 class DigSpot(InteractiveObject):
     """Endroit où creuser"""
+    __slots__ = ()
+    kind = ItemKind.DIG_SPOT
 
-    def __init__(self):
-        contents = self._generate_contents()
+    def __init__(self, rng: Optional[random.Random] = None):
+        """rng: flux aléatoire du butin (ex: game.rng.loot), module random par défaut"""
+        contents = self._generate_contents(rng)
         super().__init__("Endroit où creuser", contents)
 
-    def can_open(self, player):
-        # vérifie si le joueur possède une pelle
-        return any(obj.name == "Pelle" for obj in player.inventory.permanent_items)
-    def _generate_contents(self) -> list:
+    def _generate_contents(self, rng: Optional[random.Random] = None) -> list:
         """Génère un contenu aléatoire pour le trou"""
-        if random.random() < 0.3:  # 30% de chance de ne rien trouver
+        rng = rng or random
+        if rng.random() < 0.3:  # 30% de chance de ne rien trouver
             return []
 
         possible_contents = [
-            Gold(random.randint(3, 15)),
+            Gold(rng.randint(3, 15)),
             Keys(1),
             Gems(1),
             Apple(),
             Banana()
         ]
-        num_items = random.randint(1, 2)
-        return random.sample(possible_contents, num_items)
+        num_items = rng.randint(1, 2)
+        return rng.sample(possible_contents, num_items)
 
     def can_open(self, player: 'Player') -> bool:
         """Nécessite une pelle"""
-        if player.inventory.has_permanent_item("Pelle"):
-            print("Vous utilisez la pelle pour creuser.")
+        if player.inventory.has_permanent_kind(ItemKind.SHOVEL):
+            player.events.emit("tool_used", "Vous utilisez la pelle pour creuser.", item=self)
             return True
         else:
-            print("Vous avez besoin d'une pelle pour creuser ici.")
+            player.events.emit("tool_required", "Vous avez besoin d'une pelle pour creuser ici.", item=self)
             return False
 
 
 class Locker(InteractiveObject):
     """Casier dans le vestiaire"""
+    __slots__ = ()
+    kind = ItemKind.LOCKER
 
-    def __init__(self):
-        contents = self._generate_contents()
+    def __init__(self, rng: Optional[random.Random] = None):
+        """rng: flux aléatoire du butin (ex: game.rng.loot), module random par défaut"""
+        contents = self._generate_contents(rng)
         super().__init__("Casier", contents)
 
-    def _generate_contents(self) -> list:
+    def _generate_contents(self, rng: Optional[random.Random] = None) -> list:
         """Génère un contenu aléatoire pour le casier"""
-        if random.random() < 0.2:  # 20% de chance de ne rien trouver
+        rng = rng or random
+        if rng.random() < 0.2:  # 20% de chance de ne rien trouver
             return []
 
         possible_contents = [
-            Gold(random.randint(5, 25)),
+            Gold(rng.randint(5, 25)),
             Keys(1),
             Gems(1),
             Dice(1),
             Cake(),
             Sandwich()
         ]
-        num_items = random.randint(1, 2)
-        return random.sample(possible_contents, num_items)
+        num_items = rng.randint(1, 2)
+        return rng.sample(possible_contents, num_items)
 
     def can_open(self, player: 'Player') -> bool:
         """Nécessite toujours une clé"""
         if player.inventory.keys.quantity > 0:
             player.inventory.keys.consume(1)
-            print("Vous utilisez une clé pour ouvrir le casier.")
+            player.events.emit("key_used", "Vous utilisez une clé pour ouvrir le casier.", item=self)
             return True
         else:
-            print("Vous avez besoin d'une clé pour ouvrir ce casier.")
+            player.events.emit("key_required", "Vous avez besoin d'une clé pour ouvrir ce casier.", item=self)
             return False
 
 
 class LockedChest(InteractiveObject):
     """Coffret verrouillé nécessitant un marteau pour être ouvert - Comme Gold avec Shovel"""
+    __slots__ = ()
+    kind = ItemKind.LOCKED_CHEST
 
-    def __init__(self, contents: list = None):
+    def __init__(self, contents: list = None, rng: Optional[random.Random] = None):
+        """rng: flux aléatoire du butin (ex: game.rng.loot), module random par défaut"""
         if contents is None:
-            contents = self._generate_contents()
+            contents = self._generate_contents(rng)
         super().__init__("Coffret Verrouillé", contents)
 
-    def _generate_contents(self) -> list:
+    def _generate_contents(self, rng: Optional[random.Random] = None) -> list:
         """Génère 2-3 objets aléatoires pour le coffret"""
+        rng = rng or random
         possible_contents = [
-            Gold(random.randint(10, 30)),
-            Keys(random.randint(1, 2)),
+            Gold(rng.randint(10, 30)),
+            Keys(rng.randint(1, 2)),
             Gems(1),
             Dice(1),
             Cake(),
             Sandwich()
         ]
-        num_items = random.randint(2, 3)  # 2-3 objets
-        return random.sample(possible_contents, num_items)
+        num_items = rng.randint(2, 3)  # 2-3 objets
+        return rng.sample(possible_contents, num_items)
 
     def can_open(self, player: 'Player') -> bool:
         """Nécessite un marteau pour ouvrir - Comme Gold nécessite Shovel"""
-        if player.inventory.has_permanent_item("Marteau"):
-            print("🔨 Vous utilisez le marteau pour briser le coffret verrouillé!")
+        if player.inventory.has_permanent_kind(ItemKind.HAMMER):
+            player.events.emit("tool_used", "🔨 Vous utilisez le marteau pour briser le coffret verrouillé!", item=self)
             return True
         else:
-            print("🔒 Ce coffret est solidement verrouillé. Vous avez besoin d'un marteau pour l'ouvrir.")
-            print("   Revenez quand vous aurez trouvé un marteau!")
+            player.events.emit("tool_required",
+                               "🔒 Ce coffret est solidement verrouillé. Vous avez besoin d'un marteau pour l'ouvrir.\n"
+                               "   Revenez quand vous aurez trouvé un marteau!", item=self)
             return False
\ No newline at end of file
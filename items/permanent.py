@@ -3,11 +3,13 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.game_objects import PermanentItem
+from core.game_objects import PermanentItem, ItemKind
 
 
 class Shovel(PermanentItem):
     """Shovel (pelle) - objet permanent unique"""
+    __slots__ = ()
+    kind = ItemKind.SHOVEL
 
     def __init__(self):
         # Nom en anglais pour correspondre aux vérifications du code
@@ -20,6 +22,8 @@ class Shovel(PermanentItem):
 
 class Hammer(PermanentItem):
     """Marteau pour ouvrir les coffres"""
+    __slots__ = ()
+    kind = ItemKind.HAMMER
 
     def __init__(self):
         super().__init__("Marteau", "Permet d'ouvrir les coffres sans clé")
@@ -31,6 +35,8 @@ class Hammer(PermanentItem):
 
 class LockpickKit(PermanentItem):
     """Kit de crochetage pour ouvrir les portes niveau 1"""
+    __slots__ = ()
+    kind = ItemKind.LOCKPICK_KIT
 
     def __init__(self):
         super().__init__("Kit de crochetage", "Permet d'ouvrir les portes verrouillées sans clé")
@@ -42,6 +48,8 @@ class LockpickKit(PermanentItem):
 
 class MetalDetector(PermanentItem):
     """Détecteur de métaux"""
+    __slots__ = ()
+    kind = ItemKind.METAL_DETECTOR
 
     def __init__(self):
         super().__init__("Détecteur de métaux", "Augmente les chances de trouver clés et or")
@@ -53,6 +61,8 @@ class MetalDetector(PermanentItem):
 
 class RabbitFoot(PermanentItem):
     """Patte de lapin"""
+    __slots__ = ()
+    kind = ItemKind.RABBIT_FOOT
 
     def __init__(self):
         super().__init__("Patte de lapin", "Augmente les chances de trouver des objets")
@@ -1,790 +1,433 @@
 """
 Catalogue de pièces disponibles pour le jeu
+Les pièces sont décrites dans rooms/data/rooms.json (voir rooms/loader.py)
+Les filtres en masse (index des portes, arbres de tirage, poids) lisent la
+table en colonnes rooms/table.py; les listes door_masks/rotations servent aux
+lectures ponctuelles.
+Une pièce à plusieurs portes est proposée dans l'orientation qui convient à
+la case visée (la plus proche, dans le sens horaire, de sa rotation tirée au
+départ): l'index des portes tient compte de ses 4 orientations. Une impasse
+(une seule porte) garde sa rotation tirée: elle ne convient pas à toutes les cases.
 """
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import random
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
-from rooms.room import Room
-from core.game_objects import Direction, RoomColor
-from rooms.effects import *
-from items.consumables import Steps, Gold, Gems, Keys, Dice
-from items.food import *
-from items.interactive import *
-from items.permanent import *
+import numpy as np
+
+from rooms.room import Room, RoomDefinition
+from rooms.room_index import DoorSignatureIndex, RoomSet
+from rooms.sampler import FenwickSampler
+from rooms.table import CatalogTable, COLOR_CODES
+from rooms.loader import load_room_definitions
+from core.game_objects import RoomColor
+from core.doors import ROTATION_TABLE, fitting_rotation
+
+if TYPE_CHECKING:
+    from game1.rng import GameRandom
 
 
 class RoomCatalog:
-    """Catalogue contenant toutes les pièces disponibles"""
+    """
+    Catalogue d'une partie: définitions partagées (construites une fois par
+    processus) + état propre à la partie (rotations, pièces retirées/utilisées).
+    Les instances Room ne sont créées qu'au tirage ou au placement.
+    """
 
-    def __init__(self):
-        self.available_rooms: List[Room] = []
-        self._initialize_rooms()
+    # Pièces jamais tournées (la rotation désaligne leur image)
+    NO_ROTATION_ROOMS = ("Entrance Hall", "Antechamber", "Patio", "Master Bedroom")
 
-        # Apply a random rotation (0/90/180/270) to each room to increase directional variety.
-        # Skip rooms where rotation causes visual misalignment with their images.
-        no_rotation_rooms = ["Entrance Hall", "Antechamber", "Patio", "Master Bedroom"]
-        for room in self.available_rooms:
-            if room.name in no_rotation_rooms:
-                continue
-            # Only rotate if the room has doors defined
-            if not getattr(room, 'doors_directions', None):
-                continue
-            deg = random.choice([0, 90, 180, 270])
-            if deg != 0:
-                room.rotate(deg)
-                # Optional: annotate the name with rotation for debugging (kept commented)
-                # room.name = f"{room.name} (rot{deg})"
-
-    def _initialize_rooms(self):
-        """Initialise le catalogue avec toutes les pièces du jeu - Correspondant aux images"""
-
-        # ============ PIÈCES AVEC IMAGES ============
-
-        # 1. Library (blue)
-        self.available_rooms.append(Room(
-            name="Library",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1)]
-        ))
-        
-        # 2. Dining Room (blue)
-        self.available_rooms.append(Room(
-            name="Dining Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.EAST, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Gems(1), Keys(1), Dice(1), Cake(),Gold(40),Shovel()]
-        ))
-
-        # 3. Mail Room (blue)
-        self.available_rooms.append(Room(
-            name="Mail Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Shovel()]
-        ))
-
-        # 4. Music Room (blue)
-        self.available_rooms.append(Room(
-            name="Music Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Gold(4),Shovel()]
-        ))
-
-        # 5. Garage (blue)
-        self.available_rooms.append(Room(
-            name="Garage",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.SOUTH],
-            gem_cost=1,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 6. Courtyard (green)
-        self.available_rooms.append(Room(
-            name="Courtyard",
-            color=RoomColor.GREEN,
-            doors=[Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 7. Observatory (blue) - Porte Ouest verrouillée
-        self.available_rooms.append(Room(
-            name="Observatory",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.SOUTH],
-            gem_cost=1,
-            rarity=2,
-            objects=[Gems(1), Gold(40)],
-        ))
-
-        # 8. Rumpus Room (blue)
-        self.available_rooms.append(Room(
-            name="Rumpus Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.NORTH, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 9. Security (blue)
-        self.available_rooms.append(Room(
-            name="Security",
-            color=RoomColor.BLUE,
-            doors=[Direction.EAST, Direction.WEST, Direction.SOUTH],
-            gem_cost=1,
-            rarity=1,
-            objects=[Keys(1)]
-        ))
-
-        # ============ PIÈCES VERTES (jardins) ============
-
-        # 10. Veranda (green) - Walk-in Closet avec objets à ramasser
-        self.available_rooms.append(Room(
-            name="Veranda",
-            color=RoomColor.GREEN,
-            doors=[Direction.SOUTH, Direction.NORTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Gems(1), Keys(1), Dice(1), Cake(),Gold(40)]
-        ))
-
-        # ============ PIÈCES SPÉCIALES ============
-
-        # 11. The Pool
-        self.available_rooms.append(Room(
-            name="The Pool",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=2,
-            rarity=2,
-            objects=[]
-        ))
-
-        # 12. Commissary (yellow)
-        self.available_rooms.append(Room(
-            name="Commissary",
-            color=RoomColor.YELLOW,
-            doors=[Direction.WEST, Direction.SOUTH],
-            gem_cost=1,
-            rarity=1,
-            objects=[Apple(), Banana()],
-            shop_item={'item': Shovel, 'name': 'Pelle (Shovel)', 'price': 10}
-        ))
-
-        # ============ PIÈCES ROUGES ============
-
-        # 13. Chapel (red)
-        self.available_rooms.append(Room(
-            name="Chapel",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=2,
-            rarity=2,
-            objects=[],
-            effect=ResourceEffect(
-                "Restaure 15 pas en entrant",
-                'steps',
-                15,
-                on_enter=True
-            )
-        ))
-
-        # 14. Antechamber (blue) - Point d'arrivée
-        self.available_rooms.append(Room(
-            name="Antechamber",
-            color=RoomColor.BLUE,
-            doors=[Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=0,
-            rarity=0,
-            objects=[]
-        ))
-
-        # 15. Entrance Hall (blue) - Point de départ
-        # Note: Créé automatiquement par get_entrance() si nécessaire
-
-        # ============ NOUVELLES PIÈCES BLEUES ============
-
-        # 16. Attic (blue) - Coffret verrouillé caché
-        self.available_rooms.append(Room(
-            name="Attic",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1), Dice(1), LockedChest([Gold(20), Gems(1), Keys(1)])]
-        ))
-
-        
-
-        # 18. Coat Check (blue)
-        self.available_rooms.append(Room(
-            name="Coat Check",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1)]
-        ))
-
-        # 19. Conference Room (blue) - Porte Est verrouillée
-        self.available_rooms.append(Room(
-            name="Conference Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.EAST, Direction.SOUTH],
-            gem_cost=1,
-            rarity=2,
-            objects=[Keys(2), Dice(1)],
-        ))
-
-        # 20. Drawing Room (blue)
-        self.available_rooms.append(Room(
-            name="Drawing Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.SOUTH, Direction.EAST],
-            gem_cost=1,
-            rarity=1,
-            objects=[Apple()]
-        ))
-
-        # 21. Freezer (blue)
-        self.available_rooms.append(Room(
-            name="Freezer",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake(), Sandwich()]
-        ))
-
-        # 22. Gallery (blue) - Coffret précieux
-        self.available_rooms.append(Room(
-            name="Gallery",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH,Direction.NORTH],
-            gem_cost=1,
-            rarity=2,
-            objects=[Gems(1), LockedChest([Gold(30), Gems(2), Dice(2)])]
-        ))
-
-        # 23. Parlor (blue)
-        self.available_rooms.append(Room(
-            name="Parlor",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1)]
-        ))
-
-        # 24. Pump Room (blue)
-        self.available_rooms.append(Room(
-            name="Pump Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.WEST, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 25. Room 8 (blue)
-        self.available_rooms.append(Room(
-            name="Room 8",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH,Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1)]
-        ))
-
-        # 26. Rotunda (blue)
-        self.available_rooms.append(Room(
-            name="Rotunda",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH,Direction.WEST],
-            gem_cost=1,
-            rarity=2,
-            objects=[Gems(1), Keys(1)]
-        ))
-
-        # 27. Spare Room (blue)
-        self.available_rooms.append(Room(
-            name="Spare Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH,Direction.NORTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 28. Storeroom (blue) - Coffret dans l'entrepôt
-        self.available_rooms.append(Room(
-            name="Storeroom",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(2), LockedChest([Gold(15), Dice(1), Cake()])]
-        ))
-
-        # 29. The Foundation (blue) - Marteau dans les fondations
-        self.available_rooms.append(Room(
-            name="The Foundation",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH,Direction.EAST,Direction.WEST],
-            gem_cost=1,
-            rarity=2,
-            objects=[Gems(1), Hammer()]
-        ))
-
-        # 30. Utility Closet (blue) - Coffret dans le placard
-        self.available_rooms.append(Room(
-            name="Utility Closet",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1), LockedChest([Gold(25), Keys(2), Gems(1)])]
-        ))
-
-        # 31. Walk-in Closet (blue)
-        self.available_rooms.append(Room(
-            name="Walk-in Closet",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake(), Dice(1)]
-        ))
-
-        # 32. Workshop (blue) - Marteau dans l'atelier
-        self.available_rooms.append(Room(
-            name="Workshop",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH, Direction.NORTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1), Hammer()]
-        ))
-
-        
-        # 34. Boiler Room (blue) - Marteau dans la chaufferie + Coffret
-        self.available_rooms.append(Room(
-            name="Boiler Room",
-            color=RoomColor.BLUE,
-            doors=[Direction.SOUTH,Direction.WEST,Direction.EAST],
-            gem_cost=0,
-            rarity=1,
-            objects=[Hammer(), LockedChest([Gold(18), Dice(1), Keys(1)])]
-        ))
-
-        # ============ NOUVELLES PIÈCES VERTES (JARDINS) ============
-
-        # 35. Morning Room (green)
-        self.available_rooms.append(Room(
-            name="Morning Room",
-            color=RoomColor.GREEN,
-            doors=[Direction.SOUTH, Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[Gems(1), Apple()]
-        ))
-
-       
-
-        # 37. Terrace (green)
-        self.available_rooms.append(Room(
-            name="Terrace",
-            color=RoomColor.GREEN,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Gems(1), Keys(1)]
-        ))
-
-        # 38. Greenhouse (green/yellow/violet)
-        self.available_rooms.append(Room(
-            name="Greenhouse",
-            color=RoomColor.GREEN,
-            doors=[Direction.SOUTH],
-            gem_cost=1,
-            rarity=2,
-            objects=[Gems(2), Apple(), Banana()]
-        ))
-
-        # ============ NOUVELLES PIÈCES ORANGE (COULOIRS) ============
-
-        # 39. Corridor (orange)
-        self.available_rooms.append(Room(
-            name="Corridor",
-            color=RoomColor.ORANGE,
-            doors=[Direction.NORTH, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 40. East Wing Hall (orange)
-        self.available_rooms.append(Room(
-            name="East Wing Hall",
-            color=RoomColor.ORANGE,
-            doors=[Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 41. Foyer (orange)
-        self.available_rooms.append(Room(
-            name="Foyer",
-            color=RoomColor.ORANGE,
-            doors=[Direction.NORTH, Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 42. Hallway (orange)
-        self.available_rooms.append(Room(
-            name="Hallway",
-            color=RoomColor.ORANGE,
-            doors=[Direction.WEST, Direction.SOUTH, Direction.EAST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 43. Passageway (orange)
-        self.available_rooms.append(Room(
-            name="Passageway",
-            color=RoomColor.ORANGE,
-            doors=[Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 44. Secret Passage (orange) - Porte Nord verrouillée
-        self.available_rooms.append(Room(
-            name="Secret Passage",
-            color=RoomColor.ORANGE,
-            doors=[Direction.NORTH, Direction.SOUTH],
-            gem_cost=2,
-            rarity=1,
-            objects=[Keys(1)],
-        ))
-
-        # 45. West Wing Hall (orange)
-        self.available_rooms.append(Room(
-            name="West Wing Hall",
-            color=RoomColor.ORANGE,
-            doors=[Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # ============ NOUVELLES PIÈCES ROUGES (DANGEREUSES) ============
-
-        # 46. Archives (red)
-        self.available_rooms.append(Room(
-            name="Archives",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH, Direction.NORTH, Direction.EAST,Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 47. Darkroom (red)
-        self.available_rooms.append(Room(
-            name="Darkroom",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH, Direction.EAST,Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-            
-        ))
-
-        # 48. Furnace (red)
-        self.available_rooms.append(Room(
-            name="Furnace",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 49. Gymnasium (red)
-        self.available_rooms.append(Room(
-            name="Gymnasium",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH, Direction.EAST,Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 50. Lavatory (red)
-        self.available_rooms.append(Room(
-            name="Lavatory",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 51. Maid Chamber (red)
-        self.available_rooms.append(Room(
-            name="Maid Chamber",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH,Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # 52. Weight Room (red)
-        self.available_rooms.append(Room(
-            name="Weight Room",
-            color=RoomColor.RED,
-            doors=[Direction.SOUTH, Direction.NORTH, Direction.EAST,Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[]
-        ))
-
-        # ============ NOUVELLES PIÈCES VIOLETTES (CHAMBRES) ============
-
-        # 53. Bedroom (purple)
-        self.available_rooms.append(Room(
-            name="Bedroom",
-            color=RoomColor.PURPLE,
-            doors=[Direction.SOUTH,Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake()]
-        ))
-
-        # 54. Boudoir (purple)
-        self.available_rooms.append(Room(
-            name="Boudoir",
-            color=RoomColor.PURPLE,
-            doors=[Direction.SOUTH, Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake()]
-        ))
-
-        # 55. Bunk Room (purple)
-        self.available_rooms.append(Room(
-            name="Bunk Room",
-            color=RoomColor.PURPLE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake()]
-        ))
-
-        # 56. Guest Bedroom (purple)
-        self.available_rooms.append(Room(
-            name="Guest Bedroom",
-            color=RoomColor.PURPLE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake()]
-        ))
-
-        # 57. Her Lady's Chamber (purple)
-        self.available_rooms.append(Room(
-            name="Her Lady's Chamber",
-            color=RoomColor.PURPLE,
-            doors=[Direction.SOUTH],
-            gem_cost=1,
-            rarity=2,
-            objects=[Cake(), Meal()]
-        ))
-
-       
-       
-
-        # 59. Nursery (purple)
-        self.available_rooms.append(Room(
-            name="Nursery",
-            color=RoomColor.PURPLE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake()]
-        ))
-
-        # 60. Servant Quarters (purple)
-        self.available_rooms.append(Room(
-            name="Servant Quarters",
-            color=RoomColor.PURPLE,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Cake()]
-        ))
-
-        # ============ NOUVELLES PIÈCES JAUNES (MAGASINS) ============
-
-        # 61. Bookshop (yellow/violet)
-        self.available_rooms.append(Room(
-            name="Bookshop",
-            color=RoomColor.YELLOW,
-            doors=[Direction.SOUTH, Direction.WEST],
-            gem_cost=1,
-            rarity=1,
-            objects=[Keys(2), Dice(1)],
-            shop_item={'item': LockpickKit, 'name': 'Kit de crochetage', 'price': 15}
-        ))
-
-        # 62. Kitchen (yellow/violet)
-        self.available_rooms.append(Room(
-            name="Kitchen",
-            color=RoomColor.YELLOW,
-            doors=[Direction.SOUTH, Direction.WEST],
-            gem_cost=0,
-            rarity=1,
-            objects=[Apple(), Banana(), Cake()],
-            shop_item={'item': lambda: Gold(5), 'name': '5 pièces d\'or', 'price': 8}
-        ))
-
-        # 63. Laundry Room (yellow/violet)
-        self.available_rooms.append(Room(
-            name="Laundry Room",
-            color=RoomColor.YELLOW,
-            doors=[Direction.SOUTH],
-            gem_cost=0,
-            rarity=1,
-            objects=[Keys(1)],
-            shop_item={'item': lambda: Keys(3), 'name': '3 clés', 'price': 12}
-        ))
-
-        # 64. Locksmith (yellow/violet) - Porte Sud verrouillée (ironique!)
-        self.available_rooms.append(Room(
-            name="Locksmith",
-            color=RoomColor.YELLOW,
-            doors=[Direction.SOUTH],
-            gem_cost=1,
-            rarity=2,
-            objects=[Keys(3)],
-            shop_item={'item': lambda: Keys(5), 'name': '5 clés', 'price': 20}
-        ))
-
-        # 65. Mount Holly Gift Shop (yellow/violet)
-        self.available_rooms.append(Room(
-            name="Mount Holly Gift Shop",
-            color=RoomColor.YELLOW,
-            doors=[Direction.SOUTH, Direction.WEST,Direction.EAST],
-            gem_cost=1,
-            rarity=2,
-            objects=[Keys(2), Gems(1), Dice(1)],
-            shop_item={'item': lambda: Gems(2), 'name': '2 gemmes', 'price': 18}
-        ))
-
-        # 66. Showroom (yellow/violet)
-        self.available_rooms.append(Room(
-            name="Showroom",
-            color=RoomColor.YELLOW,
-            doors=[Direction.SOUTH, Direction.NORTH],
-            gem_cost=1,
-            rarity=1,
-            objects=[Keys(1), Dice(1)],
-            shop_item={'item': lambda: Dice(3), 'name': '3 dés', 'price': 15}
-        ))
-
-        # 67. The Armory (yellow/violet) - Portes Nord et Sud verrouillées
-        self.available_rooms.append(Room(
-            name="The Armory",
-            color=RoomColor.YELLOW,
-            doors=[Direction.SOUTH, Direction.EAST, Direction.WEST, Direction.NORTH],
-            gem_cost=2,
-            rarity=2,
-            objects=[Keys(2), Gems(1)],
-            shop_item={'item': lambda: Steps(20), 'name': '20 pas supplémentaires', 'price': 25}
-        ))
-
-        # ============ PIÈCES SPÉCIALES AVEC PELLE ET OR ============
+    # Pièces placées par le jeu lui-même, jamais proposées au tirage
+    UNDRAWABLE_ROOMS = ("Entrance Hall", "Antechamber")
 
+    def __init__(self, rng: Optional['GameRandom'] = None, definitions: Optional[Sequence[RoomDefinition]] = None,
+                 size: Tuple[int, int] = (9, 5)):
+        """
+        rng: générateur de la partie (None = graine aléatoire)
+        definitions: définitions du catalogue (None = rooms/data/rooms.json; catalogues synthétiques)
+        size: (lignes, colonnes) du manoir, pour les conditions de placement
+        """
+        if rng is None:
+            from game1.rng import GameRandom  # Import local: game1 importe ce module
+            rng = GameRandom()
+        self.rng = rng
+        self.grid_height, self.grid_width = size
+        source = get_room_definitions() if definitions is None else definitions
+        self.definitions: List[RoomDefinition] = list(source)
+        self._name_index: Dict[str, int] = {d.name: i for i, d in enumerate(self.definitions)}
+        self._instances: Dict[int, Room] = {}
+        self._active_count = len(self.definitions)
+        # Colonnes NumPy (couleur, rareté, coût, masques tournés, pièces utilisées/retirées, poids);
+        # colonnes immuables partagées entre les parties pour un tuple de définitions
+        self.table = CatalogTable(source, special=self.UNDRAWABLE_ROOMS, fixed=self.NO_ROTATION_ROOMS)
+        self._placeable: Dict[tuple, np.ndarray] = {}
+        # Pièces utilisées (mark_used) et retirées (remove_room), pour getstate/setstate
+        self._used: set = set()
+        self._removed: set = set()
+        # Incrémenté à chaque changement des pièces disponibles (caches dérivés du catalogue)
+        self.version = 0
+
+        # Apply a random rotation (0/90/180/270) to each room to increase directional variety:
+        # this is the preferred orientation, kept whenever it fits the target cell (orientation()).
+        # Skip rooms where rotation causes visual misalignment with their images,
+        # and rooms without doors. One draw per rotatable room, in catalog order.
+        table = self.table
+        rotatable = np.flatnonzero(table.rotatable)
+        # Flux des rotations utilisé ici seulement: non conservé dans la partie (mémoire, Game.snapshot)
+        rotations = self.rng.stream("rotations")
+        degrees = [rotations.choice([0, 90, 180, 270]) for _ in range(len(rotatable))]
+        table.set_rotations(rotatable, np.array(degrees, dtype=np.int16))
+        self.rotations: List[int] = (table.rotation.astype(np.int16) * 90).tolist()
+        self.door_masks: List[int] = table.door_mask.tolist()
+
+        # Index (porte requise, portes interdites) -> indices des pièces non utilisées
+        # (toutes orientations); une clé absente est construite par un masque sur la table
+        # (ordre croissant des indices)
+        offered = np.flatnonzero(~table.special)
+        self.unused_index = DoorSignatureIndex(
+            zip(offered.tolist(), table.shapes[offered].tolist()),
+            builder=lambda required, forbidden: np.flatnonzero(self.table.unused(required, forbidden)).tolist()
+        )
+
+        # Tirage pondéré (draw_rooms): un arbre de Fenwick par couleur (poids de rareté),
+        # le multiplicateur de couleur s'applique au total de l'arbre.
+        # Les arbres sont construits au premier tirage seulement.
+        self.color_multipliers: Dict[RoomColor, float] = {}
+        self._samplers: Optional[Dict[RoomColor, FenwickSampler]] = None
+        self._color_rooms: Dict[RoomColor, List[int]] = {}
+        self._slots: Dict[int, int] = {}
+        self._free_rooms = RoomSet()
+
+    @property
+    def available_rooms(self) -> List[Room]:
+        """Pièces encore au catalogue (les instancie toutes: réservé aux outils)"""
+        return [self.instantiate(i) for i in np.flatnonzero(~self.table.removed).tolist()]
+
+    def unused_definitions(self) -> Iterator[Tuple[int, RoomDefinition]]:
+        """Définitions encore tirables (ni placées ni retirées), avec leur indice"""
+        definitions = self.definitions
+        for index in np.flatnonzero(self.table.unused()).tolist():
+            yield index, definitions[index]
+
+    def unused_door_masks(self) -> List[int]:
+        """Masques de portes présents parmi les pièces encore tirables (compteurs de la table, O(1))"""
+        return self.table.distinct_unused_masks()
+
+    def orientation(self, index: int, required_mask: int = 0, forbidden_mask: int = 0, avoid_mask: int = 0) -> int:
+        """
+        Rotation (degrés) sous laquelle proposer la pièce pour une case exigeant
+        required_mask et interdisant forbidden_mask, avec le moins de portes
+        possible dans avoid_mask (murs des pièces voisines): la rotation tirée au
+        départ si elle convient, sinon la suivante dans le sens horaire
+        """
+        quarter = fitting_rotation(self.definitions[index].door_mask, self.rotations[index] // 90,
+                                   required_mask, forbidden_mask, bool(self.table.orientable[index]), avoid_mask)
+        return quarter * 90
+
+    def oriented_mask(self, index: int, required_mask: int = 0, forbidden_mask: int = 0, avoid_mask: int = 0) -> int:
+        """Masque de portes de la pièce dans l'orientation choisie par orientation()"""
+        degrees = self.orientation(index, required_mask, forbidden_mask, avoid_mask)
+        return ROTATION_TABLE[self.definitions[index].door_mask][degrees // 90]
+
+    def possible_masks(self, index: int) -> List[int]:
+        """Masques de portes que la pièce peut prendre (toutes ses orientations)"""
+        shapes = int(self.table.shapes[index])
+        return [mask for mask in range(16) if shapes >> mask & 1]
+
+    def instantiate(self, index: int) -> Room:
+        """Instance de partie d'une définition, créée au premier tirage puis conservée"""
+        room = self._instances.get(index)
+        if room is None:
+            room = self._instances[index] = self.definitions[index].instantiate(self.rotations[index])
+        return room
+
+    def _ensure_samplers(self) -> Dict[RoomColor, FenwickSampler]:
+        """Construit les arbres de tirage (O(n), par couleur sur la table) à la première utilisation"""
+        if self._samplers is None:
+            table = self.table
+            drawable = ~table.used
+            self._samplers = {}
+            self._color_rooms = {}
+            self._slots = {}
+            by_color = [(rows[0], color, rows) for color, rows in
+                        ((color, np.flatnonzero(drawable & (table.color == code))) for color, code in COLOR_CODES.items())
+                        if len(rows)]
+            # Couleurs dans l'ordre de leur première pièce (ordre de parcours du tirage)
+            for _, color, rows in sorted(by_color, key=lambda entry: entry[0]):
+                indices = rows.tolist()
+                self._samplers[color] = FenwickSampler(table.weight[rows].tolist())
+                self._color_rooms[color] = indices
+                self._slots.update(zip(indices, range(len(indices))))
+            for index in np.flatnonzero(drawable & (table.gem_cost == 0)).tolist():
+                self._free_rooms.add(index)
+        return self._samplers
+
+    def _register_slot(self, index: int) -> None:
+        """Attribue à la pièce une case dans l'arbre de sa couleur (O(log n))"""
+        definition = self.definitions[index]
+        sampler = self._samplers.get(definition.color)
+        if sampler is None:
+            sampler = self._samplers[definition.color] = FenwickSampler()
+            self._color_rooms[definition.color] = []
+        self._slots[index] = sampler.append(definition.get_probability_weight())
+        self._color_rooms[definition.color].append(index)
+        if definition.gem_cost == 0:
+            self._free_rooms.add(index)
+
+    def _deactivate(self, index: int) -> None:
+        """Exclut une pièce du tirage pondéré (O(log n))"""
+        self.table.set_used(index)
+        slot = self._slots.pop(index, None)
+        if slot is None:
+            return
+        self._samplers[self.definitions[index].color].update(slot, 0.0)
+        self._free_rooms.discard(index)
+
+    def set_color_multiplier(self, color: RoomColor, multiplier: float) -> None:
+        """Change le multiplicateur de probabilité d'une couleur (ProbabilityModifierEffect), en O(1)"""
+        self.color_multipliers[color] = multiplier
+
+    def _draw_multipliers(self, context) -> Dict[RoomColor, float]:
+        """
+        Multiplicateurs d'un tirage: ceux du catalogue, et pour ce tirage seulement ceux
+        d'un contexte objet (attribut probability_modifiers, comme Game); un dict est ignoré
+        """
+        modifiers = getattr(context, 'probability_modifiers', None) if context is not None else None
+        if not modifiers:
+            return self.color_multipliers
+        return {**self.color_multipliers, **modifiers}
+
+    def _draw_slot(self, multipliers: Dict[RoomColor, float]) -> Optional[tuple]:
+        """Tire (couleur, case): la couleur selon total x multiplicateur, puis la pièce dans son arbre"""
+        rng = self.rng.rooms
+        totals = [(color, sampler.total * multipliers.get(color, 1.0))
+                  for color, sampler in self._samplers.items()]
+        grand_total = sum(total for _, total in totals)
+        if grand_total <= 0:
+            return None
+        value = rng.random() * grand_total
+        chosen = None
+        for color, total in totals:
+            if total <= 0:
+                continue
+            chosen = color
+            if value < total:
+                break
+            value -= total
+        slot = self._samplers[chosen].draw(rng)
+        return (chosen, slot) if slot >= 0 else None
+
+    def placeable(self, position: tuple) -> np.ndarray:
+        """
+        Masque des pièces plaçables en position (conditions de placement
+        évaluées une fois par position, pour les seules pièces qui en ont)
+        """
+        mask = self._placeable.get(position)
+        if mask is None:
+            row, col = position
+            mask = np.ones(self.table.size, dtype=bool)
+            for index in np.flatnonzero(self.table.conditional).tolist():
+                mask[index] = self.definitions[index].can_be_placed(row, col, self.grid_height, self.grid_width)
+            self._placeable[position] = mask
+        return mask
+
+    def draw_weights(self, position: tuple,
+                     multipliers: Optional[Dict[RoomColor, float]] = None) -> List[Tuple[int, float]]:
+        """
+        (indice, poids effectif) des pièces que draw_rooms peut proposer en position:
+        rareté x multiplicateur de couleur (multipliers: None = ceux du catalogue)
+        """
+        table = self.table
+        rows = np.flatnonzero(~table.used & self.placeable(position))
+        weights = table.weights(self.color_multipliers if multipliers is None else multipliers)
+        return list(zip(rows.tolist(), weights[rows].tolist()))
 
     def draw_rooms(self, count: int, position: tuple, context: dict = None) -> List[Room]:
         """
         Tire des pièces aléatoires du catalogue
         count: nombre de pièces à tirer
         position: (row, col) position où la pièce sera placée
-        context: dictionnaire contenant les modificateurs de probabilité
+        context: partie (ou objet) portant des modificateurs de probabilité (probability_modifiers)
         """
-        if context is None:
-            context = {}
+        multipliers = self._draw_multipliers(context)
+        self._ensure_samplers()
 
         row, col = position
 
-        # Filtrer les pièces disponibles et compatibles avec la position
-        eligible_rooms = [
-            room for room in self.available_rooms
-            if room.can_be_placed(row, col, 9, 5)
-        ]
-
-        if not eligible_rooms:
-            return []
-
-        # Calculer les poids de probabilité
-        weights = []
-        for room in eligible_rooms:
-            weight = room.get_probability_weight()
-
-            # Appliquer les modificateurs de probabilité
-            if hasattr(context, 'probability_modifiers') and room.color in context.probability_modifiers:
-                weight *= context.probability_modifiers[room.color]
-
-            weights.append(weight)
-
-        # Normaliser les poids
-        total_weight = sum(weights)
-        if total_weight == 0:
-            weights = [1.0] * len(weights)
-            total_weight = len(weights)
-
-        probabilities = [w / total_weight for w in weights]
-
-        # Tirer les pièces
+        # Tirer les pièces sans remise: chaque case tirée est mise à zéro puis restaurée
         drawn = []
-        available_for_draw = eligible_rooms.copy()
-        available_probs = probabilities.copy()
-
-        for _ in range(min(count, len(available_for_draw))):
-            room = random.choices(available_for_draw, weights=available_probs)[0]
-            drawn.append(room)
-
-            # Retirer la pièce pour ne pas la tirer deux fois
-            idx = available_for_draw.index(room)
-            available_for_draw.pop(idx)
-            available_probs.pop(idx)
-
-            # Renormaliser
-            if available_probs:
-                total = sum(available_probs)
-                available_probs = [p / total for p in available_probs]
+        suspended = []
+        while len(drawn) < count:
+            picked = self._draw_slot(multipliers)
+            if picked is None:
+                break
+            color, slot = picked
+            sampler = self._samplers[color]
+            suspended.append((sampler, slot, sampler.weight(slot)))
+            sampler.update(slot, 0.0)
+            index = self._color_rooms[color][slot]
+            # Pièce incompatible avec la position: écartée pour ce tirage seulement
+            if self.definitions[index].can_be_placed(row, col, self.grid_height, self.grid_width):
+                drawn.append(self.instantiate(index))
+        for sampler, slot, weight in suspended:
+            sampler.update(slot, weight)
+
+        # Aucune pièce plaçable de poids positif (multiplicateurs nuls): tirage uniforme
+        if not drawn:
+            candidates = np.flatnonzero(~self.table.used & self.placeable(position)).tolist()
+            drawn = [self.instantiate(index)
+                     for index in self.rng.rooms.sample(candidates, min(count, len(candidates)))]
 
         # S'assurer qu'au moins une pièce a un coût de 0 gemmes
         if drawn and all(room.gem_cost > 0 for room in drawn):
             # Remplacer la pièce la plus rare par une pièce gratuite
-            free_rooms = [r for r in eligible_rooms if r.gem_cost == 0]
-            if free_rooms:
-                drawn[-1] = random.choice(free_rooms)
+            free_room = self._choose_free_room(row, col)
+            if free_room is not None:
+                drawn[-1] = free_room
 
         return drawn
 
+    def _choose_free_room(self, row: int, col: int) -> Optional[Room]:
+        """Pièce gratuite plaçable en (row, col), tirée uniformément"""
+        free_rooms = self._free_rooms
+        if not len(free_rooms):
+            return None
+        # Quelques essais directs (cas courant: pas de condition de placement)
+        for _ in range(8):
+            index = free_rooms.choice(self.rng.rooms)
+            if self.definitions[index].can_be_placed(row, col, self.grid_height, self.grid_width):
+                return self.instantiate(index)
+        candidates = np.fromiter(free_rooms, dtype=np.int64, count=len(free_rooms))
+        eligible = candidates[self.placeable((row, col))[candidates]].tolist()
+        return self.instantiate(self.rng.rooms.choice(eligible)) if eligible else None
+
+    def add_room(self, room: Room) -> None:
+        """Ajoute une pièce (déjà instanciée) au catalogue, index et tirage pondéré compris"""
+        index = len(self.definitions)
+        self.definitions.append(room.definition)
+        self._name_index.setdefault(room.name, index)
+        self._instances[index] = room
+        self._active_count += 1
+        self.version += 1
+        self.table.extend([room.definition], [room.rotation_degrees])
+        self._placeable.clear()
+        self.rotations.append(room.rotation_degrees)
+        self.door_masks.append(room.door_mask)
+        if room.name not in self.UNDRAWABLE_ROOMS:
+            self.unused_index.add(index, int(self.table.shapes[index]))
+        if self._samplers is not None:
+            self._register_slot(index)
+
+    def _index_of(self, room: Room) -> Optional[int]:
+        """Indice de la définition d'une pièce de ce catalogue"""
+        index = self._name_index.get(room.name)
+        if index is None or self.definitions[index] is not room.definition:
+            return None
+        return index
+
     def remove_room(self, room: Room) -> bool:
         """Retire une pièce du catalogue (elle a été utilisée)"""
-        if room in self.available_rooms:
-            self.available_rooms.remove(room)
-            return True
-        return False
+        index = self._index_of(room)
+        if index is None or self.table.removed[index]:
+            return False
+        self.table.removed[index] = True
+        self._active_count -= 1
+        self._removed.add(index)
+        self._used.add(index)
+        self.version += 1
+        self.unused_index.discard(index)
+        self._deactivate(index)
+        return True
+
+    def mark_used(self, room: Room) -> None:
+        """Retire une pièce placée de l'index et du tirage pondéré"""
+        index = self._index_of(room)
+        if index is not None:
+            self._used.add(index)
+            self.version += 1
+            self.unused_index.discard(index)
+            self._deactivate(index)
+
+    def getstate(self) -> tuple:
+        """
+        État de partie du catalogue (pièces utilisées/retirées, index, tirage pondéré)
+        L'index est partagé (copie à l'écriture); les arbres de tirage ne sont
+        copiés que s'ils ont été construits.
+        """
+        samplers = None
+        if self._samplers is not None:
+            samplers = ({color: sampler.getstate() for color, sampler in self._samplers.items()},
+                        dict(self._slots), {color: list(rooms) for color, rooms in self._color_rooms.items()},
+                        self._free_rooms.getstate())
+        return (frozenset(self._used), frozenset(self._removed), dict(self.color_multipliers),
+                self.unused_index.getstate(), samplers)
+
+    def setstate(self, state: tuple, rooms: Iterable[Room] = ()) -> None:
+        """
+        Restaure un état retourné par getstate
+        rooms: instances à conserver (pièces placées ou proposées au moment de
+        getstate); les autres seront réinstanciées neuves au prochain tirage
+        """
+        used, removed, multipliers, index_state, samplers = state
+        table = self.table
+        for index in self._removed ^ removed:
+            table.removed[index] = index in removed
+        for index in self._used ^ used:
+            table.set_used(index, index in used)
+        self._active_count += len(self._removed) - len(removed)
+        self._used = set(used)
+        self._removed = set(removed)
+        self.version += 1
+        self.color_multipliers = dict(multipliers)
+        self.unused_index.setstate(index_state)
+
+        self._free_rooms = RoomSet()
+        if samplers is None:
+            # Arbres construits après la sauvegarde: reconstruits au prochain tirage
+            self._samplers = None
+            self._slots = {}
+            self._color_rooms = {}
+        else:
+            trees, slots, color_rooms, free_rooms = samplers
+            self._samplers = {}
+            for color, tree_state in trees.items():
+                self._samplers[color] = FenwickSampler()
+                self._samplers[color].setstate(tree_state)
+            self._slots = dict(slots)
+            self._color_rooms = {color: list(indices) for color, indices in color_rooms.items()}
+            self._free_rooms.setstate(free_rooms)
+
+        kept = {}
+        for room in rooms:
+            index = self._index_of(room)
+            if index is not None:
+                kept[index] = room
+        self._instances = kept
+
+    def find_unused(self, required_mask: int = 0, forbidden_mask: int = 0) -> RoomSet:
+        """
+        Indices des pièces non utilisées ayant la porte requise et aucune porte
+        interdite (recherche directe dans l'index, sans parcourir le catalogue)
+        """
+        return self.unused_index.lookup(required_mask, forbidden_mask)
+
+    def sample_unused(self, required_mask: int = 0, forbidden_mask: int = 0, count: int = 3,
+                      avoid_mask: int = 0) -> List[Room]:
+        """
+        Tire jusqu'à count pièces non utilisées compatibles (instanciées à ce
+        moment), chacune tournée dans l'orientation qui convient (orientation())
+        """
+        candidates = self.unused_index.lookup(required_mask, forbidden_mask)
+        rooms = []
+        for index in candidates.sample(self.rng.rooms, count):
+            room = self.instantiate(index)
+            turn = (self.orientation(index, required_mask, forbidden_mask, avoid_mask) - room.rotation_degrees) % 360
+            if turn:
+                room.rotate(turn)
+            rooms.append(room)
+        return rooms
 
     def add_special_rooms(self, room_names: List[str]) -> int:
         """Ajoute des pièces spéciales au catalogue"""
@@ -794,32 +437,33 @@ class RoomCatalog:
 
     def get_room_count(self) -> int:
         """Retourne le nombre de pièces disponibles"""
-        return len(self.available_rooms)
+        return self._active_count
 
     def get_all_rooms(self) -> List[Room]:
         """Retourne toutes les pièces disponibles"""
-        return self.available_rooms.copy()
+        return self.available_rooms
 
     def get_entrance(self) -> Optional[Room]:
         """Retourne la pièce Entrance Hall"""
-        for room in self.available_rooms:
-            if room.name == "Entrance Hall":
-                return room
-        
-        # Si pas trouvé, créer une entrance basique
-        entrance = Room(
-            name="Entrance Hall",
-            color=RoomColor.ORANGE,
-            doors=[Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST],
-            gem_cost=0,
-            rarity=0,
-            objects=[]
-        )
-        self.available_rooms.append(entrance)
-        return entrance
+        return self.get_room_by_name("Entrance Hall")
+
     def get_room_by_name(self, room_name: str) -> Optional[Room]:
         """Retourne une pièce par son nom"""
-        for room in self.available_rooms:
-            if room.name == room_name:
-                return room
-        return None
+        index = self._name_index.get(room_name)
+        if index is None or self.table.removed[index]:
+            return None
+        return self.instantiate(index)
+
+
+_DEFINITIONS: Optional[Tuple[RoomDefinition, ...]] = None
+
+
+def get_room_definitions() -> Tuple[RoomDefinition, ...]:
+    """
+    Définitions du catalogue (rooms/data/rooms.json), chargées une seule fois
+    par processus depuis le cache compilé
+    """
+    global _DEFINITIONS
+    if _DEFINITIONS is None:
+        _DEFINITIONS = load_room_definitions()
+    return _DEFINITIONS
@@ -0,0 +1,185 @@
+"""
+Probabilités exactes de la prochaine offre de pièces
+- Offre de l'écran de sélection (RoomCatalog.sample_unused): tirage uniforme
+  sans remise de k pièces parmi les n compatibles -> loi hypergéométrique:
+  P(pièce) = k/n, P(au moins une pièce du groupe de taille g) = 1 - C(n-g, k)/C(n, k)
+- Tirage pondéré (RoomCatalog.draw_rooms): poids 1/3**rareté x multiplicateur
+  de couleur, sans remise, pièces non plaçables écartées (équivaut à un tirage
+  pondéré parmi les seules pièces plaçables; tirage uniforme si leurs poids sont
+  tous nuls), puis remplacement de la dernière pièce par une pièce gratuite si
+  aucune ne l'est. Calcul exact en parcourant les suites de classes (même
+  poids, même groupe, gratuite ou non): les pièces d'une classe sont
+  interchangeables.
+Les résultats sont mis en cache jusqu'au prochain changement du catalogue
+(RoomCatalog.version) ou des multiplicateurs.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from math import comb
+from typing import Callable, Dict, Hashable, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from core.game_objects import RoomColor
+
+if TYPE_CHECKING:
+    from rooms.catalog import RoomCatalog
+    from rooms.room import RoomDefinition
+
+OFFER_SIZE = 3
+
+
+class OfferOdds(NamedTuple):
+    """Probabilités d'apparition dans la prochaine offre"""
+    size: int                          # Pièces proposées (min(3, candidates))
+    candidates: int                    # Pièces pouvant être proposées
+    rooms: Dict[str, float]            # Nom -> probabilité d'être proposée
+    colors: Dict[RoomColor, float]     # Couleur -> probabilité d'au moins une pièce de cette couleur
+    door_masks: Dict[int, float]       # Masque de portes -> probabilité d'au moins une pièce de cette forme
+
+    def expected_colors(self) -> float:
+        """Nombre moyen de couleurs différentes dans l'offre"""
+        return sum(self.colors.values())
+
+
+def _uniform_odds(definitions: List['RoomDefinition'], masks: List[int], count: int) -> OfferOdds:
+    """Tirage uniforme sans remise (sample_unused)"""
+    n = len(definitions)
+    k = min(count, n)
+    if k == 0:
+        return OfferOdds(0, n, {}, {}, {})
+    total = comb(n, k)
+
+    def at_least_one(sizes: Dict[Hashable, int]) -> dict:
+        return {group: 1.0 - comb(n - size, k) / total for group, size in sizes.items()}
+
+    colors: Dict[RoomColor, int] = {}
+    shapes: Dict[int, int] = {}
+    for definition, mask in zip(definitions, masks):
+        colors[definition.color] = colors.get(definition.color, 0) + 1
+        shapes[mask] = shapes.get(mask, 0) + 1
+    return OfferOdds(k, n, {definition.name: k / n for definition in definitions},
+                     at_least_one(colors), at_least_one(shapes))
+
+
+def _successive(classes: List[Tuple[float, int]], k: int) -> List[Tuple[float, Tuple[int, ...]]]:
+    """
+    Suites de classes tirées (tirage pondéré sans remise de k éléments)
+    classes: (poids d'un élément, nombre d'éléments); retourne (probabilité, classes tirées dans l'ordre)
+    """
+    paths = []
+    counts = [count for _, count in classes]
+
+    def walk(total: float, probability: float, picked: Tuple[int, ...]) -> None:
+        if len(picked) == k:
+            paths.append((probability, picked))
+            return
+        for c, (weight, _) in enumerate(classes):
+            remaining = counts[c]
+            mass = weight * remaining
+            if mass <= 0:
+                continue
+            counts[c] = remaining - 1
+            walk(total - weight, probability * mass / total, picked + (c,))
+            counts[c] = remaining
+    total = sum(weight * count for weight, count in classes)
+    if k and total > 0:
+        walk(total, 1.0, ())
+    return paths
+
+
+def _weighted_group_odds(entries: List[Tuple[float, bool, Hashable]], k: int) -> Tuple[Dict[Hashable, float],
+                                                                                        Dict[Hashable, float]]:
+    """
+    entries: (poids, gratuite, groupe) par pièce plaçable (k: pièces tirées)
+    Retourne (nombre moyen de pièces tirées par classe (poids, gratuite, groupe),
+    probabilité d'au moins une pièce de chaque groupe)
+    """
+    keys: Dict[Tuple[float, bool, Hashable], int] = {}
+    for entry in entries:
+        keys[entry] = keys.get(entry, 0) + 1
+    classes = list(keys)
+    free_groups: Dict[Hashable, int] = {}
+    for weight, free, group in entries:
+        if free:
+            free_groups[group] = free_groups.get(group, 0) + 1
+    free_total = sum(free_groups.values())
+
+    picks = {key: 0.0 for key in classes}
+    present = {group: 0.0 for _, _, group in classes}
+    replaced = 0.0  # Probabilité que la dernière pièce soit remplacée par une pièce gratuite
+    for probability, path in _successive([(key[0], keys[key]) for key in classes], k):
+        kept = path
+        if free_total and not any(classes[c][1] for c in path):
+            kept = path[:-1]
+            replaced += probability
+        groups = {classes[c][2] for c in kept}
+        for c in kept:
+            picks[classes[c]] += probability
+        for group in present:
+            if group in groups:
+                present[group] += probability
+            elif kept is not path:
+                present[group] += probability * free_groups.get(group, 0) / free_total
+    # La pièce gratuite de remplacement est tirée uniformément
+    for key in classes:
+        if key[1]:
+            picks[key] += replaced * keys[key] / free_total
+    return {key: picks[key] / keys[key] for key in classes}, present
+
+
+class DrawOdds:
+    """Calculateur de probabilités pour un catalogue, avec cache invalidé par RoomCatalog.version"""
+
+    def __init__(self, catalog: 'RoomCatalog'):
+        self.catalog = catalog
+        self._version = None
+        self._cache: Dict[tuple, OfferOdds] = {}
+
+    def _cached(self, key: tuple, compute: Callable[[], OfferOdds]) -> OfferOdds:
+        if self.catalog.version != self._version:
+            self._cache.clear()
+            self._version = self.catalog.version
+        odds = self._cache.get(key)
+        if odds is None:
+            odds = self._cache[key] = compute()
+        return odds
+
+    def offer(self, required_mask: int = 0, forbidden_mask: int = 0, count: int = OFFER_SIZE,
+              avoid_mask: int = 0) -> OfferOdds:
+        """Offre de sample_unused(required_mask, forbidden_mask, count, avoid_mask)"""
+        def compute() -> OfferOdds:
+            catalog = self.catalog
+            indices = list(catalog.find_unused(required_mask, forbidden_mask))
+            return _uniform_odds([catalog.definitions[i] for i in indices],
+                                 [catalog.oriented_mask(i, required_mask, forbidden_mask, avoid_mask)
+                                  for i in indices], count)
+        return self._cached(("offer", required_mask, forbidden_mask, count, avoid_mask), compute)
+
+    def weighted(self, position: Tuple[int, int], count: int = OFFER_SIZE,
+                 multipliers: Optional[Dict[RoomColor, float]] = None) -> OfferOdds:
+        """
+        Tirage de draw_rooms(count, position)
+        multipliers: modificateurs de couleur (None = ceux du catalogue)
+        """
+        catalog = self.catalog
+        multipliers = dict(catalog.color_multipliers if multipliers is None else multipliers)
+
+        def compute() -> OfferOdds:
+            # Pièces de poids nul: jamais tirées, mais possibles en remplacement gratuit
+            candidates = catalog.draw_weights(position, multipliers)
+            k = min(count, sum(1 for _, weight in candidates if weight > 0))
+            if not k:
+                # Tous les poids nuls: draw_rooms tire uniformément
+                candidates = [(i, 1.0) for i, _ in candidates]
+                k = min(count, len(candidates))
+            definitions = catalog.definitions
+            by_color = [(weight, definitions[i].gem_cost == 0, definitions[i].color) for i, weight in candidates]
+            by_shape = [(weight, definitions[i].gem_cost == 0, catalog.door_masks[i]) for i, weight in candidates]
+            room_odds, colors = _weighted_group_odds(by_color, k)
+            _, shapes = _weighted_group_odds(by_shape, k)
+            rooms = {definitions[i].name: room_odds[entry] for (i, _), entry in zip(candidates, by_color)}
+            return OfferOdds(k, len(candidates), rooms, colors, shapes)
+
+        key = ("weighted", position, count, tuple(sorted((color.value, m) for color, m in multipliers.items())))
+        return self._cached(key, compute)
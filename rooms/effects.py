@@ -6,7 +6,6 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import TYPE_CHECKING
-import random
 
 from core.game_objects import RoomEffect, RoomColor
 
@@ -47,23 +46,28 @@ class ResourceEffect(RoomEffect):
         if self.resource_type == 'steps':
             inventory.steps.quantity += self.amount
             action = "récupéré" if self.amount > 0 else "perdu"
-            print(f"Vous avez {action} {abs(self.amount)} pas!")
+            player.events.emit("resource_changed", "Vous avez {action} {amount} pas!",
+                               resource='steps', action=action, amount=abs(self.amount))
         elif self.resource_type == 'gold':
             inventory.gold.quantity += self.amount
             action = "récupéré" if self.amount > 0 else "perdu"
-            print(f"Vous avez {action} {abs(self.amount)} pièces d'or!")
+            player.events.emit("resource_changed", "Vous avez {action} {amount} pièces d'or!",
+                               resource='gold', action=action, amount=abs(self.amount))
         elif self.resource_type == 'gems':
             inventory.gems.quantity += self.amount
             action = "récupéré" if self.amount > 0 else "perdu"
-            print(f"Vous avez {action} {abs(self.amount)} gemmes!")
+            player.events.emit("resource_changed", "Vous avez {action} {amount} gemmes!",
+                               resource='gems', action=action, amount=abs(self.amount))
         elif self.resource_type == 'keys':
             inventory.keys.quantity += self.amount
             action = "récupéré" if self.amount > 0 else "perdu"
-            print(f"Vous avez {action} {abs(self.amount)} clés!")
+            player.events.emit("resource_changed", "Vous avez {action} {amount} clés!",
+                               resource='keys', action=action, amount=abs(self.amount))
         elif self.resource_type == 'dice':
             inventory.dice.quantity += self.amount
             action = "récupéré" if self.amount > 0 else "perdu"
-            print(f"Vous avez {action} {abs(self.amount)} dés!")
+            player.events.emit("resource_changed", "Vous avez {action} {amount} dés!",
+                               resource='dice', action=action, amount=abs(self.amount))
 
 
 class ProbabilityModifierEffect(RoomEffect):
@@ -84,7 +88,9 @@ class ProbabilityModifierEffect(RoomEffect):
             game.probability_modifiers = {}
 
         game.probability_modifiers[self.target_color] = self.multiplier
-        print(f"Les pièces {self.target_color.value} sont maintenant plus probables!")
+        game.catalog.set_color_multiplier(self.target_color, self.multiplier)
+        game.events.emit("probability_modifier", "Les pièces {color.value} sont maintenant plus probables!",
+                         color=self.target_color, multiplier=self.multiplier)
 
 
 class ItemProbabilityEffect(RoomEffect):
@@ -107,7 +113,8 @@ class ItemProbabilityEffect(RoomEffect):
         for item_type in self.item_types:
             game.item_probability_modifiers[item_type] = self.multiplier
 
-        print(f"Vous avez plus de chances de trouver certains objets!")
+        game.events.emit("item_probability_modifier", "Vous avez plus de chances de trouver certains objets!",
+                         item_types=self.item_types, multiplier=self.multiplier)
 
 
 class DispersionEffect(RoomEffect):
@@ -130,22 +137,22 @@ class DispersionEffect(RoomEffect):
 
         # Récupérer les pièces éligibles
         eligible_rooms = []
-        for row in game.manor.grid:
-            for cell_room in row:
-                if cell_room and cell_room != room:
-                    if self.target_color is None or cell_room.color == self.target_color:
-                        eligible_rooms.append(cell_room)
+        for _, cell_room in sorted(game.manor.rooms.items()):  # Ordre ligne par ligne
+            if cell_room != room:
+                if self.target_color is None or cell_room.color == self.target_color:
+                    eligible_rooms.append(cell_room)
 
         if not eligible_rooms:
-            print("Aucune pièce disponible pour la dispersion.")
+            game.events.emit("dispersion_failed", "Aucune pièce disponible pour la dispersion.")
             return
 
         # Disperser les objets
-        rooms_to_use = random.sample(eligible_rooms, min(self.quantity, len(eligible_rooms)))
+        rng = game.rng.loot
+        rooms_to_use = rng.sample(eligible_rooms, min(self.quantity, len(eligible_rooms)))
 
         for target_room in rooms_to_use:
             if self.object_type == 'gold':
-                target_room.objects.append(Gold(random.randint(3, 10)))
+                target_room.objects.append(Gold(rng.randint(3, 10)))
             elif self.object_type == 'gems':
                 target_room.objects.append(Gems(1))
             elif self.object_type == 'keys':
@@ -153,7 +160,8 @@ class DispersionEffect(RoomEffect):
             elif self.object_type == 'dice':
                 target_room.objects.append(Dice(1))
 
-        print(f"{self.quantity} {self.object_type} dispersé(s) dans d'autres pièces!")
+        game.events.emit("dispersion", "{quantity} {object_type} dispersé(s) dans d'autres pièces!",
+                         quantity=self.quantity, object_type=self.object_type)
 
 
 class AddRoomsToCatalogEffect(RoomEffect):
@@ -170,9 +178,9 @@ class AddRoomsToCatalogEffect(RoomEffect):
         """Ajoute des pièces au catalogue"""
         added = game.manor.room_catalog.add_special_rooms(self.room_names)
         if added:
-            print(f"{added} nouvelles pièces ajoutées au catalogue!")
+            game.events.emit("rooms_added", "{added} nouvelles pièces ajoutées au catalogue!", added=added)
         else:
-            print("Aucune nouvelle pièce ajoutée.")
+            game.events.emit("rooms_added", "Aucune nouvelle pièce ajoutée.", added=0)
 
 
 class ConditionalEffect(RoomEffect):
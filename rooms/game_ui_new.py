@@ -8,7 +8,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from typing import Optional, Dict
 from game1.game import Game, GameState
-from core.game_objects import Direction, RoomColor
+from core.game_objects import Direction, RoomColor, ItemKind
+from simulation.advisor import RoomAdvisor
+from simulation.actions import DIRECTION, TAKE
+from simulation.mcts import MCTSAgent
 
 # Couleurs
 WHITE = (255, 255, 255)
@@ -33,6 +36,19 @@ ROOM_COLORS = {
     'orange': ORANGE
 }
 
+# Libellés des objets à ramasser (par type d'objet)
+TAKE_LABELS = {
+    ItemKind.CAKE: "Take cake",
+    ItemKind.GEMS: "Take gem",
+    ItemKind.KEYS: "Take key",
+    ItemKind.DICE: "Take dice"
+}
+
+# Temps de calcul du conseiller par image (60 FPS = 16,7 ms par image)
+ADVISOR_FRAME_BUDGET = 0.005
+HINT_TIME = 0.5  # Secondes de recherche pour un indice (réparties sur plusieurs images)
+HINT_FRAME_BUDGET = 0.008  # Temps de calcul de l'indice par image
+
 
 class ImprovedGameUI:
     """Interface graphique améliorée avec images"""
@@ -68,6 +84,15 @@ class ImprovedGameUI:
         self.selected_room_index = 0
         self.selected_direction = None  # Pour choisir la direction avec AWSD
 
+        # Conseiller: recherche répartie sur plusieurs images (budget total advisor.budget)
+        self.advisor = RoomAdvisor()
+        self.advisor_search = None
+        self.advice = None
+
+        # Indice (touche H): recherche MCTS répartie sur plusieurs images, comme le conseiller
+        self.hint_agent = MCTSAgent(playouts=100_000, time_limit=HINT_TIME)
+        self.hint_search = None
+
         # Cache d'images
         self.room_images: Dict[str, pygame.Surface] = {}
         self.room_images_original: Dict[str, pygame.Surface] = {}  # Images originales non tournées
@@ -186,15 +211,16 @@ class ImprovedGameUI:
             else:
                 return self.room_images.get(room.name)
         
-        # Récupérer la rotation de la pièce
+        # Rotation de l'instance: orientation choisie pour la case au moment de l'offre
+        # (RoomCatalog.orientation), elle peut changer d'une offre à l'autre
         rotation_deg = getattr(room, 'rotation_degrees', 0)
         
         # Si pas de rotation, retourner l'image originale
         if rotation_deg == 0:
             return self.room_images_original[room_name]
         
-        # Créer une clé unique pour cette rotation
-        cache_key = f"{room_name}_rot{rotation_deg}"
+        # Une entrée par (image, rotation): les 4 orientations d'une pièce restent en cache
+        cache_key = (room_name, rotation_deg)
         
         # Vérifier si l'image tournée est déjà en cache
         if cache_key in self.room_images:
@@ -241,12 +267,15 @@ class ImprovedGameUI:
                 elif self.game.is_game_over():
                     self.handle_game_over_events(event)
 
+            self.update_hint()
+
             # Affichage
             self.screen.fill(BLACK)
 
             if self.game.state == GameState.PLAYING:
                 self.draw_playing_state()
             elif self.game.state == GameState.ROOM_SELECTION:
+                self.update_advice()
                 self.draw_room_selection_state()
             elif self.game.state == GameState.ROOM_INTERACTION:
                 self.draw_room_interaction_state()
@@ -255,11 +284,23 @@ class ImprovedGameUI:
 
             pygame.display.flip()
 
+        self.hint_agent.close()
         pygame.quit()
         sys.exit()
 
     def handle_playing_events(self, event):
-        """En mode jeu: AWSD pour choisir direction, Flèches pour se déplacer"""
+        """En mode jeu: AWSD pour choisir direction, Flèches pour se déplacer, clic pour aller à une pièce"""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # Clic sur une pièce placée: itinéraire complet en un seul appel
+            x, y = event.pos
+            col = (x - self.grid_x) // self.cell_size
+            row = (y - self.grid_y) // self.cell_size
+            if 0 <= row < self.game.manor.height and 0 <= col < self.game.manor.width:
+                if self.game.manor.get_room(row, col) is not None and (row, col) != self.game.player.position:
+                    self.game.walk_to((row, col))
+                    self.selected_direction = None
+            return
+
         if event.type == pygame.KEYDOWN:
             # Récupérer la chambre actuelle pour vérifier les portes
             current_room = self.game.manor.get_room(*self.game.player.position)
@@ -335,6 +376,10 @@ class ImprovedGameUI:
                 else:
                     print(f"❌ Pas de porte à l'OUEST dans {current_room.name}")
 
+            # H pour un indice (direction à ouvrir ou à emprunter)
+            elif event.key == pygame.K_h:
+                self.show_hint()
+
             # I pour inventaire
             elif event.key == pygame.K_i:
                 print(self.game.player.inventory)
@@ -343,7 +388,7 @@ class ImprovedGameUI:
             elif event.key == pygame.K_g:
                 current_room = self.game.manor.get_room(*self.game.player.position)
                 if current_room and current_room.color == RoomColor.YELLOW:
-                    success = current_room.buy_shop_item(self.game.player)
+                    success = self.game.buy_shop_item()
                     if success:
                         # Message de succès déjà affiché par buy_shop_item
                         pass
@@ -387,9 +432,10 @@ class ImprovedGameUI:
         # Zone gauche (noire) - Grille du manoir
         self.draw_manor_grid()
         
-        # Afficher l'indicateur de direction sélectionnée (barre blanche)
+        # Afficher l'indicateur de direction sélectionnée (barre blanche) et les chances de l'offre
         if self.selected_direction:
             self.draw_direction_indicator()
+            self.draw_offer_odds()
 
         # Zone droite (blanche) - Inventaire et info
         pygame.draw.rect(self.screen, WHITE, (self.info_x, self.info_y, self.info_width, self.info_height))
@@ -402,7 +448,7 @@ class ImprovedGameUI:
 
         # Instructions
         y = self.screen_height - 60
-        inst = self.font_small.render("AWSD: Choose direction | SPACE: Confirm | Arrows: Move", True, WHITE)
+        inst = self.font_small.render("AWSD: Choose direction | SPACE: Confirm | Arrows: Move | H: Hint", True, WHITE)
         self.screen.blit(inst, (self.screen_width // 2 - inst.get_width() // 2, y))
 
     def draw_room_selection_state(self):
@@ -459,6 +505,11 @@ class ImprovedGameUI:
             if i == self.selected_room_index:
                 pygame.draw.rect(self.screen, YELLOW, (x - 3, y_offset - 3, room_size + 6, room_size + 6), 4)
 
+            # Pièce conseillée
+            if self.advice and self.advice.best == i:
+                hint_surf = self.font_small.render("★ Conseil", True, GREEN)
+                self.screen.blit(hint_surf, (x, y_offset - 28))
+
             # Nom de la pièce
             name_surf = self.font_medium.render(room.name, True, BLACK)
             name_rect = name_surf.get_rect(center=(x + room_size // 2, y_offset + room_size + 30))
@@ -480,44 +531,64 @@ class ImprovedGameUI:
         inst = self.font_small.render("← → : Select | SPACE: Confirm | R: Redraw", True, WHITE)
         self.screen.blit(inst, (self.screen_width // 2 - inst.get_width() // 2, y))
 
+    def update_advice(self):
+        """Poursuit la recherche du conseiller pendant au plus ADVISOR_FRAME_BUDGET à cette image"""
+        search = self.advisor_search
+        if search is None or not search.is_current():
+            search = self.advisor_search = self.advisor.start(self.game)
+        remaining = self.advisor.budget - search.elapsed
+        if remaining > 0 and not search.finished:
+            self.advice = search.run(min(ADVISOR_FRAME_BUDGET, remaining))
+        else:
+            self.advice = search.advice()
+
     def draw_manor_grid(self):
-        """Dessine la grille du manoir avec images"""
-        for row in range(self.game.manor.height):
-            for col in range(self.game.manor.width):
-                x = self.grid_x + col * self.cell_size
-                y = self.grid_y + row * self.cell_size
+        """Dessine la grille du manoir avec images (fond et lignes, puis les seules pièces placées)"""
+        manor = self.game.manor
+        # Partie visible de la grille (un grand manoir déborde de l'écran)
+        rows = min(manor.height, (self.screen_height - self.grid_y) // self.cell_size + 1)
+        cols = min(manor.width, (self.screen_width - self.grid_x) // self.cell_size + 1)
+        width, height = cols * self.cell_size, rows * self.cell_size
+
+        # Cases vides: un fond et les lignes de la grille
+        pygame.draw.rect(self.screen, DARK_GRAY, (self.grid_x, self.grid_y, width, height))
+        for row in range(rows + 1):
+            y = self.grid_y + row * self.cell_size
+            pygame.draw.line(self.screen, GRAY, (self.grid_x, y), (self.grid_x + width, y))
+        for col in range(cols + 1):
+            x = self.grid_x + col * self.cell_size
+            pygame.draw.line(self.screen, GRAY, (x, self.grid_y), (x, self.grid_y + height))
+
+        for (row, col), room in manor.rooms.items():
+            if row >= rows or col >= cols:
+                continue
+            x = self.grid_x + col * self.cell_size
+            y = self.grid_y + row * self.cell_size
 
-                room = self.game.manor.get_room(row, col)
+            # Récupérer l'image avec rotation appliquée
+            img = self.get_room_image(room)
+            
+            # Fallback sur mapping couleur ou image aléatoire
+            if img is None:
+                if hasattr(self, 'color_to_image') and room.color.value in self.color_to_image:
+                    img = self.color_to_image[room.color.value]
+                elif len(self.room_images) > 0:
+                    img = list(self.room_images.values())[0]
+            
+            if img:
+                # Afficher l'image
+                img_scaled = pygame.transform.scale(img, (self.cell_size, self.cell_size))
+                self.screen.blit(img_scaled, (x, y))
+            else:
+                # Fallback final: couleur
+                color = ROOM_COLORS.get(room.color.value, GRAY)
+                pygame.draw.rect(self.screen, color, (x, y, self.cell_size, self.cell_size))
 
-                if room:
-                    # Récupérer l'image avec rotation appliquée
-                    img = self.get_room_image(room)
-                    
-                    # Fallback sur mapping couleur ou image aléatoire
-                    if img is None:
-                        if hasattr(self, 'color_to_image') and room.color.value in self.color_to_image:
-                            img = self.color_to_image[room.color.value]
-                        elif len(self.room_images) > 0:
-                            img = list(self.room_images.values())[0]
-                    
-                    if img:
-                        # Afficher l'image
-                        img_scaled = pygame.transform.scale(img, (self.cell_size, self.cell_size))
-                        self.screen.blit(img_scaled, (x, y))
-                    else:
-                        # Fallback final: couleur
-                        color = ROOM_COLORS.get(room.color.value, GRAY)
-                        pygame.draw.rect(self.screen, color, (x, y, self.cell_size, self.cell_size))
-
-                    # Bordure pour position du joueur
-                    if (row, col) == self.game.player.position:
-                        pygame.draw.rect(self.screen, YELLOW, (x, y, self.cell_size, self.cell_size), 3)
-                    else:
-                        pygame.draw.rect(self.screen, WHITE, (x, y, self.cell_size, self.cell_size), 1)
-                else:
-                    # Case vide
-                    pygame.draw.rect(self.screen, DARK_GRAY, (x, y, self.cell_size, self.cell_size))
-                    pygame.draw.rect(self.screen, GRAY, (x, y, self.cell_size, self.cell_size), 1)
+            # Bordure pour position du joueur
+            if (row, col) == self.game.player.position:
+                pygame.draw.rect(self.screen, YELLOW, (x, y, self.cell_size, self.cell_size), 3)
+            else:
+                pygame.draw.rect(self.screen, WHITE, (x, y, self.cell_size, self.cell_size), 1)
 
     def draw_inventory_panel(self):
         """Dessine l'inventaire avec icônes"""
@@ -600,6 +671,17 @@ class ImprovedGameUI:
             effect_surf = self.font_small.render(current_room.effect.description[:50], True, BLUE)
             self.screen.blit(effect_surf, (x, y))
 
+    def draw_offer_odds(self):
+        """Probabilité de voir chaque couleur dans l'offre de la porte sélectionnée (calcul exact, en cache)"""
+        odds = self.game.offer_odds(self.selected_direction)
+        if odds is None or not odds.size:
+            return
+        colors = sorted(odds.colors.items(), key=lambda item: -item[1])
+        text = f"Offre ({odds.candidates} pièces): " + "  ".join(
+            f"{color.value} {probability:.0%}" for color, probability in colors)
+        surf = self.font_small.render(text, True, WHITE)
+        self.screen.blit(surf, (self.screen_width // 2 - surf.get_width() // 2, self.screen_height - 90))
+
     def draw_direction_indicator(self):
         """Dessine une barre blanche PARALLÈLE au côté de la grille pour la direction sélectionnée"""
         if not self.selected_direction:
@@ -652,6 +734,42 @@ class ImprovedGameUI:
             # ESC pour sortir sans ramasser
             elif event.key == pygame.K_ESCAPE:
                 self.game.exit_room_interaction()
+            # H pour un indice (prendre ou laisser l'objet sélectionné)
+            elif event.key == pygame.K_h:
+                self.show_hint()
+
+    def show_hint(self):
+        """Lance la recherche du meilleur coup (poursuivie à chaque image par update_hint)"""
+        self.hint_search = self.hint_agent.start(self.game)
+        print("💡 Recherche d'un indice...")
+
+    def update_hint(self):
+        """Poursuit la recherche de l'indice pendant au plus HINT_FRAME_BUDGET, le propose une fois terminée"""
+        search = self.hint_search
+        if search is None:
+            return
+        if not search.is_current():
+            self.hint_search = None  # La partie a avancé: indice abandonné
+            return
+        result = search.run(HINT_FRAME_BUDGET)
+        if not search.finished:
+            return
+        self.hint_search = None
+        action = result.action
+        if action is None:
+            print("💡 Aucun coup possible")
+            return
+        kind, argument = action
+        if kind == DIRECTION:
+            target = self.game.manor.get_adjacent_position(self.game.player.position, argument)
+            if self.game.manor.get_room(*target) is None:
+                self.selected_direction = argument  # ESPACE pour confirmer
+                print(f"💡 Indice: ouvrir la porte {argument.value} ({result.playouts} simulations)")
+            else:
+                print(f"💡 Indice: aller vers {argument.value} ({result.playouts} simulations)")
+        else:
+            advice = "prendre l'objet" if kind == TAKE else "passer à l'objet suivant"
+            print(f"💡 Indice: {advice} ({result.playouts} simulations)")
 
     def draw_room_interaction_state(self):
         """Dessine l'interface d'interaction avec les objets (Walk-in Closet)"""
@@ -689,21 +807,8 @@ class ImprovedGameUI:
             if len(self.game.room_objects) > 0:
                 for i, obj in enumerate(self.game.room_objects):
                     # Nom de l'objet
-                    if obj.name == "Gâteau":
-                        obj_text = "Take cake"
-                        color = BLUE if i == self.game.selected_object_index else BLACK
-                    elif obj.name == "Gemmes":
-                        obj_text = "Take gem"
-                        color = BLUE if i == self.game.selected_object_index else BLACK
-                    elif obj.name == "Clés":
-                        obj_text = "Take key"
-                        color = BLUE if i == self.game.selected_object_index else BLACK
-                    elif obj.name == "Dés":
-                        obj_text = "Take dice"
-                        color = BLUE if i == self.game.selected_object_index else BLACK
-                    else:
-                        obj_text = f"Take {obj.name}"
-                        color = BLUE if i == self.game.selected_object_index else BLACK
+                    obj_text = TAKE_LABELS.get(obj.kind, f"Take {obj.name}")
+                    color = BLUE if i == self.game.selected_object_index else BLACK
                     
                     text = self.font_medium.render(obj_text, True, color)
                     self.screen.blit(text, (self.info_x + 40, y_offset))
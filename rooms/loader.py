@@ -0,0 +1,131 @@
+"""
+Chargement du catalogue de pièces depuis un fichier de données (JSON)
+Au premier chargement, le fichier est compilé en un tuple de RoomDefinition
+sérialisé (pickle) dans data/.cache, nommé d'après l'empreinte SHA-256 du
+fichier: les démarrages suivants lisent directement ce cache, sans analyser
+le JSON ni construire les objets.
+Changer le format compilé (RoomDefinition, classes d'objets) => incrémenter
+CACHE_FORMAT pour invalider les anciens caches.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import functools
+import hashlib
+import json
+import pickle
+from typing import Any, Dict, Optional, Tuple
+
+from core.game_objects import Direction, RoomColor, GameObject, RoomEffect
+from rooms.room import RoomDefinition
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "rooms.json")
+CACHE_FORMAT = 2
+
+
+@functools.lru_cache(maxsize=None)
+def _object_types() -> Dict[str, type]:
+    """Classes d'objets utilisables dans le fichier (importées seulement pour compiler)"""
+    from items import consumables, food, interactive, permanent
+    types = {}
+    for module in (consumables, food, interactive, permanent):
+        for name, value in vars(module).items():
+            if isinstance(value, type) and issubclass(value, GameObject) and value.__module__ == module.__name__:
+                types[name] = value
+    return types
+
+
+@functools.lru_cache(maxsize=None)
+def _effect_types() -> Dict[str, type]:
+    """Classes d'effets utilisables dans le fichier"""
+    from rooms import effects
+    return {name: value for name, value in vars(effects).items()
+            if isinstance(value, type) and issubclass(value, RoomEffect) and value is not RoomEffect}
+
+
+def build_object(spec: Dict[str, Any]) -> GameObject:
+    """Crée un objet à partir de sa description ({"type": "Gold", "quantity": 40})"""
+    cls = _object_types()[spec["type"]]
+    if "contents" in spec:
+        return cls([build_object(item) for item in spec["contents"]])
+    if "quantity" in spec:
+        return cls(spec["quantity"])
+    return cls()
+
+
+def build_effect(spec: Dict[str, Any]) -> RoomEffect:
+    """Crée un effet à partir de sa description (paramètres nommés du constructeur)"""
+    params = {key: value for key, value in spec.items() if key != "type"}
+    return _effect_types()[spec["type"]](**params)
+
+
+def compile_definitions(data: Dict[str, Any]) -> Tuple[RoomDefinition, ...]:
+    """Convertit le contenu du fichier en définitions figées"""
+    definitions = []
+    for entry in data["rooms"]:
+        shop_item = None
+        if "shop_item" in entry:
+            shop = entry["shop_item"]
+            # Fabrique appelée à chaque achat (partial est sérialisable, contrairement à un lambda)
+            shop_item = {'item': functools.partial(build_object, shop["item"]),
+                         'name': shop["name"], 'price': shop["price"]}
+        definitions.append(RoomDefinition.create(
+            name=entry["name"],
+            color=RoomColor(entry["color"]),
+            doors=[Direction(door) for door in entry["doors"]],
+            gem_cost=entry.get("gem_cost", 0),
+            rarity=entry.get("rarity", 0),
+            objects=[build_object(spec) for spec in entry.get("objects", [])],
+            effect=build_effect(entry["effect"]) if "effect" in entry else None,
+            image_path=entry.get("image_path"),
+            shop_item=shop_item
+        ))
+    return tuple(definitions)
+
+
+def _cache_path(path: str, raw: bytes) -> str:
+    digest = hashlib.sha256(raw + b"\0format=%d" % CACHE_FORMAT).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(os.path.dirname(path), ".cache", f"{name}-{digest}.pickle")
+
+
+def _write_cache(cache_path: str, definitions: Tuple[RoomDefinition, ...]) -> None:
+    """Écrit le cache (atomiquement) et supprime les versions périmées; ignore les erreurs d'écriture"""
+    directory = os.path.dirname(cache_path)
+    prefix = os.path.basename(cache_path).rsplit("-", 1)[0] + "-"
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(definitions, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        for entry in os.listdir(directory):
+            if entry.startswith(prefix) and entry.endswith(".pickle") and entry != os.path.basename(cache_path):
+                os.remove(os.path.join(directory, entry))
+    except OSError:
+        pass  # Répertoire en lecture seule: on recompilera au prochain démarrage
+
+
+def load_room_definitions(path: Optional[str] = None, use_cache: bool = True) -> Tuple[RoomDefinition, ...]:
+    """
+    Charge les définitions de pièces
+    path: fichier JSON (défaut: rooms/data/rooms.json)
+    use_cache: lire/écrire la version compilée à côté du fichier
+    """
+    path = path or DATA_PATH
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    cache_path = _cache_path(path, raw)
+    if use_cache:
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass  # Cache absent, illisible ou obsolète: recompiler
+
+    definitions = compile_definitions(json.loads(raw.decode("utf-8")))
+    if use_cache:
+        _write_cache(cache_path, definitions)
+    return definitions
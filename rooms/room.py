@@ -5,10 +5,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from typing import List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Callable, List, Mapping, NamedTuple, Optional, Tuple, TYPE_CHECKING
 import random
 
-from core.game_objects import Direction, RoomColor, RoomEffect, GameObject
+from core.game_objects import Direction, RoomColor, RoomEffect, GameObject, InteractiveObject, ItemKind
+from core.doors import DIRECTION_BITS, ROTATION_TABLE, MASK_DIRECTIONS, directions_to_mask
+from core.item_rules import apply_item
 
 if TYPE_CHECKING:
     from game1.player import Player
@@ -17,6 +19,8 @@ if TYPE_CHECKING:
 class Door:
     """Représente une porte entre deux pièces"""
 
+    __slots__ = ("direction", "lock_level", "is_opened")
+
     def __init__(self, direction: Direction, lock_level: int = 0):
         """
         direction: Direction de la porte
@@ -35,8 +39,8 @@ class Door:
             return True
 
         # Vérifier si le joueur a un kit de crochetage pour niveau 1
-        if self.lock_level == 1 and player.inventory.has_permanent_item("Kit de crochetage"):
-            print("Vous utilisez le kit de crochetage pour ouvrir la porte.")
+        if self.lock_level == 1 and player.inventory.has_permanent_kind(ItemKind.LOCKPICK_KIT):
+            player.events.emit("door_lockpicked", "Vous utilisez le kit de crochetage pour ouvrir la porte.")
             return True
 
         # Sinon, nécessite une clé
@@ -55,18 +59,19 @@ class Door:
             return True
 
         # Kit de crochetage pour niveau 1
-        if self.lock_level == 1 and player.inventory.has_permanent_item("Kit de crochetage"):
+        if self.lock_level == 1 and player.inventory.has_permanent_kind(ItemKind.LOCKPICK_KIT):
             self.is_opened = True
-            print("Porte crochetée!")
+            player.events.emit("door_lockpicked", "Porte crochetée!")
             return True
 
         # Utiliser une clé
         if player.inventory.spend_key():
             self.is_opened = True
-            print(f"Porte ouverte avec une clé! (Niveau {self.lock_level})")
+            player.events.emit("door_unlocked", "Porte ouverte avec une clé! (Niveau {level})", level=self.lock_level)
             return True
 
-        print(f"Vous avez besoin d'une clé pour ouvrir cette porte (niveau {self.lock_level}).")
+        player.events.emit("key_required", "Vous avez besoin d'une clé pour ouvrir cette porte (niveau {level}).",
+                           level=self.lock_level)
         return False
 
     def get_lock_description(self) -> str:
@@ -79,8 +84,64 @@ class Door:
             return "verrouillée à double tour"
 
 
+class RoomDefinition(NamedTuple):
+    """
+    Données figées d'une pièce du catalogue, partagées par toutes les parties
+    du processus. Les objets sont des prototypes copiés à l'instanciation.
+    """
+    name: str
+    color: RoomColor
+    door_mask: int  # Masque 4 bits avant rotation
+    gem_cost: int = 0
+    rarity: int = 0
+    objects: Tuple[GameObject, ...] = ()
+    effect: Optional[RoomEffect] = None
+    image_path: Optional[str] = None
+    placement_condition: Optional[Callable] = None
+    shop_item: Optional[Mapping[str, Any]] = None
+
+    @classmethod
+    def create(
+            cls,
+            name: str,
+            color: RoomColor,
+            doors: List[Direction],
+            gem_cost: int = 0,
+            rarity: int = 0,
+            objects: Optional[List[GameObject]] = None,
+            effect: Optional[RoomEffect] = None,
+            image_path: Optional[str] = None,
+            placement_condition: Optional[callable] = None,
+            shop_item: Optional[dict] = None
+    ) -> 'RoomDefinition':
+        """Construit une définition avec les mêmes paramètres que Room"""
+        return cls(name, color, directions_to_mask(doors), gem_cost, rarity,
+                   tuple(objects) if objects else (), effect, image_path, placement_condition, shop_item)
+
+    def get_probability_weight(self) -> float:
+        """Calcule le poids de probabilité basé sur la rareté"""
+        # Chaque niveau de rareté divise la probabilité par 3
+        return 1.0 / (3 ** self.rarity)
+
+    def can_be_placed(self, row: int, col: int, grid_height: int, grid_width: int) -> bool:
+        """Vérifie si la pièce peut être placée à cette position"""
+        if self.placement_condition:
+            return self.placement_condition(row, col, grid_height, grid_width)
+        return True
+
+    def instantiate(self, rotation_degrees: int = 0) -> 'Room':
+        """Crée l'instance de partie (objets copiés, rotation appliquée)"""
+        return Room.from_definition(self, rotation_degrees)
+
+
 class Room:
-    """Représente une pièce du manoir"""
+    """
+    Pièce d'une partie: état mutable (rotation, portes, objets, visite, achat)
+    au-dessus d'une RoomDefinition partagée
+    """
+
+    __slots__ = ("definition", "door_mask", "objects", "shop_purchased", "doors", "position",
+                 "visited", "rotation_degrees")
 
     def __init__(
             self,
@@ -107,16 +168,25 @@ class Room:
         placement_condition: Fonction qui vérifie si la pièce peut être placée à une position
         shop_item: Dict avec 'item', 'price' pour les magasins YELLOW
         """
-        self.name = name
-        self.color = color
-        self.doors_directions = doors
-        self.gem_cost = gem_cost
-        self.rarity = rarity
-        self.objects = objects if objects else []
-        self.effect = effect
-        self.image_path = image_path
-        self.placement_condition = placement_condition
-        self.shop_item = shop_item
+        definition = RoomDefinition.create(name, color, doors, gem_cost, rarity, objects, effect,
+                                           image_path, placement_condition, shop_item)
+        self._init_state(definition, objects if objects else [])
+
+    @classmethod
+    def from_definition(cls, definition: RoomDefinition, rotation_degrees: int = 0) -> 'Room':
+        """Instancie une définition partagée (appelé au tirage ou au placement)"""
+        room = cls.__new__(cls)
+        room._init_state(definition, [obj.clone() for obj in definition.objects])
+        if rotation_degrees:
+            room.rotate(rotation_degrees)
+        return room
+
+    def _init_state(self, definition: RoomDefinition, objects: List[GameObject]) -> None:
+        """État propre à la partie"""
+        self.definition = definition
+        # Portes stockées en masque 4 bits (N=1, E=2, S=4, O=8)
+        self.door_mask = definition.door_mask
+        self.objects = objects
         self.shop_purchased = False  # Pour éviter les achats multiples
 
         # Portes réelles avec leur niveau de verrouillage (créées lors du placement)
@@ -131,14 +201,41 @@ class Room:
         # Rotation appliquée (0, 90, 180, 270). Affecte uniquement la logique des portes.
         self.rotation_degrees = 0
 
-    def initialize_doors(self, row: int, total_rows: int):
-        """Initialise les portes avec des niveaux de verrouillage aléatoires"""
+    # Données figées lues dans la définition
+    name = property(lambda self: self.definition.name)
+    color = property(lambda self: self.definition.color)
+    base_door_mask = property(lambda self: self.definition.door_mask)  # Masque avant rotation
+    gem_cost = property(lambda self: self.definition.gem_cost)
+    rarity = property(lambda self: self.definition.rarity)
+    effect = property(lambda self: self.definition.effect)
+    image_path = property(lambda self: self.definition.image_path)
+    placement_condition = property(lambda self: self.definition.placement_condition)
+    shop_item = property(lambda self: self.definition.shop_item)
+
+    @property
+    def doors_directions(self) -> List[Direction]:
+        """Vue liste des directions des portes (dérivée du masque)"""
+        return list(MASK_DIRECTIONS[self.door_mask])
+
+    @doors_directions.setter
+    def doors_directions(self, doors: List[Direction]) -> None:
+        self.door_mask = directions_to_mask(doors)
+
+    def fits(self, required_mask: int = 0, forbidden_mask: int = 0) -> bool:
+        """Vérifie que la pièce a toutes les portes requises et aucune porte interdite"""
+        return (self.door_mask & required_mask) == required_mask and not (self.door_mask & forbidden_mask)
+
+    def initialize_doors(self, row: int, total_rows: int, rng: Optional[random.Random] = None):
+        """
+        Initialise les portes avec des niveaux de verrouillage aléatoires
+        rng: flux aléatoire des verrous (ex: game.rng.locks), module random par défaut
+        """
         for direction in self.doors_directions:
             # Calculer le niveau de verrouillage en fonction de la progression
-            lock_level = self._calculate_lock_level(row, total_rows)
+            lock_level = self._calculate_lock_level(row, total_rows, rng)
             self.doors[direction] = Door(direction, lock_level)
 
-    def _calculate_lock_level(self, row: int, total_rows: int) -> int:
+    def _calculate_lock_level(self, row: int, total_rows: int, rng: Optional[random.Random] = None) -> int:
         """Calcule le niveau de verrouillage en fonction de la position"""
         if row == 0:
             # Première rangée: toujours déverrouillé
@@ -149,7 +246,7 @@ class Room:
         else:
             # Probabilité croissante de verrouillage
             progress = row / total_rows
-            rand = random.random()
+            rand = (rng or random).random()
 
             if rand < progress * 0.3:
                 return 2  # Double tour
@@ -164,11 +261,12 @@ class Room:
 
     def has_door(self, direction: Direction) -> bool:
         """Vérifie si la pièce a une porte dans une direction"""
-        return direction in self.doors_directions
+        return bool(self.door_mask & DIRECTION_BITS[direction])
 
     def enter(self, player: 'Player') -> None:
         """Appelé quand le joueur entre dans la pièce"""
         self.visited = True
+        events = player.events
 
         # ========================================
         # APPLIQUER LES RÈGLES PAR COULEUR
@@ -179,40 +277,43 @@ class Room:
             if self.shop_item and not self.shop_purchased:
                 item_name = self.shop_item.get('name', 'objet mystère')
                 price = self.shop_item.get('price', 10)
-                print(f"💰 Vous entrez dans un magasin.")
-                print(f"🛒 Vous pouvez acheter: {item_name} pour {price} pièces d'or")
-                print(f"💵 Vous avez: {player.inventory.gold.quantity} pièces")
-                print(f"⌨️  Appuyez sur G pour acheter, ou continuez sans acheter")
+                events.emit("shop_entered",
+                            "💰 Vous entrez dans un magasin.\n"
+                            "🛒 Vous pouvez acheter: {item_name} pour {price} pièces d'or\n"
+                            "💵 Vous avez: {gold} pièces\n"
+                            "⌨️  Appuyez sur G pour acheter, ou continuez sans acheter",
+                            room=self, item_name=item_name, price=price, gold=player.inventory.gold.quantity)
             elif self.shop_purchased:
-                print("💰 Ce magasin est vide. Vous avez déjà acheté l'objet.")
+                events.emit("shop_empty", "💰 Ce magasin est vide. Vous avez déjà acheté l'objet.", room=self)
             else:
-                print("💰 Vous entrez dans un magasin (pas d'objet disponible).")
+                events.emit("shop_empty", "💰 Vous entrez dans un magasin (pas d'objet disponible).", room=self)
             
         elif self.color == RoomColor.GREEN:
             # 🟢 JARDINS: Gemmes, trous à creuser, objets permanents
-            print("🌿 Vous entrez dans un jardin. Cherchez des gemmes et des endroits où creuser!")
+            events.emit("room_color", "🌿 Vous entrez dans un jardin. Cherchez des gemmes et des endroits où creuser!",
+                        room=self)
             # Les jardins ont souvent des gemmes (déjà dans objects)
             
         elif self.color == RoomColor.PURPLE:
             # 🟣 CHAMBRES: Effets permettant de regagner des pas
-            print("😴 Vous entrez dans une chambre. Un lieu de repos.")
+            events.emit("room_color", "😴 Vous entrez dans une chambre. Un lieu de repos.", room=self)
             # TODO: Ajouter effet de récupération automatique
             # Exemple: player.inventory.steps.quantity += 2
             
         elif self.color == RoomColor.ORANGE:
             # 🟠 COULOIRS: Beaucoup de portes
-            print("🚪 Vous êtes dans un couloir avec plusieurs portes.")
+            events.emit("room_color", "🚪 Vous êtes dans un couloir avec plusieurs portes.", room=self)
             # Les couloirs ont déjà beaucoup de portes (dans doors_directions)
             
         elif self.color == RoomColor.RED:
             # 🔴 INDÉSIRABLES: Caractéristiques négatives
-            print("⚠️ Attention! Cette pièce semble dangereuse...")
+            events.emit("room_color", "⚠️ Attention! Cette pièce semble dangereuse...", room=self)
             # TODO: Effet négatif (retirer des pas, etc.)
             # Exemple: player.inventory.steps.quantity -= 2
             
         elif self.color == RoomColor.BLUE:
             # 🔵 COMMUNES: Effets variés
-            print(f"🏠 Vous entrez dans {self.name}.")
+            events.emit("room_color", "🏠 Vous entrez dans {room.name}.", room=self)
             # Les pièces bleues ont des effets variés (gérés par self.effect)
 
         # Appliquer l'effet de la pièce si elle en a un
@@ -221,15 +322,11 @@ class Room:
 
     def get_probability_weight(self) -> float:
         """Calcule le poids de probabilité basé sur la rareté"""
-        # Chaque niveau de rareté divise la probabilité par 3
-        return 1.0 / (3 ** self.rarity)
+        return self.definition.get_probability_weight()
 
     def can_be_placed(self, row: int, col: int, grid_height: int, grid_width: int) -> bool:
         """Vérifie si la pièce peut être placée à cette position"""
-        # Vérifier la condition de placement personnalisée
-        if self.placement_condition:
-            return self.placement_condition(row, col, grid_height, grid_width)
-        return True
+        return self.definition.can_be_placed(row, col, grid_height, grid_width)
 
     def interact_with_object(self, object_index: int, player: 'Player') -> bool:
         """Interagir avec un objet de la pièce"""
@@ -253,21 +350,22 @@ class Room:
     def buy_shop_item(self, player: 'Player') -> bool:
         """Permet au joueur d'acheter l'objet du magasin"""
         if self.color != RoomColor.YELLOW:
-            print("❌ Cette pièce n'est pas un magasin!")
+            player.events.emit("not_a_shop", "❌ Cette pièce n'est pas un magasin!")
             return False
         
         if not self.shop_item:
-            print("❌ Pas d'objet disponible dans ce magasin.")
+            player.events.emit("shop_empty", "❌ Pas d'objet disponible dans ce magasin.", room=self)
             return False
         
         if self.shop_purchased:
-            print("❌ Vous avez déjà acheté l'objet de ce magasin!")
+            player.events.emit("shop_empty", "❌ Vous avez déjà acheté l'objet de ce magasin!", room=self)
             return False
         
         price = self.shop_item.get('price', 10)
         
         if player.inventory.gold.quantity < price:
-            print(f"❌ Pas assez d'or! Vous avez {player.inventory.gold.quantity}, il faut {price} pièces.")
+            player.events.emit("not_enough_gold", "❌ Pas assez d'or! Vous avez {gold}, il faut {price} pièces.",
+                               gold=player.inventory.gold.quantity, price=price)
             return False
         
         # Déduire l'or
@@ -281,22 +379,18 @@ class Room:
             if hasattr(item, '__call__'):  # Si c'est une fonction qui crée l'objet
                 item = item()
             
-            # Ajouter l'objet à l'inventaire
-            if hasattr(item, 'quantity'):
-                # Objet consommable
-                player.inventory.add_item(item)
-            else:
-                # Objet permanent
-                player.inventory.add_permanent_item(item)
+            # Ajouter l'objet à l'inventaire (table des règles, sans outil requis)
+            apply_item(player, item)
         
         self.shop_purchased = True
-        print(f"✅ Vous avez acheté: {item_name} pour {price} pièces!")
-        print(f"💰 Or restant: {player.inventory.gold.quantity}")
+        player.events.emit("shop_purchase", "✅ Vous avez acheté: {item_name} pour {price} pièces!\n💰 Or restant: {gold}",
+                           room=self, item_name=item_name, price=price, gold=player.inventory.gold.quantity)
         return True
 
     def rotate(self, degrees: int) -> None:
         """Rotate the room's logical door directions clockwise by degrees (must be 0,90,180,270).
-        This mutates self.doors_directions so later initialization reflects the rotation.
+        This mutates the door mask (via the precomputed rotation table) so later
+        initialization reflects the rotation.
         """
         if degrees % 90 != 0:
             raise ValueError("degrees must be a multiple of 90")
@@ -305,53 +399,30 @@ class Room:
         if degrees == 0:
             return
 
-        # clockwise rotation mapping
-        order = [Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST]
-        mapping = {}
-        steps = (degrees // 90) % 4
-        for i, d in enumerate(order):
-            mapping[d] = order[(i + steps) % 4]
-
-        # apply mapping to doors_directions
-        rotated = [mapping.get(d, d) for d in self.doors_directions]
-        # deduplicate while preserving order
-        seen = set()
-        new_doors = []
-        for d in rotated:
-            if d not in seen:
-                seen.add(d)
-                new_doors.append(d)
-
-        self.doors_directions = new_doors
-        self.rotation_degrees = degrees
+        self.door_mask = ROTATION_TABLE[self.door_mask][degrees // 90]
+        self.rotation_degrees = (self.rotation_degrees + degrees) % 360
 
-    def rotate(self, degrees: int) -> None:
-        """Rotate the room's logical door directions clockwise by degrees (must be 0,90,180,270).
-        This mutates self.doors_directions so later initialization reflects the rotation.
+    def getstate(self) -> tuple:
         """
-        if degrees % 90 != 0:
-            raise ValueError("degrees must be a multiple of 90")
-
-        degrees = degrees % 360
-        if degrees == 0:
-            return
-
-        # clockwise rotation mapping
-        order = [Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST]
-        mapping = {}
-        steps = (degrees // 90) % 4
-        for i, d in enumerate(order):
-            mapping[d] = order[(i + steps) % 4]
-
-        # apply mapping to doors_directions
-        rotated = [mapping.get(d, d) for d in self.doors_directions]
-        # deduplicate while preserving order
-        seen = set()
-        new_doors = []
-        for d in rotated:
-            if d not in seen:
-                seen.add(d)
-                new_doors.append(d)
-
-        self.doors_directions = new_doors
-        self.rotation_degrees = degrees
\ No newline at end of file
+        État mutable de la pièce (Game.snapshot): les objets et les portes sont
+        partagés, seuls leurs champs modifiables sont copiés
+        """
+        containers = tuple((obj, obj.is_opened, tuple(obj.contents))
+                           for obj in self.objects if isinstance(obj, InteractiveObject))
+        doors = tuple((door, door.lock_level, door.is_opened) for door in self.doors.values())
+        return (self.door_mask, self.rotation_degrees, self.position, self.visited, self.shop_purchased,
+                tuple(self.objects), containers, doors)
+
+    def setstate(self, state: tuple) -> None:
+        """Restaure un état retourné par getstate"""
+        (self.door_mask, self.rotation_degrees, self.position, self.visited, self.shop_purchased,
+         objects, containers, doors) = state
+        self.objects = list(objects)
+        for obj, is_opened, contents in containers:
+            obj.is_opened = is_opened
+            obj.contents = list(contents)
+        self.doors = {}
+        for door, lock_level, is_opened in doors:
+            door.lock_level = lock_level
+            door.is_opened = is_opened
+            self.doors[door.direction] = door
@@ -0,0 +1,162 @@
+"""
+Index des pièces non utilisées par signature de portes
+Clé: (porte requise, masque des portes interdites) -> pièces compatibles.
+Chaque pièce est décrite par l'ensemble des masques qu'elle peut prendre
+(bit m = masque m: toutes ses rotations, ou son seul masque si elle ne tourne
+pas); elle est compatible si l'un d'eux convient (core.doors.FITTING).
+Un ensemble est construit à la première recherche de sa clé, puis tenu à
+jour: retirer une pièce placée coûte O(1) par clé déjà construite.
+getstate/setstate partagent les structures (copie à l'écriture): une
+sauvegarde ne copie rien, la première modification suivante copie l'ensemble.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from core.doors import FITTING
+
+
+class RoomSet:
+    """Ensemble (pièces ou indices de pièces) avec ajout, retrait et tirage en O(1)"""
+
+    def __init__(self, rooms: Iterable[Hashable] = ()):
+        """rooms: éléments initiaux (distincts)"""
+        self._rooms: List[Hashable] = list(rooms)
+        self._positions: Dict[Hashable, int] = {room: i for i, room in enumerate(self._rooms)}
+        self._shared = False  # Structures référencées par un getstate: copier avant d'écrire
+
+    def _own(self) -> None:
+        if self._shared:
+            self._rooms = list(self._rooms)
+            self._positions = dict(self._positions)
+            self._shared = False
+
+    def add(self, room: Hashable) -> None:
+        if room in self._positions:
+            return
+        self._own()
+        self._positions[room] = len(self._rooms)
+        self._rooms.append(room)
+
+    def discard(self, room: Hashable) -> bool:
+        """Retire un élément (échange avec le dernier puis pop)"""
+        if room not in self._positions:
+            return False
+        self._own()
+        position = self._positions.pop(room)
+        last = self._rooms.pop()
+        if position < len(self._rooms):
+            self._rooms[position] = last
+            self._positions[last] = position
+        return True
+
+    def choice(self, rng: random.Random) -> Hashable:
+        """Tire un élément uniformément (l'ensemble ne doit pas être vide)"""
+        return self._rooms[rng.randrange(len(self._rooms))]
+
+    def sample(self, rng: random.Random, count: int) -> List[Hashable]:
+        """Tire jusqu'à count éléments distincts"""
+        return rng.sample(self._rooms, min(count, len(self._rooms)))
+
+    def getstate(self) -> tuple:
+        """État partagé (ordre interne compris: les tirages rejoués sont identiques)"""
+        self._shared = True
+        return self._rooms, self._positions
+
+    def setstate(self, state: tuple) -> None:
+        self._rooms, self._positions = state
+        self._shared = True
+
+    def __contains__(self, room: Hashable) -> bool:
+        return room in self._positions
+
+    def __len__(self) -> int:
+        return len(self._rooms)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._rooms)
+
+
+class DoorSignatureIndex:
+    """Pièces non utilisées indexées par (porte requise, portes interdites)"""
+
+    def __init__(self, entries: Iterable[Tuple[Hashable, int]] = (),
+                 builder: Optional[Callable[[int, int], Iterable[Hashable]]] = None):
+        """
+        entries: couples (pièce ou indice, ensemble des masques possibles)
+        builder(requise, interdites): membres d'une clé pas encore construite, dans
+        l'ordre d'insertion des entrées (None = parcours des ensembles)
+        """
+        self._shapes: Dict[Hashable, int] = dict(entries)
+        self._builder = builder
+        self._sets: Dict[Tuple[int, int], RoomSet] = {}
+        self._shared = False
+
+    def _own(self) -> None:
+        if self._shared:
+            self._shapes = dict(self._shapes)
+            self._shared = False
+
+    def add(self, room: Hashable, shapes: int) -> None:
+        self._own()
+        self._shapes[room] = shapes
+        for (required, forbidden), members in self._sets.items():
+            if shapes & FITTING[required][forbidden]:
+                members.add(room)
+
+    def discard(self, room: Hashable) -> None:
+        if room not in self._shapes:
+            return
+        self._own()
+        del self._shapes[room]
+        for members in self._sets.values():
+            members.discard(room)
+
+    def update(self, room: Hashable, shapes: int) -> None:
+        """Reclasse une pièce dont les masques possibles ont changé"""
+        if room in self._shapes:
+            self.discard(room)
+            self.add(room, shapes)
+
+    def lookup(self, required: int = 0, forbidden: int = 0) -> RoomSet:
+        """Pièces pouvant avoir la porte requise et aucune porte interdite"""
+        members = self._sets.get((required, forbidden))
+        if members is None:
+            if self._builder is not None:
+                members = RoomSet(self._builder(required, forbidden))
+            else:
+                fitting = FITTING[required][forbidden]
+                members = RoomSet(room for room, shapes in self._shapes.items() if shapes & fitting)
+            self._sets[(required, forbidden)] = members
+        return members
+
+    def distinct_masks(self) -> set:
+        """Masques de portes possibles parmi les pièces indexées (16 au plus)"""
+        union = 0
+        for shapes in self._shapes.values():
+            union |= shapes
+        return {mask for mask in range(16) if union >> mask & 1}
+
+    def getstate(self) -> tuple:
+        """Ensembles de masques et clés déjà construites, partagés jusqu'à la prochaine modification"""
+        self._shared = True
+        return self._shapes, {key: members.getstate() for key, members in self._sets.items()}
+
+    def setstate(self, state: tuple) -> None:
+        """Restaure un état retourné par getstate (les clés construites depuis seront reconstruites)"""
+        shapes, sets = state
+        self._shapes = shapes
+        self._shared = True
+        self._sets = {}
+        for key, members_state in sets.items():
+            members = self._sets[key] = RoomSet()
+            members.setstate(members_state)
+
+    def __contains__(self, room: Hashable) -> bool:
+        return room in self._shapes
+
+    def __len__(self) -> int:
+        return len(self._shapes)
@@ -0,0 +1,134 @@
+"""
+Tirage pondéré sans remise - arbre de Fenwick (Binary Indexed Tree)
+Chaque case porte un poids >= 0; tirage, mise à jour d'un poids et ajout
+d'une case coûtent O(log n). Un poids nul exclut la case du tirage.
+"""
+import random
+from typing import Iterable, List
+
+
+class FenwickSampler:
+    """Échantillonneur pondéré indexé par position (0 .. n-1)"""
+
+    def __init__(self, weights: Iterable[float] = ()):
+        self._weights: List[float] = [float(w) for w in weights]
+        self._tree: List[float] = [0.0] * (len(self._weights) + 1)
+        self._top = 1
+        self._total = 0.0
+        self._build()
+
+    def _build(self) -> None:
+        """Construction en O(n)"""
+        tree = self._tree
+        size = len(self._weights)
+        for i, weight in enumerate(self._weights, start=1):
+            tree[i] = weight
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self._top = 1
+        while self._top * 2 <= size:
+            self._top *= 2
+        self._total = self.prefix_sum(size)
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def weight(self, index: int) -> float:
+        return self._weights[index]
+
+    @property
+    def total(self) -> float:
+        """Somme de tous les poids (tenue à jour, O(1))"""
+        return self._total
+
+    def prefix_sum(self, count: int) -> float:
+        """Somme des poids des count premières cases"""
+        result = 0.0
+        i = count
+        while i > 0:
+            result += self._tree[i]
+            i -= i & -i
+        return result
+
+    def update(self, index: int, weight: float) -> None:
+        """Change le poids d'une case"""
+        delta = weight - self._weights[index]
+        if delta == 0:
+            return
+        self._weights[index] = weight
+        self._total += delta
+        i = index + 1
+        size = len(self._weights)
+        while i <= size:
+            self._tree[i] += delta
+            i += i & -i
+
+    def append(self, weight: float) -> int:
+        """Ajoute une case en fin d'arbre; retourne sa position"""
+        weight = float(weight)
+        self._weights.append(weight)
+        i = len(self._weights)
+        # Le nœud i couvre ]i - lowbit(i), i]: poids + somme des cases précédentes du bloc
+        self._tree.append(weight + self.prefix_sum(i - 1) - self.prefix_sum(i - (i & -i)))
+        self._total += weight
+        if self._top * 2 <= i:
+            self._top *= 2
+        return i - 1
+
+    def find(self, value: float) -> int:
+        """Plus petite position dont la somme préfixe dépasse value (descente en O(log n))"""
+        position = 0
+        step = self._top
+        tree = self._tree
+        size = len(self._weights)
+        while step:
+            nxt = position + step
+            if nxt <= size and tree[nxt] <= value:
+                position = nxt
+                value -= tree[nxt]
+            step >>= 1
+        return min(position, size - 1)
+
+    def draw(self, rng: random.Random) -> int:
+        """Tire une position proportionnellement aux poids (-1 si tout est nul)"""
+        total = self.total
+        if total <= 0:
+            return -1
+        index = self.find(rng.random() * total)
+        if self._weights[index] <= 0:
+            # Dérive d'arrondi sur les sommes partielles: reconstruire puis retirer
+            self._build()
+            total = self.total
+            if total <= 0:
+                return -1
+            index = self.find(rng.random() * total)
+        return index
+
+    def getstate(self) -> tuple:
+        """Copie de l'arbre (sommes partielles comprises: les tirages rejoués sont identiques)"""
+        return list(self._weights), list(self._tree), self._top, self._total
+
+    def setstate(self, state: tuple) -> None:
+        weights, tree, self._top, self._total = state
+        self._weights = list(weights)
+        self._tree = list(tree)
+
+    def sample(self, rng: random.Random, count: int) -> List[int]:
+        """
+        Tire count positions distinctes (sans remise).
+        Les poids sont mis à zéro pendant le tirage puis restaurés.
+        """
+        drawn = []
+        saved = []
+        for _ in range(count):
+            index = self.draw(rng)
+            if index < 0:
+                break
+            drawn.append(index)
+            saved.append(self._weights[index])
+            self.update(index, 0.0)
+        for index, weight in zip(drawn, saved):
+            self.update(index, weight)
+        return drawn
@@ -0,0 +1,228 @@
+"""
+Table en colonnes du catalogue (NumPy)
+Une ligne par définition, au même indice que RoomCatalog.definitions
+(catalog.instantiate(ligne) -> Room). Les filtres du tirage (porte requise,
+portes interdites, pièces utilisées, couleur, gratuité) s'écrivent en
+masques booléens sur les colonnes au lieu de boucles sur les objets.
+Une pièce orientable (au moins deux portes) peut prendre chacune de ses 4
+orientations au moment d'être proposée; une impasse garde la rotation tirée
+en début de partie. La colonne shapes donne l'ensemble des masques possibles.
+Les colonnes immuables (couleur, rareté, coût, masques, poids...) sont
+construites une fois par tuple de définitions et partagées par les parties;
+seules rotation, door_mask, shapes, used et removed sont propres à chaque catalogue.
+Ajouter une ligne (add_room) copie les colonnes partagées une fois, puis les
+colonnes sont des vues sur des tableaux à capacité doublée: O(1) amorti.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, TYPE_CHECKING
+
+import numpy as np
+
+from core.game_objects import RoomColor
+from core.doors import DOOR_COUNT, FITTING, ROTATION_SHAPES, ROTATION_TABLE
+
+if TYPE_CHECKING:
+    from rooms.room import RoomDefinition
+
+# Code de couleur (colonne color) -> RoomColor
+COLORS = tuple(RoomColor)
+COLOR_CODES: Dict[RoomColor, int] = {color: code for code, color in enumerate(COLORS)}
+
+# ROTATIONS[masque, quarts de tour] -> masque tourné
+ROTATIONS = np.array(ROTATION_TABLE, dtype=np.uint8)
+SHAPES = np.array(ROTATION_SHAPES, dtype=np.uint16)
+MASK_BITS = np.arange(16, dtype=np.uint16)
+DOORS = np.array(DOOR_COUNT, dtype=np.int8)
+
+# Nom -> (type, dimensions supplémentaires)
+# Colonnes immuables: partagées par tous les catalogues construits sur le même tuple de définitions
+STATIC_COLUMNS = {
+    "color": (np.int8, ()),          # COLOR_CODES
+    "rarity": (np.int16, ()),
+    "gem_cost": (np.int32, ()),
+    "masks": (np.uint8, (4,)),       # Masque de portes pour 0, 90, 180 et 270°
+    "rotatable": (bool, ()),         # Tournée au hasard en début de partie
+    "orientable": (bool, ()),        # Orientation choisie au placement (pas les impasses)
+    "weight": (np.float64, ()),      # Poids de rareté 1/3**rareté (sans multiplicateur)
+    "special": (bool, ()),           # Posée par le jeu lui-même (jamais proposée à la sélection)
+    "conditional": (bool, ()),       # Condition de placement à évaluer
+}
+# Colonnes propres à chaque partie
+GAME_COLUMNS = {
+    "rotation": (np.int8, ()),       # Quarts de tour tirés par le catalogue (orientation préférée)
+    "door_mask": (np.uint8, ()),     # masks[ligne, rotation]
+    "shapes": (np.uint16, ()),       # Masques possibles (bit m = masque m)
+    "used": (bool, ()),              # Placée ou retirée: plus tirable
+    "removed": (bool, ()),           # Retirée du catalogue (remove_room)
+}
+
+SHARED_TABLES = 4  # Tuples de définitions dont les colonnes immuables restent en cache
+
+# (id du tuple, pièces spéciales, pièces fixes) -> (tuple, colonnes immuables)
+_SHARED: Dict[tuple, tuple] = {}
+
+
+def static_columns(definitions: Sequence['RoomDefinition'], special: FrozenSet[str] = frozenset(),
+                   fixed: FrozenSet[str] = frozenset()) -> Dict[str, np.ndarray]:
+    """Colonnes immuables de definitions (une ligne par définition)"""
+    count = len(definitions)
+    data = _columns(STATIC_COLUMNS, count)
+    colors = np.array([d.color for d in definitions], dtype=object)
+    for color, code in COLOR_CODES.items():
+        data["color"][colors == color] = code  # Comparaisons par identité (pas de hachage d'Enum)
+    data["rarity"][:] = [d.rarity for d in definitions]
+    data["gem_cost"][:] = [d.gem_cost for d in definitions]
+    base = np.array([d.door_mask for d in definitions], dtype=np.uint8)
+    data["masks"][:] = ROTATIONS[base]
+    data["weight"][:] = 1.0 / 3.0 ** data["rarity"]
+    data["special"][:] = [d.name in special for d in definitions]
+    data["conditional"][:] = [d.placement_condition is not None for d in definitions]
+    rotatable = (base != 0) & ~np.array([d.name in fixed for d in definitions], dtype=bool)
+    data["rotatable"][:] = rotatable
+    data["orientable"][:] = rotatable & (DOORS[base] > 1)
+    return data
+
+
+def shared_static_columns(definitions: tuple, special: FrozenSet[str] = frozenset(),
+                          fixed: FrozenSet[str] = frozenset()) -> Dict[str, np.ndarray]:
+    """Colonnes immuables d'un tuple de définitions, construites une fois (lecture seule)"""
+    key = (id(definitions), special, fixed)
+    entry = _SHARED.get(key)
+    if entry is None or entry[0] is not definitions:
+        columns = static_columns(definitions, special, fixed)
+        for column in columns.values():
+            column.flags.writeable = False
+        entry = _SHARED[key] = (definitions, columns)
+        while len(_SHARED) > SHARED_TABLES:
+            del _SHARED[next(iter(_SHARED))]
+    return entry[1]
+
+
+def _columns(spec: Dict[str, tuple], capacity: int) -> Dict[str, np.ndarray]:
+    """Colonnes vides (remplies de zéros) à la capacité donnée"""
+    return {name: np.zeros((capacity,) + shape, dtype=dtype) for name, (dtype, shape) in spec.items()}
+
+
+def _grow(column: np.ndarray, size: int, capacity: int) -> np.ndarray:
+    """Copie d'une colonne à la capacité donnée, size premières lignes conservées"""
+    grown = np.zeros((capacity,) + column.shape[1:], dtype=column.dtype)
+    grown[:size] = column[:size]
+    return grown
+
+
+class CatalogTable:
+    """Colonnes parallèles du catalogue; la ligne i décrit catalog.definitions[i]"""
+
+    def __init__(self, definitions: Sequence['RoomDefinition'] = (), special: Iterable[str] = (),
+                 fixed: Iterable[str] = ()):
+        """
+        special: pièces posées par le jeu; fixed: pièces qui ne tournent jamais
+        Un tuple de définitions (get_room_definitions) partage ses colonnes
+        immuables avec les autres catalogues; elles sont copiées au premier extend
+        """
+        self.special_names = frozenset(special)
+        self.fixed_names = frozenset(fixed)
+        self.size = 0
+        # Pièces tirables (ni utilisées ni spéciales) pouvant prendre chaque masque de portes
+        self.mask_counts = np.zeros(16, dtype=np.int64)
+        if isinstance(definitions, tuple) and definitions:
+            self._static = shared_static_columns(definitions, self.special_names, self.fixed_names)
+            self._data = _columns(GAME_COLUMNS, len(definitions))
+            self._add_rows(0, len(definitions), None)
+        else:
+            self._static = _columns(STATIC_COLUMNS, 0)
+            self._data = _columns(GAME_COLUMNS, 0)
+            self._refresh()
+            self.extend(definitions)
+
+    def _refresh(self) -> None:
+        """Expose chaque colonne comme vue sur les size premières lignes (la colonne elle-même si pleine)"""
+        size = self.size
+        for columns in (self._static, self._data):
+            for name, column in columns.items():
+                setattr(self, name, column if len(column) == size else column[:size])
+
+    def extend(self, definitions: Sequence['RoomDefinition'], rotations: Optional[Sequence[int]] = None) -> None:
+        """Ajoute des lignes (rotations en degrés, 0 par défaut)"""
+        count = len(definitions)
+        if not count:
+            return
+        start, end = self.size, self.size + count
+        capacity = len(self._data["used"])
+        if end > capacity:
+            # Colonnes propres au catalogue (copie des colonnes partagées), à capacité doublée
+            capacity = max(16, end, 2 * capacity)
+            self._static = {name: _grow(column, start, capacity) for name, column in self._static.items()}
+            self._data = {name: _grow(column, start, capacity) for name, column in self._data.items()}
+        for name, column in static_columns(definitions, self.special_names, self.fixed_names).items():
+            self._static[name][start:end] = column
+        self._add_rows(start, end, rotations)
+
+    def _add_rows(self, start: int, end: int, rotations: Optional[Sequence[int]]) -> None:
+        """Colonnes de partie des lignes start..end (colonnes immuables déjà remplies)"""
+        data = self._data
+        data["used"][start:end] = False
+        data["removed"][start:end] = False
+        quarters = np.zeros(end - start, dtype=np.int8) if rotations is None else np.asarray(rotations) // 90
+        data["rotation"][start:end] = quarters
+        data["door_mask"][start:end] = self._static["masks"][np.arange(start, end), quarters]
+        self.size = end
+        self._refresh()
+        rows = np.arange(start, end)
+        self.shapes[rows] = self._shapes(rows)
+        offered = ~self.special[start:end]
+        self.mask_counts += self.mask_bits(self.shapes[start:end][offered]).sum(axis=0)
+
+    @staticmethod
+    def mask_bits(shapes: np.ndarray) -> np.ndarray:
+        """Ensembles de masques -> matrice (lignes, 16) de 0/1"""
+        return ((shapes[..., None] >> MASK_BITS) & 1).astype(np.int64)
+
+    def _shapes(self, rows: np.ndarray) -> np.ndarray:
+        """Masques possibles de lignes: toutes les orientations, ou la seule rotation tirée"""
+        return np.where(self.orientable[rows], SHAPES[self.masks[rows, 0]],
+                        1 << self.door_mask[rows].astype(np.uint16))
+
+    def set_rotations(self, rows: np.ndarray, degrees: np.ndarray) -> None:
+        """Fixe l'orientation préférée (degrés) de lignes (et les masques possibles des impasses)"""
+        counted = rows[~self.used[rows] & ~self.special[rows]]
+        self.mask_counts -= self.mask_bits(self.shapes[counted]).sum(axis=0)
+        self.rotation[rows] = np.asarray(degrees) // 90
+        self.door_mask[rows] = self.masks[rows, self.rotation[rows]]
+        self.shapes[rows] = self._shapes(rows)
+        self.mask_counts += self.mask_bits(self.shapes[counted]).sum(axis=0)
+
+    def set_used(self, row: int, used: bool = True) -> None:
+        """Marque une ligne utilisée (ou de nouveau tirable), compteurs par masque compris"""
+        if self.used[row] == used:
+            return
+        self.used[row] = used
+        if not self.special[row]:
+            bits = self.mask_bits(self.shapes[row])
+            self.mask_counts += -bits if used else bits
+
+    def unused(self, required: int = 0, forbidden: int = 0) -> np.ndarray:
+        """Masque des pièces tirables pouvant avoir la porte requise et aucune porte interdite"""
+        keep = ~self.used & ~self.special
+        if required or forbidden:
+            keep &= (self.shapes & FITTING[required][forbidden]) != 0
+        return keep
+
+    def color_is(self, color: RoomColor) -> np.ndarray:
+        return self.color == COLOR_CODES[color]
+
+    def weights(self, multipliers: Optional[Dict[RoomColor, float]] = None) -> np.ndarray:
+        """Poids de tirage: rareté x multiplicateur de la couleur"""
+        if not multipliers:
+            return self.weight
+        factors = np.ones(len(COLORS))
+        for color, multiplier in multipliers.items():
+            factors[COLOR_CODES[color]] = multiplier
+        return self.weight * factors[self.color]
+
+    def distinct_unused_masks(self) -> List[int]:
+        """Masques de portes possibles parmi les pièces tirables (O(16))"""
+        return np.flatnonzero(self.mask_counts).tolist()
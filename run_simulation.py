@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Lancement d'une simulation Monte Carlo (parties headless sur tous les cœurs)
+"""
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import time
+
+from simulation.policies import POLICIES
+from simulation.runner import run_simulations
+
+
+def run_batch(args):
+    """Simulation avec le moteur vectorisé (politique gloutonne intégrée)"""
+    from simulation.batch import BatchSimulator
+
+    print(f"🎲 Simulation par lots de {args.games} parties (NumPy)")
+    start = time.perf_counter()
+    totals = None
+    for index, first in enumerate(range(0, args.games, args.chunk)):
+        size = min(args.chunk, args.games - first)
+        summary = BatchSimulator(size, seed=args.seed + index).run().summary()
+        if totals is None:
+            totals = {key: 0.0 for key in summary}
+        for key, value in summary.items():
+            # Moyennes pondérées par la taille du lot
+            totals[key] += value if key in ("games", "wins", "turns") else value * size
+    elapsed = time.perf_counter() - start
+
+    games = int(totals["games"])
+    print(f"Parties: {games}  Victoires: {int(totals['wins'])} ({totals['wins'] / games:.2%})")
+    for key in ("steps_left", "rooms_placed", "gold", "gems", "keys"):
+        print(f"  {key:<13} moyenne {totals[key] / games:8.2f}")
+    print(f"⏱️  {elapsed:.2f} s ({games / elapsed:.0f} parties/s, {totals['turns'] / elapsed:.0f} tours/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation Monte Carlo de Blue Prince")
+    parser.add_argument("--games", type=int, default=10000, help="Nombre de parties")
+    parser.add_argument("--policy", choices=sorted(POLICIES) + ["mcts"], default="greedy", help="Politique de jeu")
+    parser.add_argument("--playouts", type=int, default=200,
+                        help="Simulations par décision pour --policy mcts (banc d'essai de difficulté)")
+    parser.add_argument("--workers", type=int, default=None, help="Nombre de processus (défaut: tous les cœurs)")
+    parser.add_argument("--chunk", type=int, default=200, help="Parties par tâche")
+    parser.add_argument("--seed", type=int, default=0, help="Première graine")
+    parser.add_argument("--engine", choices=["game", "batch"], default="game",
+                        help="game = moteur objet multi-processus, batch = simulateur NumPy par lots")
+    parser.add_argument("--prune", action="store_true",
+                        help="Arrêter les parties perdues d'avance (moteur objet, voir Game.is_hopeless)")
+    args = parser.parse_args()
+
+    if args.engine == "batch":
+        run_batch(args)
+        return
+
+    if args.policy == "mcts":
+        from simulation.mcts import MCTSPolicy
+        # Les parties sont déjà réparties sur les cœurs: un arbre par décision
+        policy = MCTSPolicy(playouts=args.playouts)
+    else:
+        policy = POLICIES[args.policy]()
+    start = time.perf_counter()
+    last_report = [start]
+
+    def report(results, stats):
+        now = time.perf_counter()
+        if now - last_report[0] >= 2.0:
+            last_report[0] = now
+            rate = stats.games / (now - start)
+            print(f"  ... {stats.games}/{args.games} parties ({rate:.0f}/s), victoires {stats.win_rate:.2%}")
+
+    print(f"🎲 Simulation de {args.games} parties (politique: {args.policy})")
+    stats = run_simulations(args.games, policy, workers=args.workers, chunk_size=args.chunk,
+                            base_seed=args.seed, prune=args.prune, on_chunk=report)
+    elapsed = time.perf_counter() - start
+
+    print(stats)
+    print(f"⏱️  {elapsed:.2f} s ({stats.games / elapsed:.0f} parties/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""
+Package simulation - Parties automatiques et simulations Monte Carlo
+"""
+from .policies import Policy, RandomPolicy, GreedyPolicy, POLICIES, legal_directions
+from .runner import GameResult, SimulationStats, drive_game, play_game, run_simulations
+from .transposition import TranspositionTable
+from .advisor import Advice, AdvisorSearch, RoomAdvisor
+from .actions import legal_actions, step
+from .endgame import EndgameSolver, Solution, estimate_states, is_endgame
+from .mcts import MCTSAgent, MCTSPolicy, MCTSResult, MCTSSearch, MCTSTree
+
+__all__ = [
+    'Policy', 'RandomPolicy', 'GreedyPolicy', 'POLICIES', 'legal_directions',
+    'GameResult', 'SimulationStats', 'drive_game', 'play_game', 'run_simulations',
+    'TranspositionTable', 'Advice', 'AdvisorSearch', 'RoomAdvisor',
+    'legal_actions', 'step', 'EndgameSolver', 'Solution', 'estimate_states', 'is_endgame',
+    'MCTSAgent', 'MCTSPolicy', 'MCTSResult', 'MCTSSearch', 'MCTSTree'
+]
@@ -0,0 +1,101 @@
+"""
+Coups d'une partie sans interface: liste des coups légaux et transition step()
+Un coup est un tuple (type, argument) hachable et picklable:
+  (DIRECTION, Direction)  ouvrir une porte (tirage de pièces) ou s'y déplacer (W/A/D + ESPACE)
+  (ROOM, index)           placer une pièce de pending_room_selection
+  (REROLL, None)          relancer le tirage avec un dé
+  (PASS, None)            laisser la porte fermée (aucune pièce abordable, aucun dé)
+  (TAKE, None)            ramasser l'objet sélectionné
+  (SKIP, None)            passer à l'objet suivant (ou sortir après le dernier)
+Utilisé par drive_game (politiques) et par les recherches (MCTS).
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Any, List, Optional, Tuple, TYPE_CHECKING
+
+from game1.game import GameState
+from simulation.policies import Policy, legal_directions
+
+if TYPE_CHECKING:
+    from game1.game import Game
+
+DIRECTION = "direction"
+ROOM = "room"
+REROLL = "reroll"
+PASS = "pass"
+TAKE = "take"
+SKIP = "skip"
+
+Action = Tuple[str, Any]
+
+
+def legal_actions(game: 'Game') -> List[Action]:
+    """Coups jouables dans l'état actuel (liste vide: partie terminée ou joueur bloqué)"""
+    if game.state == GameState.ROOM_INTERACTION:
+        return [(TAKE, None), (SKIP, None)]
+    if game.state == GameState.ROOM_SELECTION:
+        actions: List[Action] = [(ROOM, i) for i, room in enumerate(game.pending_room_selection)
+                                 if game.player.can_afford_room(room.gem_cost)]
+        if game.player.inventory.dice.quantity > 0:
+            actions.append((REROLL, None))
+        return actions or [(PASS, None)]
+    if game.state == GameState.PLAYING:
+        return [(DIRECTION, direction) for direction, _ in legal_directions(game)]
+    return []
+
+
+def _skip(game: 'Game') -> None:
+    if game.selected_object_index >= len(game.room_objects) - 1:
+        game.exit_room_interaction()
+    else:
+        game.navigate_objects(1)
+
+
+def _close_door(game: 'Game') -> None:
+    """Aucune pièce placée: la porte reste fermée"""
+    game.pending_room_selection = []
+    game.selected_direction = None
+    game.state = GameState.PLAYING
+
+
+def step(game: 'Game', action: Action) -> None:
+    """
+    Joue un coup. Un coup impossible se replie sur le suivant, comme à la main:
+    pièce refusée -> relance, relance impossible -> porte fermée, objet refusé -> suivant
+    """
+    kind, argument = action
+    if kind == TAKE:
+        if not game.take_selected_object() and game.state == GameState.ROOM_INTERACTION:
+            _skip(game)
+    elif kind == SKIP:
+        _skip(game)
+    elif kind == ROOM or kind == REROLL:
+        if kind == ROOM and game.select_room(argument):
+            return
+        if game.state == GameState.ROOM_SELECTION and not game.reroll_rooms():
+            _close_door(game)
+    elif kind == PASS:
+        _close_door(game)
+    else:
+        target = game.manor.get_adjacent_position(game.player.position, argument)
+        if target is not None and game.manor.get_room(*target) is None:
+            game.selected_direction = argument
+            game.generate_room_selection()
+            if not game.pending_room_selection:
+                game.selected_direction = None
+        else:
+            game.try_move(argument)
+
+
+def policy_action(game: 'Game', policy: Policy) -> Optional[Action]:
+    """Coup choisi par une politique (None = plus aucun coup)"""
+    if game.state == GameState.ROOM_INTERACTION:
+        obj = game.room_objects[game.selected_object_index]
+        return (TAKE, None) if policy.take_object(game, obj) else (SKIP, None)
+    if game.state == GameState.ROOM_SELECTION:
+        index = policy.choose_room(game)
+        return (REROLL, None) if index is None else (ROOM, index)
+    direction = policy.choose_direction(game)
+    return None if direction is None else (DIRECTION, direction)
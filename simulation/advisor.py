@@ -0,0 +1,220 @@
+"""
+Conseiller pour le choix parmi les pièces proposées (generate_room_selection)
+Recherche "anytime" par approfondissement itératif: la profondeur 0 évalue
+chaque pièce juste après son placement, chaque profondeur suivante prolonge
+les simulations de LEVEL_ACTIONS actions de la politique gloutonne (tirages
+futurs pris dans le catalogue restant). La meilleure réponse de la dernière
+profondeur terminée est disponible à tout moment.
+Les simulations utilisent d'autres graines que la partie (GameRandom.reseed_streams):
+le conseiller ne lit pas les vrais tirages à venir. Les mêmes graines servent
+pour toutes les pièces (nombres aléatoires communs).
+La recherche peut être poursuivie sur plusieurs images de l'interface
+(AdvisorSearch.run avec un petit budget à chaque image). La profondeur 0
+(quelques placements, sans actions simulées) est toujours terminée: il y a
+une réponse dès le premier appel. Au-delà, une simulation s'arrête à
+l'échéance et est reprise au prochain appel.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from core.game_objects import GameObject, InteractiveObject
+from core.item_rules import ITEM_RULES, LOOT_RULES, RESOURCE, FOOD, PERMANENT
+from game1.events import NullSink
+from game1.game import GameState
+from simulation.policies import GreedyPolicy, Policy
+from simulation.runner import drive_game
+
+if TYPE_CHECKING:
+    from game1.game import Game
+
+DEFAULT_BUDGET = 0.015   # Secondes par décision
+LEVEL_ACTIONS = 6        # Actions simulées par niveau de profondeur
+MAX_DEPTH = 8
+MAX_ITERATIONS = 24      # Au-delà, la recherche est terminée (plus de calcul inutile)
+SAMPLES = 2              # Simulations par pièce et par profondeur (profondeur 0: une seule)
+
+# Valeur des ressources en pas (ordre de Inventory.counts: pas, or, gemmes, clés, dés)
+RESOURCE_VALUES = (1.0, 0.1, 3.0, 2.0, 2.0)
+PERMANENT_VALUE = 5.0
+WIN_VALUE = 1000.0
+LOSS_VALUE = -1000.0
+
+
+class Advice(NamedTuple):
+    """Réponse du conseiller"""
+    best: Optional[int]                      # Index conseillé dans pending_room_selection
+    scores: Tuple[Optional[float], ...]      # Score par pièce proposée (None = inabordable)
+    depth: int                               # Dernière profondeur terminée (-1 = aucune)
+    rollouts: int                            # Simulations jouées
+    elapsed: float                           # Temps de recherche cumulé (s)
+
+
+def object_value(obj: GameObject, rules=ITEM_RULES) -> float:
+    """Valeur (en pas) d'un objet encore à ramasser (contenu d'un contenant: LOOT_RULES)"""
+    if isinstance(obj, InteractiveObject):
+        return sum(object_value(item, LOOT_RULES) for item in obj.contents)
+    rule = rules.get(obj.kind)
+    if rule is None:
+        return 0.0
+    if rule.action == RESOURCE:
+        return RESOURCE_VALUES[rule.resource] * obj.quantity
+    if rule.action == FOOD:
+        return float(obj.steps_restored)
+    if rule.action == PERMANENT:
+        return PERMANENT_VALUE
+    return 0.0
+
+
+def evaluate(game: 'Game') -> float:
+    """
+    Valeur d'une position: marge de pas sur la distance minimale jusqu'à
+    l'Antechamber, plus la valeur des ressources et des objets en main
+    """
+    inventory = game.player.inventory
+    if game.state == GameState.GAME_WON:
+        return WIN_VALUE + inventory.steps.quantity
+    if game.state == GameState.GAME_OVER or not game.player.is_alive():
+        return LOSS_VALUE
+    distance = game.goal_distance()
+    if distance is None:
+        return LOSS_VALUE
+    value = sum(weight * count for weight, count in zip(RESOURCE_VALUES, inventory.counts)) - distance
+    value += PERMANENT_VALUE * bin(inventory.permanent_mask).count("1")
+    if game.state == GameState.ROOM_INTERACTION:
+        value += sum(object_value(obj) for obj in game.room_objects)
+    return value
+
+
+class AdvisorSearch:
+    """Recherche en cours pour une offre de pièces (reprise à chaque appel de run)"""
+
+    def __init__(self, game: 'Game', policy_factory: Callable[[], Policy] = GreedyPolicy, seed: int = 0,
+                 max_depth: int = MAX_DEPTH, samples: int = SAMPLES):
+        self.game = game
+        self.policy = policy_factory()
+        self.max_depth = max_depth
+        self.samples = samples
+        self.key = game.state_hash()
+        self.snapshot = game.snapshot()
+        self.options = [i for i, room in enumerate(game.pending_room_selection)
+                        if game.player.can_afford_room(room.gem_cost)]
+        self.rollouts = 0
+        self.iterations = 0
+        self.elapsed = 0.0
+        self._rng = random.Random(seed)
+        self._depth = 0
+        self._queue: List[Tuple[int, int]] = []             # (graine, pièce) de l'itération en cours
+        self._values: Dict[int, List[float]] = {}           # pièce -> valeurs de l'itération en cours
+        self._totals: Dict[int, List[float]] = {}           # pièce -> valeurs de la profondeur retenue
+        self._scored_depth = -1
+
+    @property
+    def finished(self) -> bool:
+        return len(self.options) <= 1 or self.iterations >= MAX_ITERATIONS
+
+    def is_current(self) -> bool:
+        """La partie est-elle toujours devant la même offre?"""
+        return self.game.state == GameState.ROOM_SELECTION and self.game.state_hash() == self.key
+
+    def _start_iteration(self) -> None:
+        count = 1 if self._depth == 0 else self.samples
+        seeds = [self._rng.getrandbits(32) for _ in range(count)]
+        self._queue = [(seed, option) for seed in seeds for option in self.options]
+        self._queue.reverse()
+        self._values = {option: [] for option in self.options}
+
+    def _end_iteration(self) -> None:
+        """Itération terminée: ses valeurs remplacent (ou complètent, à profondeur égale) les scores"""
+        if self._depth != self._scored_depth:
+            self._totals = {option: [] for option in self.options}
+            self._scored_depth = self._depth
+        for option, values in self._values.items():
+            self._totals[option].extend(values)
+        self.iterations += 1
+        self._depth = min(self._depth + 1, self.max_depth)
+
+    def _rollout(self, seed: int, option: int, deadline: Optional[float]) -> Optional[float]:
+        """Valeur d'une simulation (None: interrompue par l'échéance)"""
+        game = self.game
+        game.restore(self.snapshot)
+        game.rng.reseed_streams(seed)
+        if not game.select_room(option):
+            return LOSS_VALUE
+        if self._depth:
+            max_actions = self._depth * LEVEL_ACTIONS
+            actions = drive_game(game, self.policy, max_actions=max_actions, deadline=deadline)
+            if actions < max_actions and not game.is_game_over() and time.perf_counter() >= deadline:
+                return None
+        return evaluate(game)
+
+    def _advance(self, deadline: Optional[float] = None) -> bool:
+        """Joue la simulation suivante; False si l'échéance l'a interrompue (reprise au prochain appel)"""
+        if not self._queue:
+            self._start_iteration()
+        seed, option = self._queue[-1]
+        value = self._rollout(seed, option, deadline)
+        if value is None:
+            return False
+        self._queue.pop()
+        self._values[option].append(value)
+        self.rollouts += 1
+        if not self._queue:
+            self._end_iteration()
+        return True
+
+    def run(self, budget: float) -> Advice:
+        """Poursuit la recherche pendant budget secondes au plus, puis rend la meilleure réponse"""
+        start = time.perf_counter()
+        deadline = start + budget
+        if self.finished or not self.is_current():
+            return self.advice()
+        game = self.game
+        previous_sink = game.set_event_sink(NullSink())
+        try:
+            # Profondeur 0 (un placement par pièce): toujours terminée, même budget épuisé
+            while self._scored_depth < 0 and not self.finished:
+                self._advance()
+            while not self.finished and time.perf_counter() < deadline:
+                if not self._advance(deadline):
+                    break
+        finally:
+            game.restore(self.snapshot)
+            game.set_event_sink(previous_sink)
+            self.elapsed += time.perf_counter() - start
+        return self.advice()
+
+    def advice(self) -> Advice:
+        scores: List[Optional[float]] = [None] * len(self.snapshot.pending_room_selection)
+        for option, values in self._totals.items():
+            scores[option] = sum(values) / len(values)
+        best = None
+        if self._totals:
+            best = max(self._totals, key=lambda option: scores[option])
+        elif len(self.options) == 1:
+            best = self.options[0]
+        return Advice(best, tuple(scores), self._scored_depth, self.rollouts, self.elapsed)
+
+
+class RoomAdvisor:
+    """Conseille une pièce parmi celles proposées, en un temps borné"""
+
+    def __init__(self, budget: float = DEFAULT_BUDGET, policy_factory: Callable[[], Policy] = GreedyPolicy,
+                 max_depth: int = MAX_DEPTH, samples: int = SAMPLES, seed: int = 0):
+        self.budget = budget
+        self.policy_factory = policy_factory
+        self.max_depth = max_depth
+        self.samples = samples
+        self.seed = seed
+
+    def start(self, game: 'Game') -> AdvisorSearch:
+        """Commence une recherche, à poursuivre par tranches (interface graphique)"""
+        return AdvisorSearch(game, self.policy_factory, self.seed, self.max_depth, self.samples)
+
+    def advise(self, game: 'Game', budget: Optional[float] = None) -> Advice:
+        """Recherche complète dans le budget (la partie est rendue intacte)"""
+        return self.start(game).run(self.budget if budget is None else budget)
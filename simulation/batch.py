@@ -0,0 +1,403 @@
+"""
+Simulateur par lots vectorisé (NumPy) - K parties indépendantes en parallèle
+Toutes les parties avancent d'un tour à la fois; l'état est stocké dans des
+tableaux (K, 9, 5) pour la grille et les portes, (K, 5) pour l'inventaire.
+
+Règles reprises de Game.select_room / Game.try_move:
+  - placer une pièce ou se déplacer coûte 1 pas
+  - une pièce rouge fait perdre 2-10 pas (placement et déplacement)
+  - une pièce violette rapporte 4-12 or au placement
+  - l'effet d'entrée (ex: Chapel +15 pas) s'applique lors d'un déplacement
+  - atteindre l'Antechamber fait gagner, pas <= 0 fait perdre
+Simplifications: les objets sont ramassés à l'entrée (outils d'abord), l'or
+attend la pelle et les coffrets verrouillés attendent le marteau.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from typing import Optional, Sequence
+
+import numpy as np
+
+from core import doors
+from core.doors import DOOR_NORTH, DOOR_EAST, DOOR_SOUTH, DOOR_WEST
+from core.game_objects import RoomColor, InteractiveObject, ItemKind
+from core.item_rules import ITEM_RULES, RESOURCE, FOOD, STEPS, GOLD, GEMS, KEYS, DICE
+from rooms.catalog import RoomCatalog, get_room_definitions
+from rooms.room import RoomDefinition
+
+# Bits de portes partagés avec le moteur objet (core.doors)
+NORTH, EAST, SOUTH, WEST = DOOR_NORTH, DOOR_EAST, DOOR_SOUTH, DOOR_WEST
+BITS = np.array([NORTH, EAST, SOUTH, WEST], dtype=np.uint8)
+OPPOSITE_BITS = np.array([SOUTH, WEST, NORTH, EAST], dtype=np.uint8)
+DELTA_ROW = np.array([-1, 0, 1, 0])
+DELTA_COL = np.array([0, 1, 0, -1])
+
+# ROTATION_TABLE[masque, quarts de tour] -> masque tourné (sens horaire)
+ROTATION_TABLE = np.array(doors.ROTATION_TABLE, dtype=np.uint8)
+DOOR_COUNT = np.array(doors.DOOR_COUNT, dtype=np.int32)
+
+# Colonnes de l'inventaire: STEPS..DICE, mêmes positions que Inventory.counts
+START_INVENTORY = (70, 0, 2, 0, 0)
+
+# Statut des parties
+ACTIVE, WON, LOST = 0, 1, 2
+
+EMPTY = -1
+
+
+def _loot_vector(objects) -> tuple:
+    """
+    Résume une liste d'objets ramassés par Game._add_to_inventory (même table ITEM_RULES):
+    (vecteur (5,) de ressources immédiates, or nécessitant la pelle, pelle, marteau)
+    """
+    loot = np.zeros(5, dtype=np.int32)
+    gold = 0
+    shovel = hammer = False
+    for obj in objects:
+        rule = ITEM_RULES.get(obj.kind)
+        if rule is None:
+            continue
+        if rule.action == RESOURCE:
+            if rule.requires is ItemKind.SHOVEL:
+                gold += obj.quantity
+            else:
+                loot[rule.resource] += obj.quantity
+        elif rule.action == FOOD:
+            loot[STEPS] += obj.steps_restored
+        elif obj.kind is ItemKind.SHOVEL:
+            shovel = True
+        elif obj.kind is ItemKind.HAMMER:
+            hammer = True
+    return loot, gold, shovel, hammer
+
+
+class CatalogTables:
+    """Tables NumPy du catalogue (une ligne par pièce), construites une fois"""
+
+    def __init__(self, definitions: Optional[Sequence[RoomDefinition]] = None):
+        rooms = definitions if definitions is not None else get_room_definitions()
+        names = [room.name for room in rooms]
+
+        self.names = names
+        self.size = len(rooms)
+        self.entrance = names.index("Entrance Hall")
+        self.antechamber = names.index("Antechamber")
+
+        # Masques de base (avant la rotation tirée par le catalogue)
+        self.base_mask = np.array([room.door_mask for room in rooms], dtype=np.uint8)
+        self.rotatable = np.array([room.name not in RoomCatalog.NO_ROTATION_ROOMS for room in rooms])
+        # Orientation choisie au placement: pas pour les impasses (rotation tirée conservée)
+        self.orientable = self.rotatable & (DOOR_COUNT[self.base_mask] > 1)
+        self.gem_cost = np.array([room.gem_cost for room in rooms], dtype=np.int32)
+        self.is_red = np.array([room.color == RoomColor.RED for room in rooms])
+        self.is_purple = np.array([room.color == RoomColor.PURPLE for room in rooms])
+        self.object_count = np.array([len(room.objects) for room in rooms], dtype=np.int32)
+
+        # Effet d'entrée sur les pas (ResourceEffect 'steps' appliqué par Room.enter)
+        self.enter_steps = np.array(
+            [room.effect.amount if getattr(room.effect, "resource_type", None) == "steps"
+             and getattr(room.effect, "on_enter_flag", False) else 0 for room in rooms], dtype=np.int32)
+
+        # Butin: objets visibles et contenu des coffrets verrouillés
+        self.loot = np.zeros((self.size, 5), dtype=np.int32)
+        self.gold = np.zeros(self.size, dtype=np.int32)
+        self.gives_shovel = np.zeros(self.size, dtype=bool)
+        self.gives_hammer = np.zeros(self.size, dtype=bool)
+        self.chest_loot = np.zeros((self.size, 5), dtype=np.int32)
+        self.chest_gold = np.zeros(self.size, dtype=np.int32)
+        self.has_chest = np.zeros(self.size, dtype=bool)
+        for i, room in enumerate(rooms):
+            visible = [obj for obj in room.objects if not isinstance(obj, InteractiveObject)]
+            chests = [obj for obj in room.objects if isinstance(obj, InteractiveObject)]
+            self.loot[i], self.gold[i], self.gives_shovel[i], self.gives_hammer[i] = _loot_vector(visible)
+            if chests:
+                contents = [item for chest in chests for item in chest.contents]
+                self.chest_loot[i], self.chest_gold[i], _, _ = _loot_vector(contents)
+                self.has_chest[i] = True
+
+
+_TABLES: Optional[CatalogTables] = None
+
+
+def get_tables() -> CatalogTables:
+    """Tables du catalogue partagées par tous les simulateurs du processus"""
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = CatalogTables()
+    return _TABLES
+
+
+class BatchSimulator:
+    """Fait avancer K parties en parallèle, un tour à la fois"""
+
+    def __init__(self, k: int, seed: int = 0, height: int = 9, width: int = 5,
+                 greedy: float = 1.0, tables: Optional[CatalogTables] = None):
+        """
+        k: nombre de parties simulées ensemble
+        greedy: poids de la distance à l'Antechamber dans le choix de direction (0 = aléatoire)
+        """
+        self.k = k
+        self.height = height
+        self.width = width
+        self.greedy = greedy
+        self.tables = tables if tables is not None else get_tables()
+        self.rng = np.random.default_rng(seed)
+        t = self.tables
+
+        self.grid = np.full((k, height, width), EMPTY, dtype=np.int16)
+        self.doors = np.zeros((k, height, width), dtype=np.uint8)
+        self.inventory = np.tile(np.array(START_INVENTORY, dtype=np.int32), (k, 1))
+        self.position = np.zeros((k, 2), dtype=np.int64)
+        self.used = np.zeros((k, t.size), dtype=bool)
+        self.shovel = np.zeros(k, dtype=bool)
+        self.hammer = np.zeros(k, dtype=bool)
+        self.cell_gold = np.zeros((k, height, width), dtype=np.int32)
+        self.cell_chest = np.full((k, height, width), EMPTY, dtype=np.int16)
+        # Portes laissées fermées (offre inabordable sans dé): plus de tirage par cette porte
+        self.closed = np.zeros((k, height, width), dtype=np.uint8)
+        self.status = np.zeros(k, dtype=np.int8)
+        self.turns = np.zeros(k, dtype=np.int32)
+        self.rooms_placed = np.zeros(k, dtype=np.int32)
+
+        # Rotation aléatoire de chaque pièce, propre à chaque partie (orientation préférée,
+        # remplacée au placement par la suivante dans le sens horaire si elle ne convient pas)
+        rotations = self.rng.integers(0, 4, size=(k, t.size))
+        rotations[:, ~t.rotatable] = 0
+        self.rotations = rotations
+        self.room_masks = ROTATION_TABLE[t.base_mask[None, :], rotations]
+
+        # Entrance Hall en bas au centre, Antechamber en haut au centre
+        games = np.arange(k)
+        start = (height - 1, width // 2)
+        self.goal = (0, width // 2)
+        self._put(games, t.entrance, start[0], start[1])
+        self._put(games, t.antechamber, self.goal[0], self.goal[1])
+        self.position[:] = start
+
+        # Portes interdites (donnant hors du manoir) pour chaque case
+        rows = np.arange(height)[:, None]
+        cols = np.arange(width)[None, :]
+        self.forbidden = ((rows == 0) * NORTH | (rows == height - 1) * SOUTH
+                          | (cols == 0) * WEST | (cols == width - 1) * EAST).astype(np.uint8)
+
+    def _put(self, games, room_ids, rows, cols) -> None:
+        """Place des pièces (tableaux alignés) et les marque comme utilisées"""
+        self.grid[games, rows, cols] = room_ids
+        self.doors[games, rows, cols] = self.room_masks[games, room_ids]
+        self.used[games, room_ids] = True
+
+    def active(self) -> np.ndarray:
+        """Indices des parties en cours"""
+        return np.flatnonzero(self.status == ACTIVE)
+
+    def step(self) -> int:
+        """Joue un tour pour toutes les parties actives. Retourne leur nombre."""
+        games = self.active()
+        if games.size == 0:
+            return 0
+        self.turns[games] += 1
+        rows, cols = self.position[games, 0], self.position[games, 1]
+        current = self.doors[games, rows, cols]
+
+        # Coups légaux dans les 4 directions
+        target_rows = rows[:, None] + DELTA_ROW[None, :]
+        target_cols = cols[:, None] + DELTA_COL[None, :]
+        inside = (target_rows >= 0) & (target_rows < self.height) & (target_cols >= 0) & (target_cols < self.width)
+        safe_rows = np.clip(target_rows, 0, self.height - 1)
+        safe_cols = np.clip(target_cols, 0, self.width - 1)
+        has_door = (current[:, None] & BITS[None, :]) != 0
+        open_door = (self.closed[games, rows, cols][:, None] & BITS[None, :]) == 0
+        occupied = self.grid[games[:, None], safe_rows, safe_cols] != EMPTY
+        facing = (self.doors[games[:, None], safe_rows, safe_cols] & OPPOSITE_BITS[None, :]) != 0
+        can_place = inside & has_door & open_door & ~occupied
+        can_move = inside & has_door & occupied & facing
+        legal = can_place | can_move
+
+        # Choix de la direction: aléatoire, biaisé vers l'Antechamber
+        distance = np.abs(target_rows - self.goal[0]) + np.abs(target_cols - self.goal[1])
+        score = self.rng.random(legal.shape) - self.greedy * distance
+        score[~legal] = -np.inf
+        choice = np.argmax(score, axis=1)
+        stuck = ~legal.any(axis=1)
+        self.status[games[stuck]] = LOST
+
+        pick = np.arange(games.size)
+        placing = ~stuck & can_place[pick, choice]
+        moving = ~stuck & can_move[pick, choice]
+        chosen_rows = target_rows[pick, choice]
+        chosen_cols = target_cols[pick, choice]
+
+        if moving.any():
+            self._move(games[moving], chosen_rows[moving], chosen_cols[moving])
+        if placing.any():
+            self._place(games[placing], choice[placing], chosen_rows[placing], chosen_cols[placing])
+        return games.size
+
+    def _spend_step(self, games: np.ndarray) -> np.ndarray:
+        """Dépense 1 pas; les parties sans pas sont perdues. Retourne le masque des survivantes."""
+        ok = self.inventory[games, STEPS] >= 1
+        self.status[games[~ok]] = LOST
+        self.inventory[games[ok], STEPS] -= 1
+        return ok
+
+    def _red_penalty(self, games: np.ndarray, room_ids: np.ndarray) -> None:
+        red = self.tables.is_red[room_ids]
+        if red.any():
+            self.inventory[games[red], STEPS] -= self.rng.integers(2, 11, size=int(red.sum()))
+
+    def _move(self, games, rows, cols) -> None:
+        """Déplacement vers une pièce déjà placée (Game.try_move)"""
+        ok = self._spend_step(games)
+        games, rows, cols = games[ok], rows[ok], cols[ok]
+        self.position[games, 0] = rows
+        self.position[games, 1] = cols
+        room_ids = self.grid[games, rows, cols].astype(np.int64)
+        self._red_penalty(games, room_ids)
+        self.inventory[games, STEPS] += self.tables.enter_steps[room_ids]
+        won = room_ids == self.tables.antechamber
+        self.status[games[won]] = WON
+        self._collect_pending(games[~won], rows[~won], cols[~won])
+        self._check_alive(games[~won])
+
+    def _walls(self, games, rows, cols) -> np.ndarray:
+        """Portes de la case visée qui buteraient contre une pièce voisine sans porte en face (Manor.wall_mask)"""
+        walls = np.zeros(games.size, dtype=np.uint8)
+        for k in range(4):
+            r, c = rows + DELTA_ROW[k], cols + DELTA_COL[k]
+            inside = (r >= 0) & (r < self.height) & (c >= 0) & (c < self.width)
+            r, c = np.clip(r, 0, self.height - 1), np.clip(c, 0, self.width - 1)
+            blocked = inside & (self.grid[games, r, c] != EMPTY) & ((self.doors[games, r, c] & OPPOSITE_BITS[k]) == 0)
+            walls |= np.where(blocked, BITS[k], 0).astype(np.uint8)
+        return walls
+
+    def _orient(self, games, required, forbidden, avoid) -> tuple:
+        """
+        Orientation de chaque pièce pour la case visée (RoomCatalog.orientation):
+        parmi celles qui conviennent, le moins de portes contre un mur voisin, puis
+        la rotation préférée ou la suivante dans le sens horaire
+        Retourne (masques orientés, pièce compatible dans l'une de ses orientations)
+        """
+        t = self.tables
+        masks = self.room_masks[games].copy()
+        best = np.full(masks.shape, 5, dtype=np.int32)
+        for step in range(4):
+            turned = ROTATION_TABLE[t.base_mask[None, :], (self.rotations[games] + step) % 4]
+            fits = ((turned & required) == required) & ((turned & forbidden) == 0)
+            if step:
+                fits &= t.orientable[None, :]
+            blocked = DOOR_COUNT[turned & avoid]
+            take = fits & (blocked < best)
+            masks[take] = turned[take]
+            best[take] = blocked[take]
+        return masks, best < 5
+
+    def _place(self, games, directions, rows, cols) -> None:
+        """Tirage de 3 pièces, choix et placement (generate_room_selection + select_room)"""
+        t = self.tables
+        required = OPPOSITE_BITS[directions][:, None]
+        forbidden = self.forbidden[rows, cols][:, None]
+        avoid = self._walls(games, rows, cols)[:, None]
+        unused = ~self.used[games]
+        masks, compatible = self._orient(games, required, forbidden, avoid)
+        compatible &= unused
+        # Comme le jeu: sans pièce compatible, on ignore la porte requise
+        fallback = ~compatible.any(axis=1)
+        if fallback.any():
+            free_masks, fits = self._orient(games[fallback], 0, forbidden[fallback], avoid[fallback])
+            masks[fallback] = free_masks
+            compatible[fallback] = fits & unused[fallback]
+
+        # Offre de 3 pièces uniformes parmi les compatibles (moins si le catalogue en a moins)
+        keys = self.rng.random(compatible.shape)
+        keys[~compatible] = -1.0
+        size = min(3, keys.shape[1])
+        offer = np.argpartition(-keys, size - 1, axis=1)[:, :size]
+        valid = np.take_along_axis(keys, offer, axis=1) >= 0
+        affordable = valid & (t.gem_cost[offer] <= self.inventory[games, GEMS][:, None])
+
+        # Choix glouton: portes + objets - 2 x coût en gemmes
+        value = DOOR_COUNT[np.take_along_axis(masks, offer, axis=1)] + t.object_count[offer] - 2 * t.gem_cost[offer]
+        value = np.where(affordable, value + self.rng.random(offer.shape), -np.inf)
+        best = np.argmax(value, axis=1)
+        chosen = offer[np.arange(games.size), best]
+        can_pay = affordable.any(axis=1)
+
+        # Offre inabordable: relance avec un dé si possible, sinon la porte reste fermée
+        # (simulation/actions._close_door) et n'est plus proposée
+        reroll = valid.any(axis=1) & ~can_pay & (self.inventory[games, DICE] > 0)
+        self.inventory[games[reroll], DICE] -= 1
+        shut = ~can_pay & ~reroll
+        if shut.any():
+            g = games[shut]
+            self.closed[g, self.position[g, 0], self.position[g, 1]] |= BITS[directions[shut]]
+
+        chosen_masks = masks[np.arange(games.size), chosen]
+        games, rows, cols, chosen = games[can_pay], rows[can_pay], cols[can_pay], chosen[can_pay]
+        self.room_masks[games, chosen] = chosen_masks[can_pay]
+        self.inventory[games, GEMS] -= t.gem_cost[chosen]
+        ok = self._spend_step(games)
+        games, rows, cols, chosen = games[ok], rows[ok], cols[ok], chosen[ok]
+
+        self._put(games, chosen, rows, cols)
+        self.rooms_placed[games] += 1
+        self.position[games, 0] = rows
+        self.position[games, 1] = cols
+        self._red_penalty(games, chosen)
+        purple = t.is_purple[chosen]
+        if purple.any():
+            self.inventory[games[purple], GOLD] += self.rng.integers(4, 13, size=int(purple.sum()))
+
+        # Ramassage des objets de la nouvelle pièce (outils d'abord)
+        self.shovel[games] |= t.gives_shovel[chosen]
+        self.hammer[games] |= t.gives_hammer[chosen]
+        self.inventory[games] += t.loot[chosen]
+        self.cell_gold[games, rows, cols] = t.gold[chosen]
+        self.cell_chest[games, rows, cols] = np.where(t.has_chest[chosen], chosen, EMPTY)
+        self._collect_pending(games, rows, cols)
+        self._check_alive(games)
+
+    def _collect_pending(self, games, rows, cols) -> None:
+        """Ouvre les coffrets (marteau) et ramasse l'or (pelle) restés dans la case"""
+        t = self.tables
+        chest = self.cell_chest[games, rows, cols]
+        opens = (chest != EMPTY) & self.hammer[games]
+        if opens.any():
+            g, r, c, ids = games[opens], rows[opens], cols[opens], chest[opens].astype(np.int64)
+            self.inventory[g] += t.chest_loot[ids]
+            self.cell_gold[g, r, c] += t.chest_gold[ids]
+            self.cell_chest[g, r, c] = EMPTY
+        digs = self.shovel[games]
+        if digs.any():
+            g, r, c = games[digs], rows[digs], cols[digs]
+            self.inventory[g, GOLD] += self.cell_gold[g, r, c]
+            self.cell_gold[g, r, c] = 0
+
+    def _check_alive(self, games) -> None:
+        """Game.is_game_over: plus de pas = défaite"""
+        dead = self.inventory[games, STEPS] <= 0
+        self.status[games[dead]] = LOST
+
+    def run(self, max_turns: int = 1000) -> 'BatchSimulator':
+        """Joue jusqu'à la fin de toutes les parties (ou max_turns tours)"""
+        for _ in range(max_turns):
+            if self.step() == 0:
+                break
+        self.status[self.status == ACTIVE] = LOST
+        return self
+
+    def summary(self) -> dict:
+        """Statistiques agrégées du lot"""
+        won = self.status == WON
+        return {
+            "games": self.k,
+            "wins": int(won.sum()),
+            "win_rate": float(won.mean()) if self.k else 0.0,
+            "turns": int(self.turns.sum()),
+            "steps_left": float(self.inventory[:, STEPS].mean()),
+            "rooms_placed": float(self.rooms_placed.mean()),
+            "gold": float(self.inventory[:, GOLD].mean()),
+            "gems": float(self.inventory[:, GEMS].mean()),
+            "keys": float(self.inventory[:, KEYS].mean()),
+        }
@@ -0,0 +1,268 @@
+"""
+Solveur exact de fin de partie (programmation dynamique mémoïsée)
+Valeur d'un état = probabilité de victoire en jouant au mieux, sans connaître
+les tirages à venir: maximum sur les coups (simulation/actions.py), espérance
+sur les tirages. Tous les tirages de la partie (offre de pièces, pertes de pas,
+or, dispersion) passent par randrange/randint/sample/choice, c'est-à-dire par
+Random._randbelow: le générateur ScriptedRandom rejoue un coup pour chaque
+suite de résultats possible (odomètre), avec sa probabilité exacte.
+Mémoïsation par hachage de Zobrist (Game.state_hash) dans une table bornée.
+Une offre sans pièce abordable ni dé referme la porte: rouvrir la même porte
+est un nouveau tirage indépendant, d'où Q = gains / (1 - p_refermée).
+À n'utiliser que lorsque l'espace d'états est petit (estimate_states).
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+import time
+from typing import Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from game1.events import NullSink
+from game1.game import GameState
+from simulation.actions import Action, DIRECTION, PASS, legal_actions, step
+from simulation.transposition import TranspositionTable
+
+if TYPE_CHECKING:
+    from game1.game import Game
+
+ENDGAME_STATES = 5_000       # Coups rejoués estimés en dessous desquels le solveur prend la main (~1 s)
+MAX_STATES = 200_000         # États évalués au plus par résolution (au-delà: abandon)
+SOLVE_TIME = 2.0             # Secondes au plus par résolution, par défaut (au-delà: abandon)
+TABLE_CAPACITY = 200_000     # Entrées mémoïsées au plus (mémoire bornée, éviction LRU)
+ROLL_OUTCOMES = 9            # Résultats du tirage à l'entrée d'une pièce rouge (2-10 pas) ou violette (4-12 or)
+MAX_DRAWS = 64               # Tirages au plus par coup (au-delà: boucle de rejet, non énumérable)
+
+
+class InexactDraw(Exception):
+    """Tirage continu (random()) rencontré: ses résultats ne peuvent pas être énumérés"""
+
+
+class StateLimit(Exception):
+    """Trop d'états évalués ou temps écoulé: la résolution est abandonnée"""
+
+
+class ScriptedRandom(random.Random):
+    """
+    Générateur dont les entiers sont imposés par un préfixe de choix; au-delà
+    du préfixe, il répond 0 et note chaque tirage (nombre de résultats possibles)
+    """
+
+    def __init__(self):
+        super().__init__(0)
+        self.prefix: List[int] = []
+        self.path: List[Tuple[int, int]] = []   # (choix, nombre de résultats) de chaque tirage
+        self.probability = 1.0
+
+    def start(self, prefix: List[int]) -> None:
+        self.prefix = prefix
+        self.path = []
+        self.probability = 1.0
+
+    def _randbelow(self, n: int) -> int:
+        position = len(self.path)
+        if position >= MAX_DRAWS:
+            raise InexactDraw("boucle de rejet")
+        choice = self.prefix[position] if position < len(self.prefix) else 0
+        self.path.append((choice, n))
+        self.probability /= n
+        return choice
+
+    def sample(self, population, k, *, counts=None) -> list:
+        """
+        Même loi que Random.sample, toujours par la méthode du réservoir: la
+        méthode par rejet de Random (grandes populations) répéterait le même choix
+        """
+        if counts is not None:
+            raise InexactDraw("sample(counts=...)")
+        pool = list(population)
+        n = len(pool)
+        if not 0 <= k <= n:
+            raise ValueError("Sample larger than population or is negative")
+        result = []
+        for i in range(k):
+            j = self._randbelow(n - i)
+            result.append(pool[j])
+            pool[j] = pool[n - i - 1]
+        return result
+
+    def random(self) -> float:
+        raise InexactDraw("random()")
+
+    def getrandbits(self, k: int) -> int:
+        raise InexactDraw("getrandbits()")
+
+    def next_prefix(self) -> Optional[List[int]]:
+        """Suite de résultats suivante (None: toutes les suites ont été jouées)"""
+        path = self.path
+        for i in range(len(path) - 1, -1, -1):
+            choice, n = path[i]
+            if choice + 1 < n:
+                return [c for c, _ in path[:i]] + [choice + 1]
+        return None
+
+
+class Solution(NamedTuple):
+    """Résultat exact pour l'état courant"""
+    value: float                      # Probabilité de victoire en jouant au mieux
+    action: Optional[Action]          # Coup optimal (None: aucun coup)
+    q_values: Dict[Action, float]     # Probabilité de victoire après chaque coup légal
+    states: int                       # États évalués pour cette résolution
+    elapsed: float
+
+
+def estimate_states(game: 'Game') -> float:
+    """
+    Ordre de grandeur (majorant) du nombre de coups que rejouera solve(), calé
+    sur des résolutions mesurées. Aucun pour une partie perdue d'avance; sinon
+    chaque porte entre pièces à portée, pour chaque nombre de pas restants, et,
+    pour chaque placement encore finançable, tous les tirages de chaque porte
+    vers une case libre à portée (offres ordonnées de 3 parmi les pièces
+    restantes, relances, pas perdus ou or gagné à l'entrée)
+    """
+    if game.state == GameState.PLAYING and game.is_hopeless():
+        return 0.0
+    inventory = game.player.inventory
+    steps = inventory.steps.quantity
+    manor = game.manor
+    # Pièces placées atteintes en au plus steps - 1 déplacements
+    depth = {game.player.position: 0}
+    queue = [game.player.position]
+    moves = doors = 0
+    for position in queue:
+        for _, target, free in manor.exits(position):
+            if free:
+                doors += 1
+                continue
+            moves += 1
+            if target not in depth and depth[position] + 1 < steps:
+                depth[target] = depth[position] + 1
+                queue.append(target)
+    navigation = (moves + 1) * (steps + 1)
+    if not doors:
+        return float(navigation)
+    unused = len(game.catalog.find_unused())
+    offers = math.perm(unused, min(3, unused)) * (inventory.dice.quantity + 1) * ROLL_OUTCOMES
+    placements = min(steps, unused)
+    try:
+        return navigation * float(doors * offers + 1) ** placements
+    except OverflowError:
+        return math.inf  # Grands manoirs: bien au-delà de tout seuil
+
+
+def is_endgame(game: 'Game', threshold: int = ENDGAME_STATES) -> bool:
+    """L'espace d'états estimé est-il assez petit pour une résolution exacte?"""
+    return estimate_states(game) <= threshold
+
+
+class EndgameSolver:
+    """Probabilité de victoire exacte et coup optimal (table conservée d'un appel à l'autre)"""
+
+    def __init__(self, max_states: int = MAX_STATES, capacity: int = TABLE_CAPACITY,
+                 time_limit: Optional[float] = SOLVE_TIME):
+        self.max_states = max_states
+        self.time_limit = time_limit
+        self.table = TranspositionTable(capacity)
+        self._draws = ScriptedRandom()
+        self._stack: set = set()
+        self._seed: Optional[int] = None
+        self._states = 0
+        self._deadline = math.inf
+        self.game: Optional['Game'] = None
+
+    def solve(self, game: 'Game', time_limit: Optional[float] = None) -> Optional[Solution]:
+        """
+        Résout l'état courant (la partie est rendue intacte)
+        time_limit: durée maximale en secondes (défaut: self.time_limit; None partout = sans limite)
+        None si l'espace d'états dépasse max_states, si le temps est écoulé
+        ou si un tirage n'est pas énumérable
+        """
+        start = time.perf_counter()
+        time_limit = self.time_limit if time_limit is None else time_limit
+        self._deadline = math.inf if time_limit is None else start + time_limit
+        if game.rng.seed != self._seed:
+            # Les pièces non tirées (rotations) dépendent de la partie: table propre à chaque partie
+            self.table.clear()
+            self._seed = game.rng.seed
+        self.game = game
+        self._states = 0
+        self._stack.clear()
+        snapshot = game.snapshot()
+        previous_sink = game.set_event_sink(NullSink())
+        streams = game.rng.override_streams(self._draws)
+        terminal = self._terminal_value(game)
+        q_values: Dict[Action, float] = {}
+        try:
+            if terminal is None:
+                self._stack.add(game.state_hash())
+                for action in legal_actions(game):
+                    q_values[action] = self._q_value(snapshot, action)
+        except (StateLimit, InexactDraw):
+            return None
+        finally:
+            game.rng.restore_streams(streams)
+            game.restore(snapshot)
+            game.set_event_sink(previous_sink)
+            self.game = None
+        best = max(q_values, key=q_values.get) if q_values else None
+        value = q_values[best] if best is not None else terminal or 0.0
+        return Solution(value, best, q_values, self._states, time.perf_counter() - start)
+
+    def _terminal_value(self, game: 'Game') -> Optional[float]:
+        """Valeur d'une partie finie ou perdue d'avance (None: à calculer)"""
+        if game.is_game_over():
+            return 1.0 if game.state == GameState.GAME_WON else 0.0
+        if game.state == GameState.PLAYING and game.is_hopeless():
+            return 0.0
+        return None
+
+    def _value(self) -> float:
+        """Valeur de l'état courant de la partie (mémoïsée)"""
+        game = self.game
+        terminal = self._terminal_value(game)
+        if terminal is not None:
+            return terminal
+        key = game.state_hash()
+        cached = self.table.get(key)
+        if cached is not None:
+            return cached
+        if key in self._stack:
+            return 0.0  # Retour à un état en cours d'évaluation: le détour n'apporte rien
+        self._states += 1
+        if self._states > self.max_states:
+            raise StateLimit(self._states)
+
+        self._stack.add(key)
+        snapshot = game.snapshot()
+        best = 0.0
+        for action in legal_actions(game):
+            best = max(best, self._q_value(snapshot, action))
+            if best >= 1.0:
+                break
+        self._stack.discard(key)
+        self.table.put(key, best)
+        return best
+
+    def _q_value(self, snapshot, action: Action) -> float:
+        """Espérance sur tous les tirages du coup joué depuis snapshot"""
+        game = self.game
+        draws = self._draws
+        total = 0.0
+        closed = 0.0  # Probabilité que la porte ouverte se referme (aucune pièce jouable)
+        prefix: Optional[List[int]] = []
+        while prefix is not None:
+            game.restore(snapshot)
+            game.rng.override_streams(draws)  # restore recrée les flux non encore utilisés
+            if time.perf_counter() > self._deadline:
+                raise StateLimit(self._states)
+            draws.start(prefix)
+            step(game, action)
+            probability = draws.probability
+            prefix = draws.next_prefix()
+            if action[0] == DIRECTION and legal_actions(game) == [(PASS, None)]:
+                closed += probability
+            else:
+                total += probability * self._value()
+        return total / (1.0 - closed) if closed < 1.0 else 0.0
@@ -0,0 +1,340 @@
+"""
+Joueur Monte Carlo Tree Search (UCT) pour Game
+Couvre tous les coups de simulation/actions.py: direction (W/A/D + ESPACE),
+choix de pièce, relance avec un dé, ramassage des objets.
+Chaque simulation repart de l'état réel (snapshot/restore) avec des flux
+aléatoires tirés à nouveau (GameRandom.reseed_streams): l'arbre ne connaît
+pas les vrais tirages à venir. Les nœuds sont indexés par suite de coups
+(arbre "open loop"); seuls les coups légaux dans la simulation en cours
+sont considérés. Fin de simulation: politique gloutonne via step().
+Parallélisation à la racine: plusieurs arbres indépendants (graines
+différentes) dans un pool de processus, puis somme des visites par coup.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+from game1.events import NullSink
+from game1.game import GameState
+from simulation.actions import Action, DIRECTION, ROOM, TAKE, legal_actions, step
+from simulation.endgame import ENDGAME_STATES, EndgameSolver, is_endgame
+from simulation.policies import GreedyPolicy, Policy
+from simulation.runner import drive_game
+
+if TYPE_CHECKING:
+    from game1.game import Game
+
+DEFAULT_PLAYOUTS = 200    # Simulations par arbre et par décision
+EXPLORATION = 0.7         # Constante d'exploration UCT (récompenses dans [0, 1])
+ROLLOUT_ACTIONS = 300     # Coups au plus par fin de simulation
+PROGRESS_WEIGHT = 0.2     # Récompense maximale d'une défaite (selon la distance restante)
+ENDGAME_SHARE = 0.5       # Part de time_limit accordée au solveur exact (le reste: MCTS en repli)
+
+
+class Node:
+    """Nœud de l'arbre: visites et somme des récompenses"""
+
+    __slots__ = ("children", "visits", "total")
+
+    def __init__(self):
+        self.children: Dict[Action, 'Node'] = {}
+        self.visits = 0
+        self.total = 0.0
+
+
+class MCTSResult(NamedTuple):
+    """Résultat d'une recherche (arbres fusionnés)"""
+    action: Optional[Action]          # Coup le plus visité (None = aucun coup)
+    visits: Dict[Action, int]         # Visites par coup à la racine
+    values: Dict[Action, float]       # Récompense moyenne par coup (fin de partie: probabilité exacte)
+    playouts: int                     # 0: coup du solveur exact
+    elapsed: float
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def reward(game: 'Game') -> float:
+    """1 pour une victoire; sinon, au plus PROGRESS_WEIGHT selon la distance parcourue vers l'Antechamber"""
+    if game.state == GameState.GAME_WON:
+        return 1.0
+    goal_row, goal_col = game.reachability.goal
+    row, col = game.player.position
+    farthest = (max(goal_row, game.manor.height - 1 - goal_row)
+                + max(goal_col, game.manor.width - 1 - goal_col))
+    remaining = abs(row - goal_row) + abs(col - goal_col)
+    return PROGRESS_WEIGHT * (1.0 - remaining / farthest)
+
+
+class MCTSTree:
+    """Un arbre UCT sur une position (les simulations remettent la partie en place)"""
+
+    def __init__(self, game: 'Game', seed: int = 0, exploration: float = EXPLORATION,
+                 rollout_policy: Callable[[], Policy] = GreedyPolicy):
+        self.game = game
+        self.snapshot = game.snapshot()
+        self.exploration = exploration
+        self.rollout_policy = rollout_policy()
+        self.root = Node()
+        self.playouts = 0
+        self._rng = random.Random(seed)
+
+    def _select(self, node: Node, actions: List[Action]) -> Action:
+        """UCB1 parmi les coups légaux (tous déjà essayés depuis ce nœud)"""
+        log_visits = math.log(node.visits)
+        exploration = self.exploration
+        best, best_score = None, -math.inf
+        for action in actions:
+            child = node.children[action]
+            score = child.total / child.visits + exploration * math.sqrt(log_visits / child.visits)
+            if score > best_score:
+                best, best_score = action, score
+        return best
+
+    def playout(self) -> None:
+        """Sélection, expansion d'un nœud, fin de partie gloutonne, rétropropagation"""
+        game = self.game
+        game.restore(self.snapshot)
+        game.rng.reseed_streams(self._rng.getrandbits(32))
+        node = self.root
+        path = [node]
+        while not game.is_game_over():
+            actions = legal_actions(game)
+            if not actions:
+                break
+            untried = [action for action in actions if action not in node.children]
+            if untried:
+                action = self._rng.choice(untried)
+                child = node.children[action] = Node()
+                path.append(child)
+                step(game, action)
+                break
+            action = self._select(node, actions)
+            node = node.children[action]
+            path.append(node)
+            step(game, action)
+        if not game.is_game_over():
+            drive_game(game, self.rollout_policy, ROLLOUT_ACTIONS)
+        value = reward(game)
+        for visited in path:
+            visited.visits += 1
+            visited.total += value
+        self.playouts += 1
+
+    def run(self, playouts: int = DEFAULT_PLAYOUTS, time_limit: Optional[float] = None,
+            rate: Optional[float] = None) -> 'MCTSTree':
+        """
+        Joue au plus playouts simulations, en au plus time_limit secondes.
+        rate: limite de simulations par seconde (None = au plus vite)
+        La partie est rendue dans son état de départ.
+        """
+        game = self.game
+        start = time.perf_counter()
+        previous_sink = game.set_event_sink(NullSink())
+        try:
+            for done in range(playouts):
+                elapsed = time.perf_counter() - start
+                if time_limit is not None and elapsed >= time_limit:
+                    break
+                if rate is not None and done > rate * elapsed:
+                    time.sleep(done / rate - elapsed)
+                self.playout()
+        finally:
+            game.restore(self.snapshot)
+            game.set_event_sink(previous_sink)
+        return self
+
+    def root_stats(self) -> Tuple[Dict[Action, int], Dict[Action, float], int]:
+        """Visites et sommes des récompenses par coup à la racine (à fusionner entre arbres)"""
+        children = self.root.children
+        return ({action: child.visits for action, child in children.items()},
+                {action: child.total for action, child in children.items()},
+                self.playouts)
+
+
+def _search_tree(game: 'Game', seed: int, playouts: int, time_limit: Optional[float],
+                 rate: Optional[float], exploration: float) -> Tuple[Dict[Action, int], Dict[Action, float], int]:
+    """Tâche exécutée dans un processus: un arbre indépendant sur une copie de la partie"""
+    return MCTSTree(game, seed, exploration).run(playouts, time_limit, rate).root_stats()
+
+
+def merge_results(results: List[Tuple[Dict[Action, int], Dict[Action, float], int]],
+                  elapsed: float) -> MCTSResult:
+    """Somme des statistiques racine de plusieurs arbres; coup le plus visité"""
+    visits: Dict[Action, int] = {}
+    totals: Dict[Action, float] = {}
+    playouts = 0
+    for tree_visits, tree_totals, tree_playouts in results:
+        for action, count in tree_visits.items():
+            visits[action] = visits.get(action, 0) + count
+            totals[action] = totals.get(action, 0.0) + tree_totals[action]
+        playouts += tree_playouts
+    values = {action: totals[action] / count for action, count in visits.items()}
+    best = max(visits, key=lambda action: (visits[action], values[action])) if visits else None
+    return MCTSResult(best, visits, values, playouts, elapsed)
+
+
+class MCTSAgent:
+    """
+    Recherche MCTS parallélisée à la racine
+    playouts: simulations par arbre; time_limit: durée maximale d'une recherche (s);
+    rate: simulations par seconde et par arbre au plus (None = sans limite);
+    workers: nombre d'arbres (1 = dans le processus, sans pool);
+    endgame_threshold: en fin de partie (espace d'états estimé sous ce seuil),
+    coup exact de EndgameSolver au lieu de la recherche (None = jamais); le
+    solveur dispose de ENDGAME_SHARE x time_limit, la recherche MCTS du reste
+    s'il n'a pas conclu à temps
+    """
+
+    def __init__(self, playouts: int = DEFAULT_PLAYOUTS, time_limit: Optional[float] = None,
+                 rate: Optional[float] = None, workers: int = 1, exploration: float = EXPLORATION,
+                 endgame_threshold: Optional[int] = ENDGAME_STATES):
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.rate = rate
+        self.workers = workers
+        self.exploration = exploration
+        self.endgame_threshold = endgame_threshold
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._solver: Optional[EndgameSolver] = None
+
+    def __getstate__(self):
+        # Le pool reste dans le processus qui l'a créé (agent envoyé aux processus de simulation)
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        state["_solver"] = None
+        return state
+
+    def solve_endgame(self, game: 'Game', time_limit: Optional[float]) -> Optional[MCTSResult]:
+        """Coup exact de EndgameSolver en fin de partie (None: pas une fin de partie, ou pas résolue à temps)"""
+        if self.endgame_threshold is None or not is_endgame(game, self.endgame_threshold):
+            return None
+        if self._solver is None:
+            self._solver = EndgameSolver()
+        solution = self._solver.solve(game, time_limit)
+        if solution is None:
+            return None
+        return MCTSResult(solution.action, {}, dict(solution.q_values), 0, solution.elapsed)
+
+    def start(self, game: 'Game', seed: int = 0) -> 'MCTSSearch':
+        """Commence une recherche dans le processus, à poursuivre par tranches (interface graphique)"""
+        return MCTSSearch(self, game, seed)
+
+    def search(self, game: 'Game', seed: int = 0) -> MCTSResult:
+        """Meilleur coup pour la position actuelle (la partie n'est pas modifiée)"""
+        start = time.perf_counter()
+        actions = legal_actions(game)
+        if len(actions) <= 1 or game.is_game_over():
+            return MCTSResult(actions[0] if actions else None, {}, {}, 0, time.perf_counter() - start)
+
+        time_limit = self.time_limit
+        exact = self.solve_endgame(game, None if time_limit is None else time_limit * ENDGAME_SHARE)
+        if exact is not None:
+            return exact._replace(elapsed=time.perf_counter() - start)
+        if time_limit is not None:
+            time_limit -= time.perf_counter() - start
+
+        args = (self.playouts, time_limit, self.rate, self.exploration)
+        if self.workers == 1:
+            results = [MCTSTree(game, seed, self.exploration).run(*args[:3]).root_stats()]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [self._executor.submit(_search_tree, game, seed + i, *args) for i in range(self.workers)]
+            results = [future.result() for future in futures]
+
+        return merge_results(results, time.perf_counter() - start)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class MCTSSearch:
+    """
+    Recherche en cours sur une position, un seul arbre dans le processus
+    (reprise à chaque appel de run): au plus agent.playouts simulations et
+    agent.time_limit secondes de calcul au total; en fin de partie, le solveur
+    exact est essayé d'abord, dans la tranche du premier appel
+    """
+
+    def __init__(self, agent: MCTSAgent, game: 'Game', seed: int = 0):
+        self.agent = agent
+        self.game = game
+        self.key = game.state_hash()
+        self.state = game.state
+        self.actions = legal_actions(game)
+        self.tree = MCTSTree(game, seed, agent.exploration)
+        self.elapsed = 0.0
+        self._exact: Optional[MCTSResult] = None
+        self._try_endgame = True
+
+    @property
+    def finished(self) -> bool:
+        agent = self.agent
+        return (len(self.actions) <= 1 or self._exact is not None
+                or self.tree.playouts >= agent.playouts
+                or (agent.time_limit is not None and self.elapsed >= agent.time_limit))
+
+    def is_current(self) -> bool:
+        """La partie est-elle toujours dans la position recherchée?"""
+        return self.game.state == self.state and self.game.state_hash() == self.key
+
+    def run(self, budget: float) -> MCTSResult:
+        """Poursuit la recherche pendant budget secondes au plus, puis rend le meilleur coup"""
+        if self.finished or not self.is_current():
+            return self.result()
+        start = time.perf_counter()
+        agent = self.agent
+        if agent.time_limit is not None:
+            budget = min(budget, agent.time_limit - self.elapsed)
+        if self._try_endgame:
+            self._try_endgame = False
+            self._exact = agent.solve_endgame(self.game, budget)
+        else:
+            self.tree.run(agent.playouts - self.tree.playouts, budget, agent.rate)
+        self.elapsed += time.perf_counter() - start
+        return self.result()
+
+    def result(self) -> MCTSResult:
+        if len(self.actions) <= 1:
+            return MCTSResult(self.actions[0] if self.actions else None, {}, {}, 0, self.elapsed)
+        if self._exact is not None:
+            return self._exact._replace(elapsed=self.elapsed)
+        return merge_results([self.tree.root_stats()], self.elapsed)
+
+
+class MCTSPolicy(Policy):
+    """Politique jouant le coup de MCTSAgent à chaque décision (banc d'essai de difficulté)"""
+
+    def __init__(self, playouts: int = DEFAULT_PLAYOUTS, workers: int = 1,
+                 time_limit: Optional[float] = None):
+        self.agent = MCTSAgent(playouts=playouts, time_limit=time_limit, workers=workers)
+        self.rng = random.Random()
+
+    def reset(self, game: 'Game') -> None:
+        self.rng = game.rng.stream("policy")
+
+    def _action(self, game: 'Game') -> Optional[Action]:
+        return self.agent.search(game, seed=self.rng.getrandbits(32)).action
+
+    def choose_direction(self, game: 'Game'):
+        action = self._action(game)
+        return action[1] if action is not None and action[0] == DIRECTION else None
+
+    def choose_room(self, game: 'Game') -> Optional[int]:
+        # Relance (ou porte fermée): None, drive_game enchaîne comme le coup REROLL
+        action = self._action(game)
+        return action[1] if action is not None and action[0] == ROOM else None
+
+    def take_object(self, game: 'Game', obj) -> bool:
+        action = self._action(game)
+        return action is not None and action[0] == TAKE
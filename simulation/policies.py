@@ -0,0 +1,128 @@
+"""
+Politiques de jeu automatiques pour les simulations
+Une politique choisit une direction, une pièce parmi pending_room_selection
+et les objets à ramasser.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+from core.game_objects import Direction, GameObject
+from core.doors import DOOR_COUNT
+
+if TYPE_CHECKING:
+    from game1.game import Game
+
+
+# Types de coups possibles depuis la pièce actuelle
+PLACE = "place"  # Ouvrir une porte vers une case vide (tirage de pièces)
+MOVE = "move"    # Se déplacer vers une pièce déjà placée
+
+
+def legal_directions(game: 'Game') -> List[Tuple[Direction, str]]:
+    """Retourne les directions jouables depuis la pièce actuelle avec le type de coup"""
+    return [(direction, PLACE if free else MOVE)
+            for direction, _, free in game.manor.exits(game.player.position)]
+
+
+class Policy(ABC):
+    """Classe abstraite pour une politique de jeu (doit être picklable)"""
+
+    def reset(self, game: 'Game') -> None:
+        """Appelé au début de chaque partie"""
+        pass
+
+    @abstractmethod
+    def choose_direction(self, game: 'Game') -> Optional[Direction]:
+        """Choisit la direction à jouer (None = plus aucun coup)"""
+        pass
+
+    @abstractmethod
+    def choose_room(self, game: 'Game') -> Optional[int]:
+        """Choisit l'index d'une pièce dans game.pending_room_selection"""
+        pass
+
+    def take_object(self, game: 'Game', obj: GameObject) -> bool:
+        """Décide si l'objet sélectionné doit être ramassé (tout par défaut)"""
+        return True
+
+
+class RandomPolicy(Policy):
+    """Joue au hasard parmi les coups légaux"""
+
+    def __init__(self):
+        self.rng = random.Random()
+
+    def reset(self, game: 'Game') -> None:
+        # Flux dérivé de la graine de la partie: parties reproductibles
+        self.rng = game.rng.stream("policy")
+
+    def choose_direction(self, game: 'Game') -> Optional[Direction]:
+        actions = legal_directions(game)
+        if not actions:
+            return None
+        return self.rng.choice(actions)[0]
+
+    def choose_room(self, game: 'Game') -> Optional[int]:
+        affordable = [i for i, room in enumerate(game.pending_room_selection)
+                      if game.player.can_afford_room(room.gem_cost)]
+        if not affordable:
+            return None
+        return self.rng.choice(affordable)
+
+
+class GreedyPolicy(Policy):
+    """Se rapproche de l'Antechamber et préfère les pièces gratuites et riches"""
+
+    def __init__(self, goal: Optional[Tuple[int, int]] = None):
+        """goal: case visée (None = Antechamber de la partie)"""
+        self.goal = goal
+        self.rng = random.Random()
+
+    def reset(self, game: 'Game') -> None:
+        self.rng = game.rng.stream("policy")
+
+    @staticmethod
+    def _distance(position: Tuple[int, int], goal: Tuple[int, int]) -> int:
+        return abs(position[0] - goal[0]) + abs(position[1] - goal[1])
+
+    def choose_direction(self, game: 'Game') -> Optional[Direction]:
+        actions = legal_directions(game)
+        if not actions:
+            return None
+
+        position = game.player.position
+        goal = self.goal if self.goal is not None else game.goal
+        best_score = None
+        best = []
+        for direction, kind in actions:
+            target = game.manor.get_adjacent_position(position, direction)
+            # Distance au but, puis préférence pour l'exploration
+            score = (self._distance(target, goal), 0 if kind == PLACE else 1)
+            if best_score is None or score < best_score:
+                best_score, best = score, [direction]
+            elif score == best_score:
+                best.append(direction)
+        return self.rng.choice(best)
+
+    def choose_room(self, game: 'Game') -> Optional[int]:
+        best_index = None
+        best_score = None
+        for i, room in enumerate(game.pending_room_selection):
+            if not game.player.can_afford_room(room.gem_cost):
+                continue
+            # Plus de portes et d'objets, moins de gemmes dépensées
+            score = DOOR_COUNT[room.door_mask] + len(room.objects) - 2 * room.gem_cost
+            if best_score is None or score > best_score:
+                best_index, best_score = i, score
+        return best_index
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "greedy": GreedyPolicy,
+}
@@ -0,0 +1,220 @@
+"""
+Simulation Monte Carlo - Parties complètes en parallèle sur un pool de processus
+Chaque tâche joue un paquet de graines; les résultats reviennent par paquets
+et sont agrégés au fil de l'eau (mémoire constante quel que soit N).
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from core.item_rules import STEPS
+from game1.game import Game, GameState
+from simulation.policies import Policy
+from simulation.actions import policy_action, step
+
+MAX_ACTIONS = 1000  # Sécurité: nombre maximal d'actions par partie
+
+
+class GameResult(NamedTuple):
+    """Résultat compact d'une partie simulée"""
+    seed: int
+    won: bool
+    steps_left: int
+    rooms_placed: int
+    gold: int
+    gems: int
+    keys: int
+    actions: int
+
+
+def drive_game(game: Game, policy: Policy, max_actions: int = MAX_ACTIONS, prune: bool = False,
+               deadline: Optional[float] = None) -> int:
+    """
+    Fait jouer la politique jusqu'à la fin de la partie.
+    prune: déclarer la partie perdue dès que la victoire est impossible
+    (pas restants et gains possibles inférieurs à la distance jusqu'à l'Antechamber),
+    testé seulement quand le nombre de pas a changé depuis le dernier test
+    deadline: instant (time.perf_counter) après lequel plus aucune action n'est jouée
+    Retourne le nombre d'actions jouées.
+    """
+    policy.reset(game)
+    actions = 0
+    checked_steps = None
+    while actions < max_actions and not game.is_game_over():
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if prune and game.state == GameState.PLAYING:
+            steps = game.player.inventory.counts[STEPS]
+            if steps != checked_steps:
+                checked_steps = steps
+                if game.is_hopeless():
+                    game.state = GameState.GAME_OVER
+                    break
+        actions += 1
+        action = policy_action(game, policy)
+        if action is None:
+            break  # Bloqué: plus aucun coup possible
+        step(game, action)
+    return actions
+
+
+def play_game(seed: int, policy: Policy, max_actions: int = MAX_ACTIONS, prune: bool = False) -> GameResult:
+    """Joue une partie headless complète pour une graine donnée"""
+    game = Game(headless=True, seed=seed)
+    actions = drive_game(game, policy, max_actions, prune)
+    inventory = game.player.inventory
+    placed = len(game.manor.rooms)
+    return GameResult(
+        seed=seed,
+        won=game.state == GameState.GAME_WON,
+        steps_left=inventory.steps.quantity,
+        rooms_placed=placed - 2,  # Sans l'Entrance Hall et l'Antechamber
+        gold=inventory.gold.quantity,
+        gems=inventory.gems.quantity,
+        keys=inventory.keys.quantity,
+        actions=actions,
+    )
+
+
+def _play_chunk(seeds: range, policy: Policy, max_actions: int, prune: bool = False) -> List[GameResult]:
+    """Tâche exécutée dans un processus: joue un paquet de graines"""
+    return [play_game(seed, policy, max_actions, prune) for seed in seeds]
+
+
+class RunningStat:
+    """Moyenne, variance (Welford), min et max calculés au fil de l'eau"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, other: 'RunningStat') -> None:
+        """Fusionne une autre statistique (algorithme parallèle de Chan)"""
+        if other.count == 0:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class SimulationStats:
+    """Agrégation incrémentale des résultats de parties"""
+
+    FIELDS = ("steps_left", "rooms_placed", "gold", "gems", "keys", "actions")
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        self.stats = {field: RunningStat() for field in self.FIELDS}
+
+    def add(self, result: GameResult) -> None:
+        self.games += 1
+        self.wins += result.won
+        for field in self.FIELDS:
+            self.stats[field].add(getattr(result, field))
+
+    def merge(self, other: 'SimulationStats') -> None:
+        self.games += other.games
+        self.wins += other.wins
+        for field in self.FIELDS:
+            self.stats[field].merge(other.stats[field])
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    def summary(self) -> dict:
+        """Résumé sous forme de dictionnaire"""
+        result = {"games": self.games, "wins": self.wins, "win_rate": self.win_rate}
+        for field, stat in self.stats.items():
+            result[field] = {"mean": stat.mean, "std": stat.stddev, "min": stat.min, "max": stat.max}
+        return result
+
+    def __str__(self):
+        lines = [f"Parties: {self.games}  Victoires: {self.wins} ({self.win_rate:.2%})"]
+        for field, stat in self.stats.items():
+            lines.append(f"  {field:<13} moyenne {stat.mean:8.2f}  écart-type {stat.stddev:7.2f}"
+                         f"  min {stat.min:5g}  max {stat.max:5g}")
+        return "\n".join(lines)
+
+
+def _chunks(n_games: int, base_seed: int, chunk_size: int) -> Iterable[range]:
+    """Découpe les graines en paquets contigus"""
+    for start in range(base_seed, base_seed + n_games, chunk_size):
+        yield range(start, min(start + chunk_size, base_seed + n_games))
+
+
+def run_simulations(
+        n_games: int,
+        policy: Policy,
+        workers: Optional[int] = None,
+        chunk_size: int = 200,
+        base_seed: int = 0,
+        max_actions: int = MAX_ACTIONS,
+        prune: bool = False,
+        on_chunk: Optional[Callable[[List[GameResult], SimulationStats], None]] = None
+) -> SimulationStats:
+    """
+    Joue n_games parties (graines base_seed .. base_seed + n_games - 1).
+    workers: nombre de processus (None = tous les cœurs, 1 = sans pool)
+    chunk_size: nombre de parties par tâche
+    prune: arrêter les parties perdues d'avance (mêmes victoires, moins d'actions; seuil
+    de pas calculé une fois par placement et par case, testé quand les pas changent)
+    on_chunk: rappel optionnel à chaque paquet reçu (résultats, stats courantes)
+    """
+    stats = SimulationStats()
+    chunks = _chunks(n_games, base_seed, chunk_size)
+
+    def consume(results: List[GameResult]) -> None:
+        for result in results:
+            stats.add(result)
+        if on_chunk:
+            on_chunk(results, stats)
+
+    if workers == 1:
+        for seeds in chunks:
+            consume(_play_chunk(seeds, policy, max_actions, prune))
+        return stats
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Nombre borné de tâches en vol: la mémoire reste constante
+        max_in_flight = 2 * workers
+        pending = set()
+        for seeds in chunks:
+            pending.add(executor.submit(_play_chunk, seeds, policy, max_actions, prune))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    consume(future.result())
+        for future in as_completed(pending):
+            consume(future.result())
+    return stats
@@ -0,0 +1,60 @@
+"""
+Table de transposition bornée pour les recherches (conseillers, solveurs)
+Clé: Game.state_hash() (Zobrist). Plusieurs ordres d'actions menant au même
+état partagent la même entrée: l'état n'est évalué qu'une fois.
+Quand la table est pleine, l'entrée utilisée le moins récemment est évincée.
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TranspositionTable:
+    """Dictionnaire borné avec éviction LRU et compteurs de succès"""
+
+    def __init__(self, capacity: int = 100_000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Valeur associée à l'état (marquée comme récemment utilisée)"""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Enregistre (ou remplace) la valeur d'un état, en évinçant au besoin la plus ancienne"""
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+        entries[key] = value
+        if len(entries) > self.capacity:
+            entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self):
+        return (f"TranspositionTable({len(self)}/{self.capacity}, "
+                f"hits={self.hits}, misses={self.misses}, evictions={self.evictions})")
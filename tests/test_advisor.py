@@ -0,0 +1,41 @@
+"""
+Conseiller de pièce "anytime" (simulation/advisor.py)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game1.game import Game, GameState
+from simulation.actions import policy_action, step
+from simulation.advisor import RoomAdvisor
+from simulation.policies import GreedyPolicy
+
+
+def room_selections(seed: int):
+    """Parties gloutonnes: chaque offre de pièces rencontrée"""
+    game = Game(headless=True, seed=seed)
+    policy = GreedyPolicy()
+    policy.reset(game)
+    while not game.is_game_over():
+        if game.state == GameState.ROOM_SELECTION:
+            yield game
+        action = policy_action(game, policy)
+        if action is None:
+            return
+        step(game, action)
+
+
+def test_advice_without_budget_still_ranks_offer():
+    checked = 0
+    for seed in range(3):
+        for game in room_selections(seed):
+            key = game.state_hash()
+            options = [i for i, room in enumerate(game.pending_room_selection)
+                       if game.player.can_afford_room(room.gem_cost)]
+            advice = RoomAdvisor(budget=0.0).advise(game)
+            assert game.state_hash() == key
+            if len(options) > 1:
+                assert advice.depth == 0
+                assert advice.best in options
+                checked += 1
+    assert checked > 0
@@ -0,0 +1,30 @@
+"""
+Simulateur vectorisé (simulation/batch.py): catalogues réduits
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rooms.catalog import get_room_definitions
+from simulation.batch import BatchSimulator, CatalogTables, GEMS, LOST
+
+
+def small_tables(*names):
+    return CatalogTables([d for d in get_room_definitions() if d.name in names])
+
+
+def test_empty_offer_closes_the_door():
+    # Moins de 3 pièces au catalogue, aucune à proposer: chaque porte est fermée, puis la partie bloquée
+    sim = BatchSimulator(8, seed=2, tables=small_tables("Entrance Hall", "Antechamber")).run(50)
+    assert (sim.status == LOST).all()
+    assert (sim.turns < 50).all()
+    assert (sim.rooms_placed == 0).all()
+
+
+def test_unaffordable_offer_without_dice_is_not_retried():
+    sim = BatchSimulator(8, seed=3, tables=small_tables("Entrance Hall", "Antechamber", "The Armory"))
+    sim.inventory[:, GEMS] = 0
+    sim.run(50)
+    assert (sim.status == LOST).all()
+    assert (sim.turns < 50).all()
+    assert (sim.closed != 0).any()
@@ -0,0 +1,46 @@
+"""
+BitboardManor interchangeable avec Manor (game1/bitboard.py)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.game_objects import Direction
+from game1.game import Game
+from simulation.actions import legal_actions, policy_action, step
+from simulation.policies import GreedyPolicy, RandomPolicy
+
+
+def views(game: Game) -> tuple:
+    """Requêtes du moteur sur le manoir depuis la position du joueur"""
+    manor, position = game.manor, game.player.position
+    return (legal_actions(game), manor.frontier(), manor.exits(position), manor.free_neighbours(position),
+            manor.reachable_cells(position), manor.reachable_cells(position, unlocked_only=True),
+            [manor.can_move_to(position, direction) for direction in Direction])
+
+
+def final_state(game: Game) -> tuple:
+    return (game.state, game.state_hash(), game.player.position, tuple(game.player.inventory.counts),
+            game.manor.zobrist, tuple((position, room.name) for position, room in game.manor.rooms.items()))
+
+
+@pytest.mark.parametrize("policy_class", [RandomPolicy, GreedyPolicy])
+@pytest.mark.parametrize("seed", range(8))
+def test_bitboard_matches_manor(policy_class, seed):
+    plain, bits = Game(headless=True, seed=seed), Game(headless=True, seed=seed, bitboard=True)
+    policy = policy_class()
+    policy.reset(plain)
+    for _ in range(400):
+        assert views(bits) == views(plain)
+        over = plain.is_game_over()
+        assert bits.is_game_over() == over
+        if over:
+            break
+        action = policy_action(plain, policy)
+        if action is None:
+            break
+        step(plain, action)
+        step(bits, action)
+    assert final_state(bits) == final_state(plain)
@@ -0,0 +1,113 @@
+"""
+Probabilités exactes des offres (rooms/draw_odds.py) contre les fréquences observées
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from collections import Counter
+
+from core.doors import DOOR_EAST, DOOR_SOUTH
+from core.game_objects import RoomColor
+from game1.rng import GameRandom
+from rooms.catalog import RoomCatalog
+from rooms.draw_odds import DrawOdds
+
+DRAWS = 20_000
+TOLERANCE = 0.015  # Plus de 4 écarts-types pour une probabilité de 0.5 sur DRAWS tirages
+
+
+def frequencies(offers) -> tuple:
+    """Fréquences (par nom, par couleur présente, par forme présente) sur une suite d'offres"""
+    names, colors, shapes = Counter(), Counter(), Counter()
+    for rooms in offers:
+        names.update(room.name for room in rooms)
+        colors.update({room.color for room in rooms})
+        shapes.update({room.door_mask for room in rooms})
+    return ({key: n / DRAWS for key, n in names.items()}, {key: n / DRAWS for key, n in colors.items()},
+            {key: n / DRAWS for key, n in shapes.items()})
+
+
+def assert_close(expected: dict, observed: dict) -> None:
+    for key in set(expected) | set(observed):
+        assert abs(expected.get(key, 0.0) - observed.get(key, 0.0)) < TOLERANCE, key
+
+
+def test_uniform_offer_matches_sample_unused():
+    catalog = RoomCatalog(GameRandom(7))
+    odds = DrawOdds(catalog).offer(DOOR_SOUTH, DOOR_EAST, avoid_mask=0)
+    assert odds.size == 3
+    names, colors, shapes = frequencies(catalog.sample_unused(DOOR_SOUTH, DOOR_EAST) for _ in range(DRAWS))
+    assert_close(odds.rooms, names)
+    assert_close(odds.colors, colors)
+    assert_close(odds.door_masks, shapes)
+
+
+def test_weighted_odds_match_draw_rooms():
+    catalog = RoomCatalog(GameRandom(11))
+    catalog.set_color_multiplier(RoomColor.GREEN, 3.0)
+    position = (4, 2)
+    odds = DrawOdds(catalog).weighted(position)
+    names, colors, _ = frequencies(catalog.draw_rooms(3, position) for _ in range(DRAWS))
+    assert_close(odds.rooms, names)
+    assert_close(odds.colors, colors)
+
+
+def test_cache_follows_pool_and_modifiers():
+    catalog = RoomCatalog(GameRandom(3))
+    odds = DrawOdds(catalog)
+    offer, weighted = odds.offer(DOOR_SOUTH), odds.weighted((4, 2))
+
+    # Tirages et instanciations: le catalogue ne change pas, le cache non plus
+    catalog.sample_unused(DOOR_SOUTH)
+    catalog.draw_rooms(3, (4, 2))
+    assert odds.offer(DOOR_SOUTH) is offer
+    assert odds.weighted((4, 2)) is weighted
+
+    # Modificateurs de couleur: seul le tirage pondéré change
+    catalog.set_color_multiplier(RoomColor.RED, 0.5)
+    assert odds.offer(DOOR_SOUTH) is offer
+    changed = odds.weighted((4, 2))
+    assert changed is not weighted and changed.rooms != weighted.rooms
+    assert odds.weighted((4, 2)) is changed
+
+    # Pièce utilisée: tout est recalculé
+    room = catalog.sample_unused(DOOR_SOUTH)[0]
+    catalog.mark_used(room)
+    after = odds.offer(DOOR_SOUTH)
+    assert after is not offer and room.name not in after.rooms
+    assert odds.weighted((4, 2)) is not changed
+
+
+def test_zero_weights_fall_back_to_uniform_draw():
+    catalog = RoomCatalog(GameRandom(5))
+    for color in RoomColor:
+        catalog.set_color_multiplier(color, 0.0)
+    position = (4, 2)
+    odds = DrawOdds(catalog).weighted(position)
+    assert odds.size == 3
+    names, colors, _ = frequencies(catalog.draw_rooms(3, position) for _ in range(DRAWS))
+    assert_close(odds.rooms, names)
+    assert_close(odds.colors, colors)
+
+
+class Context:
+    """Objet portant des modificateurs, comme Game"""
+
+    def __init__(self, modifiers: dict):
+        self.probability_modifiers = modifiers
+
+
+def test_context_modifiers_apply_to_one_draw():
+    catalog = RoomCatalog(GameRandom(9))
+    position = (4, 2)
+    only_green = {color: 0.0 for color in RoomColor if color != RoomColor.GREEN}
+    for _ in range(50):
+        # Offre gratuite ajoutée si besoin: les pièces payantes tirées sont vertes
+        rooms = catalog.draw_rooms(3, position, Context(only_green))
+        assert all(room.color == RoomColor.GREEN for room in rooms[:-1])
+    assert catalog.color_multipliers == {}
+    # Un dict n'est pas un contexte de modificateurs (comportement d'origine)
+    names, _, _ = frequencies(catalog.draw_rooms(3, position, {'probability_modifiers': only_green})
+                              for _ in range(DRAWS))
+    assert_close(DrawOdds(catalog).weighted(position).rooms, names)
@@ -0,0 +1,38 @@
+"""
+Bascule automatique vers le solveur exact en fin de partie réelle
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game1.game import Game, GameState
+from simulation.actions import policy_action, step
+from simulation.endgame import EndgameSolver, estimate_states, is_endgame
+from simulation.policies import GreedyPolicy
+
+
+def play_until_steps(seed: int, steps: int) -> Game:
+    """Partie gloutonne jouée jusqu'à une décision de direction avec au plus steps pas"""
+    game = Game(headless=True, seed=seed)
+    policy = GreedyPolicy()
+    policy.reset(game)
+    while not game.is_game_over():
+        if game.state == GameState.PLAYING and game.player.inventory.steps.quantity <= steps:
+            return game
+        step(game, policy_action(game, policy))
+    raise AssertionError(f"partie {seed} terminée avant la fin de partie")
+
+
+def test_endgame_gate_fires_in_real_endgame():
+    for seed in range(5):
+        game = play_until_steps(seed, 1)
+        assert is_endgame(game), estimate_states(game)
+        assert EndgameSolver().solve(game, time_limit=5.0) is not None
+
+
+def test_solve_respects_time_limit():
+    game = play_until_steps(0, 4)
+    assert not is_endgame(game)
+    snapshot_hash = game.state_hash()
+    assert EndgameSolver().solve(game, time_limit=0.2) is None
+    assert game.state_hash() == snapshot_hash
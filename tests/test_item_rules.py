@@ -0,0 +1,40 @@
+"""
+Ramassage et butin des contenants (core/item_rules.py)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.item_rules import collect_item
+from game1.events import NullSink
+from game1.player import Player
+from items.consumables import Gold
+from items.food import Apple, Cake, Sandwich
+from items.interactive import LockedChest
+from items.permanent import Hammer
+
+
+def test_opened_chest_gives_baseline_loot():
+    player = Player(events=NullSink())
+    player.inventory.add_permanent_item(Hammer())
+    steps, gold = player.inventory.steps.quantity, player.inventory.gold.quantity
+    chest = LockedChest(contents=[Apple(), Sandwich(), Gold(10)])
+    assert chest.open(player)
+    # Aliments mangés (2 + 15 pas), or pris sans pelle
+    assert player.inventory.steps.quantity == steps + 17
+    assert player.inventory.gold.quantity == gold + 10
+    assert chest.contents == []
+    assert not chest.open(player)
+    assert player.inventory.steps.quantity == steps + 17
+
+
+def test_room_pickup_keeps_tool_and_food_rules():
+    player = Player(events=NullSink())
+    steps = player.inventory.steps.quantity
+    gold = Gold(10)
+    assert not collect_item(player, gold)
+    assert player.inventory.gold.quantity == 0
+    assert collect_item(player, Apple())
+    assert player.inventory.steps.quantity == steps
+    assert collect_item(player, Cake())
+    assert player.inventory.steps.quantity == steps + 10
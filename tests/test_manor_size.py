@@ -0,0 +1,63 @@
+"""
+Manoirs de taille quelconque et manoir creux (game1/manor.py, Game(size=..., sparse=...))
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from game1.bitboard import BitboardManor
+from game1.game import Game, GameState
+from game1.manor import SPARSE_CELLS
+from simulation.actions import policy_action, step
+from simulation.policies import GreedyPolicy, RandomPolicy
+from simulation.runner import drive_game
+
+
+@pytest.mark.parametrize("size", [(9, 5), (5, 3), (12, 8), (100, 100)])
+def test_start_and_goal_follow_size(size):
+    height, width = size
+    game = Game(headless=True, seed=1, size=size)
+    assert (game.manor.height, game.manor.width) == size
+    assert game.start == game.player.position == (height - 1, width // 2)
+    assert game.goal == (0, width // 2)
+    assert game.manor.get_room(*game.start).name == "Entrance Hall"
+    assert game.manor.get_room(*game.goal).name == "Antechamber"
+    assert game.manor.sparse == (height * width >= SPARSE_CELLS)
+
+
+@pytest.mark.parametrize("policy_class", [RandomPolicy, GreedyPolicy])
+def test_sparse_matches_dense_grid(policy_class):
+    for seed in range(10):
+        dense, sparse = Game(headless=True, seed=seed), Game(headless=True, seed=seed, sparse=True)
+        assert sparse.manor.sparse and not dense.manor.sparse
+        policy = policy_class()
+        policy.reset(dense)
+        while not dense.is_game_over():
+            action = policy_action(dense, policy)
+            if action is None:
+                break
+            step(dense, action)
+            step(sparse, action)
+            assert sparse.state_hash() == dense.state_hash(), seed
+        assert sparse.is_game_over() == dense.is_game_over()
+        assert ([(position, room.name, room.door_mask) for position, room in sparse.manor.rooms.items()]
+                == [(position, room.name, room.door_mask) for position, room in dense.manor.rooms.items()])
+
+
+@pytest.mark.parametrize("policy_class", [RandomPolicy, GreedyPolicy])
+def test_large_manor_game_completes(policy_class):
+    for seed in range(3):
+        game = Game(headless=True, seed=seed, size=(100, 100))
+        drive_game(game, policy_class())
+        assert game.state in (GameState.GAME_OVER, GameState.GAME_WON)
+        assert game.manor.zobrist == game.manor.recompute_zobrist()
+
+
+def test_bitboard_rejects_large_manor():
+    with pytest.raises(ValueError):
+        BitboardManor(width=100, height=100)
+    with pytest.raises(ValueError):
+        Game(headless=True, seed=0, size=(100, 100), bitboard=True)
+    assert Game(headless=True, seed=0, size=(20, 20), bitboard=True).manor.width == 20
@@ -0,0 +1,84 @@
+"""
+Orientation des pièces proposées (core/doors.fitting_rotation, Game.generate_room_selection)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.doors import (DIRECTION_BITS, DOOR_COUNT, DOOR_EAST, DOOR_NORTH, DOOR_SOUTH, DOOR_WEST,
+                        ROTATION_TABLE, border_mask, fitting_rotation)
+from game1.game import Game, GameState
+from simulation.actions import policy_action, step
+from simulation.policies import GreedyPolicy
+
+
+def test_fitting_rotation():
+    corner = DOOR_NORTH | DOOR_EAST
+    # Rotation préférée gardée si elle convient, sinon la suivante dans le sens horaire
+    assert fitting_rotation(corner, 0, DOOR_NORTH, 0) == 0
+    assert fitting_rotation(corner, 0, DOOR_SOUTH, 0) == 1
+    assert fitting_rotation(corner, 0, DOOR_SOUTH, DOOR_EAST) == 2
+    # Moins de portes contre un mur voisin, même loin de la rotation préférée
+    assert fitting_rotation(corner, 0, DOOR_SOUTH, 0, avoid=DOOR_EAST) == 2
+    # Aucune ne convient, ou pièce fixe: rotation préférée
+    assert fitting_rotation(DOOR_NORTH, 3, DOOR_NORTH, DOOR_NORTH) == 3
+    assert fitting_rotation(corner, 0, DOOR_SOUTH, 0, rotatable=False) == 0
+
+
+def offers(seeds):
+    """(partie, pièces proposées) à chaque offre de parties gloutonnes"""
+    for seed in seeds:
+        game = Game(headless=True, seed=seed)
+        policy = GreedyPolicy()
+        policy.reset(game)
+        while not game.is_game_over():
+            if game.state == GameState.ROOM_SELECTION:
+                yield game, game.pending_room_selection
+            action = policy_action(game, policy)
+            if action is None:
+                break
+            step(game, action)
+
+
+def test_offered_rooms_fit_the_target_cell():
+    checked = single = 0
+    for game, rooms in offers(range(20)):
+        catalog = game.catalog
+        names = [definition.name for definition in catalog.definitions]
+        required = DIRECTION_BITS[game.selected_direction.opposite()]
+        target = game.manor.get_adjacent_position(game.player.position, game.selected_direction)
+        forbidden = border_mask(*target, game.manor.height, game.manor.width)
+        avoid = game.manor.wall_mask(*target)
+        entry_required = len(catalog.find_unused(required)) > 0
+        for room in rooms:
+            index = names.index(room.name)
+            mask = room.door_mask
+            assert not mask & forbidden, room.name
+            if entry_required:
+                assert mask & required, room.name
+            if catalog.table.orientable[index]:
+                # Parmi les orientations qui conviennent, le moins de portes contre un mur
+                fitting = [rotated for rotated in ROTATION_TABLE[catalog.definitions[index].door_mask]
+                           if rotated & required == required and not rotated & forbidden]
+                assert DOOR_COUNT[mask & avoid] == min(DOOR_COUNT[rotated & avoid] for rotated in fitting)
+            else:
+                # Impasse (ou pièce fixe): rotation tirée en début de partie
+                assert mask == catalog.door_masks[index], room.name
+                single += DOOR_COUNT[mask] == 1
+            checked += 1
+    assert checked > 0 and single > 0
+
+
+def test_single_door_rooms_keep_drawn_rotation():
+    game = Game(headless=True, seed=0)
+    catalog = game.catalog
+    dead_ends = [i for i, definition in enumerate(catalog.definitions)
+                 if DOOR_COUNT[definition.door_mask] == 1 and not catalog.table.special[i]]
+    assert dead_ends
+    for index in dead_ends:
+        assert not catalog.table.orientable[index]
+        drawn = catalog.door_masks[index]
+        for required in (DOOR_NORTH, DOOR_EAST, DOOR_SOUTH, DOOR_WEST):
+            # Compatible avec une seule porte d'entrée: celle de sa rotation tirée
+            assert (index in catalog.find_unused(required)) == (required == drawn)
+            assert catalog.oriented_mask(index, required) == drawn
@@ -0,0 +1,23 @@
+"""
+Arrêt des parties perdues d'avance (drive_game(prune=True), StepBound)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from simulation.policies import GreedyPolicy, RandomPolicy
+from simulation.runner import play_game
+
+
+@pytest.mark.parametrize("policy_class", [RandomPolicy, GreedyPolicy])
+def test_prune_keeps_outcomes(policy_class):
+    pruned_games = 0
+    for seed in range(80):
+        full = play_game(seed, policy_class())
+        pruned = play_game(seed, policy_class(), prune=True)
+        assert pruned.won == full.won, seed
+        assert pruned.actions <= full.actions, seed
+        pruned_games += pruned.actions < full.actions
+    assert pruned_games > 0
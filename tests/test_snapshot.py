@@ -0,0 +1,71 @@
+"""
+Sauvegarde et restauration d'une partie (Game.snapshot / Game.restore)
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game1.game import Game
+from simulation.actions import policy_action, step
+from simulation.policies import RandomPolicy
+
+
+def fingerprint(game: Game) -> tuple:
+    """État observable complet: hachage, phase, inventaire, pièces placées et proposées, catalogue"""
+    return (game.state_hash(), game.state, game.player.position, tuple(game.player.inventory.counts),
+            game.player.inventory.permanent_mask,
+            tuple(sorted((position, room.name, room.door_mask, len(room.objects), room.visited)
+                         for position, room in game.manor.rooms.items())),
+            tuple((room.name, room.door_mask) for room in game.pending_room_selection),
+            tuple(sorted(game.used_room_names)))
+
+
+def play(game: Game, policy, actions: int) -> list:
+    """Joue au plus `actions` coups, retourne les coups joués"""
+    played = []
+    while len(played) < actions and not game.is_game_over():
+        action = policy_action(game, policy)
+        if action is None:
+            break
+        step(game, action)
+        played.append(action)
+    return played
+
+
+def replay(game: Game, actions: list) -> list:
+    """Rejoue des coups, retourne l'empreinte après chacun (fin de partie constatée comme dans play)"""
+    prints = []
+    for action in actions:
+        step(game, action)
+        game.is_game_over()
+        prints.append(fingerprint(game))
+    return prints
+
+
+def test_restore_round_trip():
+    for seed in range(10):
+        game = Game(headless=True, seed=seed)
+        policy = RandomPolicy()
+        policy.reset(game)
+        play(game, policy, 15)
+        saved, before = game.snapshot(), fingerprint(game)
+
+        actions = play(game, policy, 40)
+        game.restore(saved)
+        assert fingerprint(game) == before, seed
+
+        # Le même snapshot resert, et les mêmes coups redonnent la même suite d'états
+        first = replay(game, actions)
+        game.restore(saved)
+        assert fingerprint(game) == before, seed
+        assert replay(game, actions) == first, seed
+
+
+def test_same_seed_replays_identically():
+    for seed in range(10):
+        games = [Game(headless=True, seed=seed) for _ in range(2)]
+        policy = RandomPolicy()
+        policy.reset(games[0])
+        actions = play(games[0], policy, 200)
+        final = fingerprint(games[0])
+        assert replay(games[1], actions)[-1] == final, seed
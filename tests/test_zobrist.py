@@ -0,0 +1,54 @@
+"""
+Hachage de Zobrist incrémental (Manor.zobrist) et table de transposition
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from game1.game import Game
+from simulation.actions import policy_action, step
+from simulation.policies import GreedyPolicy, RandomPolicy
+from simulation.transposition import TranspositionTable
+
+
+@pytest.mark.parametrize("policy_class", [RandomPolicy, GreedyPolicy])
+def test_incremental_hash_matches_recompute(policy_class):
+    for seed in range(20):
+        game = Game(headless=True, seed=seed)
+        policy = policy_class()
+        policy.reset(game)
+        saved, saved_key = game.snapshot(), game.state_hash()
+        actions = 0
+        while not game.is_game_over() and actions < 300:
+            action = policy_action(game, policy)
+            if action is None:
+                break
+            step(game, action)
+            actions += 1
+            assert game.manor.zobrist == game.manor.recompute_zobrist(), (seed, actions)
+            if actions == 20:
+                saved, saved_key = game.snapshot(), game.state_hash()
+        game.restore(saved)
+        assert game.manor.zobrist == game.manor.recompute_zobrist(), seed
+        assert game.state_hash() == saved_key, seed
+
+
+def test_lru_eviction():
+    table = TranspositionTable(capacity=3)
+    for key in "abc":
+        table.put(key, key.upper())
+    assert table.get("a") == "A"      # "a" redevient la plus récente
+    table.put("d", "D")               # évince "b", la moins récemment utilisée
+    assert "b" not in table
+    assert [key in table for key in "acd"] == [True, True, True]
+    table.put("c", "C2")              # remplacement: pas d'éviction
+    table.put("e", "E")               # évince "a"
+    assert "a" not in table and table.get("c") == "C2"
+    assert len(table) == 3
+    assert table.evictions == 2
+    assert table.get("b") is None
+    assert (table.hits, table.misses) == (2, 1)
+    with pytest.raises(ValueError):
+        TranspositionTable(capacity=0)